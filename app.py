@@ -203,6 +203,9 @@ def run_scraper(keywords_df, locations_df, config, progress_callback=None):
         max_workers=config['max_workers'],
         scroll_pause_time=config['scroll_pause_time'],
         max_scroll_attempts=config['max_scroll_attempts'],
+        adaptive_rate_limit=config['adaptive_rate_limit'],
+        rate_limit_initial=config['rate_limit_initial'],
+        rate_limit_max=config['rate_limit_max'],
         min_delay=config['min_delay'],
         max_delay=config['max_delay'],
         csv_delimiter="|"
@@ -272,21 +275,48 @@ def main():
                 value=40
             )
             
-            min_delay = st.slider(
-                "Min Delay (seconds)",
-                min_value=0.5,
-                max_value=5.0,
-                value=1.0,
-                step=0.5
+            adaptive_rate_limit = st.checkbox(
+                "Adaptive Rate Limit",
+                value=True,
+                help="One shared request rate for all threads that slows down on blocks and timeouts"
             )
             
-            max_delay = st.slider(
-                "Max Delay (seconds)",
-                min_value=1.0,
-                max_value=10.0,
-                value=3.0,
-                step=0.5
-            )
+            # Defaults for whichever pacing mode is not in use
+            rate_limit_initial, rate_limit_max = 2.0, 5.0
+            min_delay, max_delay = 1.0, 3.0
+            
+            if adaptive_rate_limit:
+                rate_limit_initial = st.slider(
+                    "Starting Rate (page loads/second, all threads)",
+                    min_value=0.5,
+                    max_value=5.0,
+                    value=2.0,
+                    step=0.5
+                )
+                
+                rate_limit_max = st.slider(
+                    "Max Rate (page loads/second, all threads)",
+                    min_value=1.0,
+                    max_value=10.0,
+                    value=5.0,
+                    step=0.5
+                )
+            else:
+                min_delay = st.slider(
+                    "Min Delay per Thread (seconds)",
+                    min_value=0.5,
+                    max_value=5.0,
+                    value=1.0,
+                    step=0.5
+                )
+                
+                max_delay = st.slider(
+                    "Max Delay per Thread (seconds)",
+                    min_value=1.0,
+                    max_value=10.0,
+                    value=3.0,
+                    step=0.5
+                )
         
         st.markdown("---")
         st.markdown("#### 📖 Documentation")
@@ -437,6 +467,9 @@ def main():
                     'max_results_per_task': max_results_per_task,
                     'scroll_pause_time': scroll_pause_time,
                     'max_scroll_attempts': max_scroll_attempts,
+                    'adaptive_rate_limit': adaptive_rate_limit,
+                    'rate_limit_initial': rate_limit_initial,
+                    'rate_limit_max': max(rate_limit_max, rate_limit_initial),
                     'min_delay': min_delay,
                     'max_delay': max_delay
                 }
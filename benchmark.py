@@ -0,0 +1,176 @@
+"""
+Benchmarks for scraper configuration choices
+
+Usage:
+    python benchmark.py navigation
+    python benchmark.py execution
+
+navigation: compares the place detail navigation modes ("click", "direct",
+"tab") on the same search tasks and reports per-place latency and extraction
+success rate for each mode.
+
+execution: runs the same task list through the orchestrator in thread and
+process execution mode at 4, 8 and 16 workers and reports throughput.
+"""
+import sys
+import time
+import tempfile
+from dataclasses import replace
+from typing import Dict, List, Tuple
+
+from config.settings import ScraperConfig
+from core.driver_manager import DriverManager
+from core.orchestrator import ScraperOrchestrator
+from core.search_engine import MapsSearchEngine
+from models.place import SearchTask
+from utils.task_generator import TaskGenerator, JAKARTA_SELATAN_DISTRICTS
+
+
+BENCHMARK_TASKS = [
+    SearchTask(keyword="warung kelontong", location="Melawai, Kebayoran Baru, Jakarta Selatan", max_results=20),
+    SearchTask(keyword="apotek", location="Tebet, Jakarta Selatan", max_results=20),
+]
+
+
+def benchmark_navigation(tasks: List[SearchTask], base_config: ScraperConfig) -> Dict[str, Dict]:
+    """
+    Run the same tasks with every detail navigation mode
+    
+    Args:
+        tasks: Tasks to run for each mode
+        base_config: Configuration shared by all runs
+        
+    Returns:
+        Dict of mode -> aggregated stats
+    """
+    results = {}
+    
+    for mode in ['click', 'direct', 'tab']:
+        config = replace(base_config, detail_navigation=mode)
+        totals = {'attempts': 0, 'succeeded': 0, 'seconds': 0.0, 'places': 0, 'wall': 0.0}
+        
+        print(f"\n{'='*70}")
+        print(f"Navigation mode: {mode}")
+        print(f"{'='*70}")
+        
+        with DriverManager(config) as driver_manager:
+            for task in tasks:
+                engine = MapsSearchEngine(driver_manager, config)
+                start = time.time()
+                places = engine.search(task)
+                totals['wall'] += time.time() - start
+                totals['places'] += len(places)
+                for key in ('attempts', 'succeeded', 'seconds'):
+                    totals[key] += engine.detail_stats[key]
+        
+        results[mode] = totals
+    
+    return results
+
+
+def print_navigation_report(results: Dict[str, Dict]):
+    """Print a comparison table of navigation modes"""
+    print(f"\n{'='*70}")
+    print("DETAIL NAVIGATION BENCHMARK")
+    print(f"{'='*70}")
+    print(f"{'mode':<8} {'places':>7} {'success':>9} {'s/place':>9} {'wall (s)':>10}")
+    
+    for mode, totals in results.items():
+        attempts = totals['attempts'] or 1
+        success = totals['succeeded'] / attempts * 100
+        per_place = totals['seconds'] / attempts
+        print(f"{mode:<8} {totals['places']:>7} {success:>8.1f}% {per_place:>9.2f} {totals['wall']:>10.1f}")
+    
+    print(f"{'='*70}\n")
+
+
+def benchmark_execution_modes(tasks: List[SearchTask], base_config: ScraperConfig,
+                              worker_counts: Tuple[int, ...] = (4, 8, 16)) -> Dict[str, Dict]:
+    """
+    Run the same tasks through the orchestrator in thread and process mode
+    
+    Args:
+        tasks: Tasks to run for each mode and worker count
+        base_config: Configuration shared by all runs
+        worker_counts: Worker counts to try for each mode
+        
+    Returns:
+        Dict of "mode x workers" -> stats
+    """
+    results = {}
+    
+    for mode in ['thread', 'process']:
+        for workers in worker_counts:
+            # Each run writes to its own scratch directories
+            scratch = tempfile.mkdtemp(prefix=f"bench_{mode}_{workers}_")
+            config = replace(
+                base_config, execution_mode=mode, max_workers=workers,
+                output_dir=scratch, checkpoint_dir=scratch
+            )
+            
+            print(f"\n{'='*70}")
+            print(f"Execution mode: {mode}, {workers} workers")
+            print(f"{'='*70}")
+            
+            orchestrator = ScraperOrchestrator(config)
+            start = time.time()
+            df = orchestrator.scrape_tasks(list(tasks))
+            wall = time.time() - start
+            
+            results[f"{mode} x{workers}"] = {
+                'tasks': len(tasks),
+                'places': len(df),
+                'wall': wall,
+                'places_per_min': len(df) / wall * 60 if wall else 0.0,
+                'blocked': orchestrator.search_stats['blocked_attempts'],
+                'crashes': orchestrator.search_stats['worker_crashes']
+            }
+    
+    return results
+
+
+def print_execution_report(results: Dict[str, Dict]):
+    """Print a comparison table of execution modes"""
+    print(f"\n{'='*70}")
+    print("EXECUTION MODE BENCHMARK")
+    print(f"{'='*70}")
+    print(f"{'run':<12} {'tasks':>6} {'places':>7} {'wall (s)':>10} {'places/min':>11} {'blocked':>8} {'crashes':>8}")
+    
+    for run, totals in results.items():
+        print(f"{run:<12} {totals['tasks']:>6} {totals['places']:>7} {totals['wall']:>10.1f} "
+              f"{totals['places_per_min']:>11.1f} {totals['blocked']:>8} {totals['crashes']:>8}")
+    
+    print(f"{'='*70}\n")
+
+
+def main():
+    """Main execution function"""
+    benchmark = sys.argv[1] if len(sys.argv) > 1 else 'navigation'
+    # Fixed per-worker delays instead of the shared adaptive rate (whose cap
+    # would dominate the worker comparison), and no saturated-district
+    # expansion, so every run does the same amount of work
+    config = ScraperConfig(
+        headless=True,
+        min_delay=0.5,
+        max_delay=1.0,
+        adaptive_rate_limit=False,
+        expand_saturated_districts=False
+    )
+    
+    if benchmark == 'navigation':
+        results = benchmark_navigation(BENCHMARK_TASKS, config)
+        print_navigation_report(results)
+    elif benchmark == 'execution':
+        # Enough tasks to keep 16 workers busy
+        tasks = TaskGenerator.generate_district_tasks(
+            ["warung kelontong", "apotek"], "Jakarta Selatan", JAKARTA_SELATAN_DISTRICTS, max_results_per_task=20
+        )
+        results = benchmark_execution_modes(tasks, config)
+        print_execution_report(results)
+    else:
+        print(f"Unknown benchmark: {benchmark}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 """
 Configuration settings for the scraper
 """
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 
 @dataclass
@@ -11,22 +11,121 @@ class ScraperConfig:
     headless: bool = False
     scroll_pause_time: float = 2.0
     max_scroll_attempts: int = 10
+    use_feed_observer: bool = True  # Record feed links with a MutationObserver (selenium engine)
+    feed_page_timeout: float = 5.0  # Max wait for the next feed page after a scroll
     page_load_timeout: int = 30
     element_wait_timeout: int = 10
+    detail_settle_timeout: float = 3.0  # Max wait for the address row after a place opens
+    detail_navigation: str = "click"  # "click" feed cards, "direct" URL load, or new "tab" (cdp always loads directly)
+    detail_level: str = "full"  # "full" opens every place, "cards" reads only the feed cards
+    extraction_backend: str = "dom"  # "dom" selectors or "payload" (embedded page JSON, DOM fallback)
+    capture_search_responses: bool = False  # Decode feed pagination XHRs via DevTools
+    
+    # Detail backend - "browser" opens places in Chrome, "http" fetches them without a browser
+    detail_backend: str = "browser"
+    http_workers: int = 16  # Concurrent HTTP detail workers (two-phase pipeline)
+    http_timeout: float = 15.0
     max_retries: int = 3
+    search_mode: str = "url"  # "url" opens the results URL directly, "typed" uses the search box
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     language: str = "id"  # Indonesian
     proxy: Optional[str] = None
+    proxies: List[str] = field(default_factory=list)  # Rotated per new browser when set
     driver_path: Optional[str] = None
     
+    # Lean profile - block resources the extraction never uses
+    block_resources: bool = False
+    blocked_url_patterns: List[str] = field(default_factory=lambda: [
+        "*/maps/vt*",                      # Map tiles
+        "*khms*.google.com/*",             # Satellite tiles
+        "*streetviewpixels-pa.googleapis.com/*",
+        "*.googleusercontent.com/*",       # Place photos
+        "*.gstatic.com/*.woff*",           # Web fonts
+        "*fonts.googleapis.com/*",
+        "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*",
+        "*/gen_204*",                      # Tracking beacons
+        "*/log?*",
+        "*google-analytics.com/*",
+        "*doubleclick.net/*",
+    ])
+    
     # Rate limiting
     min_delay: float = 1.0
     max_delay: float = 3.0
     
+    # Adaptive rate limiting - one token bucket shared by every worker
+    adaptive_rate_limit: bool = True  # Replaces the per-thread min/max delay sleep
+    rate_limit_initial: float = 2.0  # Page loads per second across all workers
+    rate_limit_min: float = 0.2
+    rate_limit_max: float = 5.0
+    rate_limit_increase: float = 0.05  # Added to the rate per healthy response
+    rate_limit_backoff: float = 0.5  # Rate multiplier on a block or timeout
+    rate_limit_block_cooldown: float = 30.0  # Pause all workers after a block signal
+    
+    # Block handling - per-worker circuit breaker
+    block_breaker_threshold: int = 2  # Consecutive blocks before a worker pauses
+    block_breaker_cooldown: float = 120.0  # Seconds a worker pauses once its breaker opens
+    max_block_requeues: int = 3  # Times a blocked task is re-queued before giving up
+    
+    # Saturated task expansion
+    tile_split_threshold: int = 110  # Tasks whose feed reaches this many results (Maps caps at ~120) are saturated
+    max_tile_depth: int = 3  # How many times a saturated tile may be split into quadrants
+    expand_saturated_districts: bool = True  # Re-run saturated district tasks per subdistrict
+    
+    # Out-of-area filtering
+    skip_out_of_area: bool = False  # Also skip places outside the landed viewport for tasks without bounds
+    out_of_area_margin: float = 0.25  # Grow the area by this share of its size before checking
+    out_of_area_stop_share: float = 0.6  # Stop scrolling once this share of a feed page is out of area
+    
     # Threading
     max_workers: int = 4
+    execution_mode: str = "thread"  # "thread" or "process" (one browser per worker process; per_task pipeline only)
+    engine: str = "selenium"  # "selenium" or "cdp" (asyncio over the DevTools websocket; per_task pipeline only)
+    cdp_tabs_per_browser: int = 4  # Tabs each Chrome process hosts when engine == "cdp"
+    pipeline: str = "per_task"  # "per_task" or "two_phase" (global discovery, then deduplicated details)
+    
+    # SQLite work queue (queue_worker.py)
+    queue_lease_seconds: float = 300.0  # A claimed task is re-offered if its lease is not renewed
+    queue_heartbeat_interval: float = 30.0  # Seconds between lease renewals while a task runs
+    queue_max_attempts: int = 3  # Claims before a task is marked failed
+    
+    # Driver pool
+    reuse_drivers: bool = True  # Keep one browser per worker alive across tasks
+    max_tasks_per_driver: int = 25  # Recycle a browser after this many tasks
+    use_profile_template: bool = True  # Clone a pre-seeded profile instead of a blank one (selenium engine)
     
     # Output
     output_dir: str = "results"
     checkpoint_dir: str = "checkpoints"
-    csv_delimiter: str = "~"  # Custom delimiter for easier reading (avoids comma conflicts)
\ No newline at end of file
+    csv_delimiter: str = "~"  # Custom delimiter for easier reading (avoids comma conflicts)
+    incremental_fsync_interval: float = 5.0  # Seconds between fsyncs of incremental_all.csv (0 = every append)
+    background_writer: bool = True  # Append to incremental_all.csv from a writer thread
+    
+    def __post_init__(self):
+        """Validate option combinations"""
+        if self.execution_mode == 'process' and self.pipeline != 'per_task':
+            raise ValueError(f"execution_mode='process' supports only pipeline='per_task', not {self.pipeline!r}")
+        if self.engine == 'cdp':
+            self._check_cdp_options()
+    
+    def _check_cdp_options(self):
+        """
+        Reject options that would change what a CDP run collects
+        
+        The CDP engine runs per_task searches as tabs on one event loop,
+        opens every place by URL in fresh-profile browsers and reads it from
+        the DOM. Options that only tune the Selenium engine (detail_navigation,
+        use_feed_observer, use_profile_template) do not apply and are left alone.
+        """
+        supported = {
+            'pipeline': self.pipeline == 'per_task',
+            'execution_mode': self.execution_mode == 'thread',
+            'detail_level': self.detail_level == 'full',
+            'extraction_backend': self.extraction_backend == 'dom',
+            'search_mode': self.search_mode == 'url',
+            'detail_backend': self.detail_backend == 'browser',
+            'proxies': not self.proxies,
+        }
+        conflicts = [f"{name}={getattr(self, name)!r}" for name, ok in supported.items() if not ok]
+        if conflicts:
+            raise ValueError(f"engine='cdp' does not support {', '.join(conflicts)}")
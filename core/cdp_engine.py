@@ -0,0 +1,663 @@
+"""
+Asyncio search engine that drives Chrome over the DevTools protocol websocket
+
+One event loop runs every tab of every browser, so high concurrency needs
+neither a thread per browser nor a chromedriver HTTP round trip per command.
+Requires the optional `websockets` package (engine="cdp").
+"""
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import shutil
+import tempfile
+import time
+from concurrent.futures import Executor, Future
+from threading import Thread
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import websockets
+except ImportError:  # Optional dependency - only needed for engine="cdp"
+    websockets = None
+
+from config.settings import ScraperConfig
+from models.place import SearchTask, Place
+from core.circuit_breaker import CircuitBreaker, PageBlockedError, WorkerBreakers
+from core.page_scripts import PLACE_DETAILS_SCRIPT, FEED_LINKS_SCRIPT, CLASSIFY_PAGE_SCRIPT
+from core.process_worker import places_to_rows
+from core.rate_limiter import get_rate_limiter
+from core.run_journal import RunJournal
+from core.search_area import SearchAreaFilter
+from core.search_engine import SETTLED_PAGE_STATES, build_search_url, build_place_from_details, is_valid_place
+from core.waits import WaitStats, PLACEHOLDER_TITLES
+from utils.geo import viewport_from_url
+
+
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+
+class CdpError(Exception):
+    """A DevTools command failed or the browser went away"""
+    pass
+
+
+class CdpConnection:
+    """One DevTools websocket, multiplexing commands for every attached tab"""
+    
+    def __init__(self, ws):
+        self._ws = ws
+        self._next_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reader = asyncio.create_task(self._read())
+    
+    @classmethod
+    async def connect(cls, url: str) -> 'CdpConnection':
+        """Open the browser-level websocket"""
+        if websockets is None:
+            raise ImportError("engine='cdp' needs the websockets package: pip install websockets")
+        ws = await websockets.connect(url, max_size=None, ping_interval=None)
+        return cls(ws)
+    
+    async def send(self, method: str, params: Optional[dict] = None,
+                   session_id: Optional[str] = None, timeout: float = 30.0) -> dict:
+        """
+        Send a command and wait for its result
+        
+        Args:
+            method: DevTools method (e.g. "Page.navigate")
+            params: Method parameters
+            session_id: Target session for tab-level commands
+            timeout: Seconds to wait for the response
+        
+        Returns:
+            The command's result object
+        """
+        self._next_id += 1
+        message = {'id': self._next_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        
+        future = asyncio.get_running_loop().create_future()
+        self._pending[self._next_id] = future
+        await self._ws.send(json.dumps(message))
+        response = await asyncio.wait_for(future, timeout)
+        
+        if 'error' in response:
+            raise CdpError(f"{method}: {response['error'].get('message')}")
+        return response.get('result', {})
+    
+    async def _read(self):
+        """Route responses to their waiting commands (events are ignored)"""
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                future = self._pending.pop(message.get('id'), None)
+                if future and not future.done():
+                    future.set_result(message)
+        except Exception:
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(CdpError("DevTools connection closed"))
+            self._pending.clear()
+    
+    async def close(self):
+        """Close the websocket"""
+        self._reader.cancel()
+        await self._ws.close()
+
+
+class CdpTab:
+    """A page target attached over a flat session on the browser connection"""
+    
+    def __init__(self, connection: CdpConnection, session_id: str, target_id: str):
+        self.connection = connection
+        self.session_id = session_id
+        self.target_id = target_id
+    
+    async def send(self, method: str, params: Optional[dict] = None, timeout: float = 30.0) -> dict:
+        """Send a command to this tab"""
+        return await self.connection.send(method, params, self.session_id, timeout)
+    
+    async def navigate(self, url: str):
+        """Start loading a URL (readiness is checked with run_script polls)"""
+        await self.send('Page.navigate', {'url': url})
+    
+    async def run_script(self, script: str, *args) -> Any:
+        """
+        Run one of the page_scripts in the tab
+        
+        The scripts are written for Selenium's execute_script (a function body
+        using `return` and `arguments`), so they are wrapped the same way.
+        """
+        expression = f"(function() {{\n{script}\n}}).apply(null, {json.dumps(list(args))})"
+        result = await self.send('Runtime.evaluate', {'expression': expression, 'returnByValue': True})
+        if 'exceptionDetails' in result:
+            raise CdpError(result['exceptionDetails'].get('text', 'script error'))
+        return result.get('result', {}).get('value')
+    
+    async def current_url(self) -> str:
+        """URL the tab is showing"""
+        return await self.run_script("return window.location.href;")
+    
+    async def close(self):
+        """Close the tab (a browser that already went away is fine)"""
+        try:
+            await self.connection.send('Target.closeTarget', {'targetId': self.target_id}, timeout=5.0)
+        except (CdpError, asyncio.TimeoutError):
+            pass
+
+
+class CdpBrowser:
+    """A Chrome process launched with remote debugging, reachable over one websocket"""
+    
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.connection: Optional[CdpConnection] = None
+        self.profile_dir: Optional[str] = None
+        self.open_tabs = 0
+        self.replacement: Optional['CdpBrowser'] = None  # Set once the browser is retired after a block
+    
+    async def start(self):
+        """Launch Chrome and connect to its DevTools websocket"""
+        binary = os.environ.get('CHROME_BIN') or next(filter(None, map(shutil.which, CHROME_BINARIES)), None)
+        if not binary:
+            raise CdpError("Chrome not found - set CHROME_BIN")
+        
+        self.profile_dir = tempfile.mkdtemp(prefix="gmaps_cdp_")
+        args = [
+            binary,
+            "--remote-debugging-port=0",
+            f"--user-data-dir={self.profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-extensions",
+            "--disable-gpu",
+            "--window-size=1280,800",
+            f"--lang={self.config.language}",
+            f"--user-agent={self.config.user_agent}",
+            "--disable-blink-features=AutomationControlled",
+        ]
+        if self.config.headless:
+            args.append("--headless=new")
+        if self.config.proxy:
+            args.append(f"--proxy-server={self.config.proxy}")
+        args.append("about:blank")
+        
+        self.process = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+        )
+        
+        # Chrome prints its websocket URL on stderr once it is listening
+        ws_url = None
+        deadline = time.time() + self.config.page_load_timeout
+        while time.time() < deadline:
+            line = await asyncio.wait_for(self.process.stderr.readline(), self.config.page_load_timeout)
+            if not line:
+                break
+            match = re.search(rb'DevTools listening on (ws://\S+)', line)
+            if match:
+                ws_url = match.group(1).decode()
+                break
+        
+        if not ws_url:
+            await self.close()
+            raise CdpError("Chrome did not report a DevTools websocket")
+        
+        # Keep draining stderr so Chrome never blocks on a full pipe
+        asyncio.create_task(self._drain_stderr())
+        self.connection = await CdpConnection.connect(ws_url)
+    
+    async def _drain_stderr(self):
+        """Discard Chrome's log output"""
+        while self.process and not self.process.stderr.at_eof():
+            if not await self.process.stderr.readline():
+                break
+    
+    async def new_tab(self) -> CdpTab:
+        """Open a tab and attach to it"""
+        target = await self.connection.send('Target.createTarget', {'url': 'about:blank'})
+        attached = await self.connection.send(
+            'Target.attachToTarget', {'targetId': target['targetId'], 'flatten': True}
+        )
+        tab = CdpTab(self.connection, attached['sessionId'], target['targetId'])
+        self.open_tabs += 1
+        
+        if self.config.block_resources:
+            await tab.send('Network.enable')
+            await tab.send('Network.setBlockedURLs', {'urls': self.config.blocked_url_patterns})
+        return tab
+    
+    async def close_tab(self, tab: CdpTab):
+        """Close one of this browser's tabs"""
+        self.open_tabs -= 1
+        await tab.close()
+    
+    async def close(self):
+        """Close Chrome and remove its profile"""
+        if self.connection:
+            try:
+                await self.connection.send('Browser.close', timeout=5.0)
+            except Exception:
+                pass
+            try:
+                await self.connection.close()
+            except Exception:
+                pass
+            self.connection = None
+        
+        if self.process and self.process.returncode is None:
+            try:
+                await asyncio.wait_for(self.process.wait(), 5.0)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+            self.profile_dir = None
+
+
+class AsyncMapsSearchEngine:
+    """
+    Searches Google Maps over a CdpTab, with coroutines for every page wait
+    
+    Runs the same page_scripts as MapsSearchEngine and shares its URL and
+    Place building and its SearchAreaFilter. Only the URL search and direct
+    place loads are implemented; ScraperConfig rejects the other options
+    for engine="cdp".
+    """
+    
+    def __init__(self, tab: CdpTab, config: ScraperConfig):
+        self.tab = tab
+        self.config = config
+        self.rate_limiter = get_rate_limiter(config) if config.adaptive_rate_limit else None
+        self.block_detected = False  # Set when a place load lands on a block page
+        self.wait_stats = WaitStats()
+        self.detail_stats = {'attempts': 0, 'succeeded': 0, 'seconds': 0.0}
+        self.feed_size = 0  # Hrefs collected from the last results feed
+        self.completed_hrefs: Set[str] = set()  # Hrefs a resumed run already processed
+        self.on_place = None  # Called per processed href, like MapsSearchEngine.on_place
+        self.search_stats = {'url_searches': 0, 'out_of_area_skipped': 0, 'out_of_area_stops': 0}
+        self.area_filter = SearchAreaFilter(config, self.search_stats)
+    
+    async def search(self, task: SearchTask) -> List[Place]:
+        """
+        Execute a search task and return found places
+        
+        Args:
+            task: SearchTask to execute
+        
+        Returns:
+            List of Place objects
+        """
+        print(f"Searching (cdp): {task}")
+        places = []
+        
+        page_state = await self._open_search(task)
+        if page_state == 'blocked':
+            raise PageBlockedError(f"Blocked while searching: {task.get_query()}")
+        
+        if page_state == 'place':
+            place = await self._read_place(task, 0, 1)
+            if place:
+                places.append(place)
+                if self.on_place:
+                    self.on_place(place.google_maps_link, place)
+            return places
+        
+        if page_state != 'feed':
+            print(f"  No results feed for: {task} ({page_state})")
+            return places
+        
+        place_hrefs = await self._collect_feed(task.max_results)
+        self.feed_size = len(place_hrefs)
+        place_hrefs = self.area_filter.filter(place_hrefs)
+        
+        for idx, href in enumerate(place_hrefs):
+            if href in self.completed_hrefs:
+                continue
+            
+            try:
+                await self.tab.navigate(href)
+                place = await self._read_place(task, idx, len(place_hrefs))
+            except CdpError as e:
+                print(f"  [{idx+1}/{len(place_hrefs)}] Error: {e}")
+                continue
+            
+            if place:
+                places.append(place)
+                print(f"  [{idx+1}/{len(place_hrefs)}] ✓ {place.name}")
+            
+            if self.block_detected:
+                raise PageBlockedError(f"Blocked after {idx+1}/{len(place_hrefs)} places: {task.get_query()}")
+            
+            if self.on_place:
+                self.on_place(href, place)
+            
+            await self.pause_between_places()
+        
+        print(f"Collected {len(places)} places for: {task}")
+        return places
+    
+    async def discover(self, task: SearchTask) -> List[str]:
+        """Collect place hrefs without opening them (two-phase discovery)"""
+        page_state = await self._open_search(task)
+        if page_state == 'blocked':
+            raise PageBlockedError(f"Blocked while searching: {task.get_query()}")
+        if page_state == 'place':
+            return [await self.tab.current_url()]
+        if page_state != 'feed':
+            return []
+        
+        place_hrefs = await self._collect_feed(task.max_results)
+        self.feed_size = len(place_hrefs)
+        return self.area_filter.filter(place_hrefs)
+    
+    async def pause_between_places(self):
+        """Politeness delay between place page loads, without blocking the loop"""
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async()
+        else:
+            await asyncio.sleep(random.uniform(self.config.min_delay, self.config.max_delay))
+    
+    def _signal(self, outcome: str):
+        """Report a response outcome ("ok", "timeout", "blocked") to the rate limiter"""
+        if not self.rate_limiter:
+            return
+        if outcome == 'ok':
+            self.rate_limiter.record_success()
+        else:
+            self.rate_limiter.record_failure(outcome)
+    
+    async def _poll(self, point: str, check, timeout: float, poll_interval: float = 0.1):
+        """Await check() until it returns something truthy, recording the wait"""
+        start = time.time()
+        result = None
+        while True:
+            try:
+                result = await check()
+            except CdpError:
+                result = None
+            if result or time.time() - start >= timeout:
+                break
+            await asyncio.sleep(poll_interval)
+        self.wait_stats.record(point, time.time() - start, not result)
+        return result
+    
+    async def _open_search(self, task: SearchTask) -> str:
+        """Load the search URL and classify where it landed"""
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async()
+        
+        self.search_stats['url_searches'] += 1
+        await self.tab.navigate(build_search_url(task, self.config.language))
+        
+        async def settled():
+            state = await self.tab.run_script(CLASSIFY_PAGE_SCRIPT)
+            return state if state in SETTLED_PAGE_STATES else None
+        
+        page_state = await self._poll('search_landing', settled, self.config.element_wait_timeout) or 'loading'
+        self.search_stats[f'landed_{page_state}'] = self.search_stats.get(f'landed_{page_state}', 0) + 1
+        
+        viewport = await self._results_viewport() if self.area_filter.needs_viewport(task, page_state) else None
+        self.area_filter.set_area(task, page_state, viewport)
+        
+        if page_state == 'blocked':
+            self._signal('blocked')
+        elif page_state in SETTLED_PAGE_STATES:
+            self._signal('ok')
+        else:
+            self._signal('timeout')
+        return page_state
+    
+    async def _results_viewport(self) -> Optional[Tuple[float, float, float]]:
+        """Viewport of the results page, once the URL has moved off the home page's viewport"""
+        async def viewport():
+            url = await self.tab.current_url()
+            return '/maps/search/' in url and viewport_from_url(url)
+        
+        return await self._poll('results_viewport', viewport, self.config.element_wait_timeout) or None
+    
+    async def _collect_feed(self, max_results: int) -> List[str]:
+        """Scroll the results feed and collect unique place hrefs in feed order"""
+        seen_hrefs: Dict[str, None] = {}
+        no_change_count = 0
+        
+        for _ in range(self.config.max_scroll_attempts):
+            snapshot = await self.tab.run_script(FEED_LINKS_SCRIPT, True)
+            if snapshot is None:
+                break
+            
+            new_hrefs = [href for href in snapshot['hrefs'] if href not in seen_hrefs]
+            for href in new_hrefs:
+                seen_hrefs[href] = None
+            
+            if self.area_filter.drifted(new_hrefs) or snapshot['end_of_list'] or len(seen_hrefs) >= max_results:
+                break
+            
+            no_change_count = 0 if new_hrefs else no_change_count + 1
+            if no_change_count >= 3:
+                break
+            
+            # Continue as soon as the feed appends cards
+            count = snapshot['count']
+            
+            async def grew():
+                current = await self.tab.run_script(FEED_LINKS_SCRIPT, False)
+                return current and current['count'] > count
+            
+            await self._poll('feed_grew', grew, self.config.scroll_pause_time)
+        
+        return list(seen_hrefs)[:max_results]
+    
+    async def _read_place(self, task: SearchTask, idx: int, total: int) -> Optional[Place]:
+        """Wait for the place panel to render and read it in one script call"""
+        self.detail_stats['attempts'] += 1
+        start = time.time()
+        
+        async def named():
+            fields = await self.tab.run_script(PLACE_DETAILS_SCRIPT)
+            if fields and fields.get('name') and fields['name'] not in PLACEHOLDER_TITLES:
+                return fields
+            return None
+        
+        fields = await self._poll('place_title', named, self.config.element_wait_timeout)
+        if not fields:
+            if await self.tab.run_script(CLASSIFY_PAGE_SCRIPT) == 'blocked':
+                self.block_detected = True
+                self._signal('blocked')
+                print(f"  [{idx+1}/{total}] ⛔ Block page detected")
+            else:
+                self._signal('timeout')
+                print(f"  [{idx+1}/{total}] ❌ Could not extract name")
+            return None
+        
+        # Give the address row a moment to render
+        if not (fields.get('address') or fields.get('address_aria')):
+            async def addressed():
+                current = await self.tab.run_script(PLACE_DETAILS_SCRIPT)
+                return current if current and (current.get('address') or current.get('address_aria')) else None
+            
+            fields = await self._poll('place_address', addressed, self.config.detail_settle_timeout) or fields
+        
+        self._signal('ok')
+        place = build_place_from_details(fields, fields.get('url') or await self.tab.current_url(), task)
+        self.detail_stats['seconds'] += time.time() - start
+        if not is_valid_place(place):
+            return None
+        
+        self.detail_stats['succeeded'] += 1
+        return place
+
+
+class CdpWorker:
+    """One unit of CDP concurrency: a tab, the browser it lives in and its circuit breaker"""
+    
+    def __init__(self, name: str, breaker: CircuitBreaker):
+        self.name = name
+        self.breaker = breaker
+        self.browser: Optional[CdpBrowser] = None
+        self.tab: Optional[CdpTab] = None
+
+
+class CdpExecutor(Executor):
+    """
+    Runs CDP search tasks on one background event loop
+    
+    Launches enough browsers for max_workers tabs (cdp_tabs_per_browser tabs
+    each) and hands out concurrent.futures Futures, so the orchestrator's
+    completion loop works unchanged. Each tab has its own circuit breaker,
+    and a block retires the tab's browser for one with a fresh profile.
+    """
+    
+    def __init__(self, config: ScraperConfig, breakers: WorkerBreakers, journal: Optional[RunJournal] = None,
+                 done_hrefs: Optional[Dict[str, Set[str]]] = None):
+        self.config = config
+        self.breakers = breakers
+        self.journal = journal
+        self.done_hrefs = done_hrefs or {}
+        self.browsers: List[CdpBrowser] = []  # Every browser still running, retired ones included
+        self.blocked_attempts = 0
+        self.block_wasted_seconds = 0.0
+        self._workers: Optional[asyncio.Queue] = None  # Free workers, created on the loop
+        self._rotation_lock: Optional[asyncio.Lock] = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self._loop.run_forever, name="cdp-loop", daemon=True)
+        self._thread.start()
+        
+        try:
+            asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        except Exception:
+            self.shutdown()
+            raise
+    
+    async def _start(self):
+        """Launch the browsers and open every worker's tab"""
+        self._workers = asyncio.Queue()
+        self._rotation_lock = asyncio.Lock()
+        tabs_per_browser = max(1, self.config.cdp_tabs_per_browser)
+        browser_count = math.ceil(self.config.max_workers / tabs_per_browser)
+        
+        for _ in range(browser_count):
+            browser = CdpBrowser(self.config)
+            await browser.start()
+            self.browsers.append(browser)
+        
+        for idx in range(self.config.max_workers):
+            name = f"cdp-tab-{idx}"
+            worker = CdpWorker(name, self.breakers.for_worker(name))
+            worker.browser = self.browsers[idx % browser_count]
+            worker.tab = await worker.browser.new_tab()
+            self._workers.put_nowait(worker)
+        
+        print(f"CDP engine ready: {browser_count} browsers, {self.config.max_workers} tabs, 1 event loop")
+    
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """Schedule a coroutine function on the event loop"""
+        return asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), self._loop)
+    
+    async def run_task(self, task: SearchTask) -> Dict:
+        """
+        Run one search task on the next free tab, behind that tab's circuit breaker
+        
+        On a block page the tab's browser is retired, the wasted time is
+        recorded and PageBlockedError propagates so the task gets re-queued.
+        
+        Returns:
+            The same compact batch as a process-mode worker
+        """
+        worker = await self._workers.get()
+        try:
+            paused = worker.breaker.remaining()
+            if paused:
+                await asyncio.sleep(paused)
+                print(f"  {worker.name} resumed after {paused:.0f}s circuit-breaker pause")
+            if worker.browser.replacement:
+                # Another tab on this browser was blocked since this tab's last task
+                await self._rotate(worker)
+            
+            search_engine = AsyncMapsSearchEngine(worker.tab, self.config)
+            search_engine.completed_hrefs = self.done_hrefs.get(task.key(), set())
+            if self.journal:
+                journal = self.journal
+                journal.task_started(task)
+                search_engine.on_place = lambda href, place: journal.places_persisted(
+                    task, href, [place] if place else []
+                )
+            
+            start = time.time()
+            try:
+                places = await search_engine.search(task)
+            except PageBlockedError:
+                wasted = time.time() - start
+                worker.breaker.record_block()
+                self.blocked_attempts += 1
+                self.block_wasted_seconds += wasted
+                state = "breaker open, pausing tab" if worker.breaker.is_open else "rotating browser"
+                print(f"  ⛔ Block page on {task} after {wasted:.1f}s ({state})")
+                try:
+                    await self._rotate(worker)
+                except Exception as e:
+                    print(f"  ⚠️  Could not rotate browser: {e}")
+                raise
+            
+            worker.breaker.record_success()
+        finally:
+            self._workers.put_nowait(worker)
+        
+        return {
+            'rows': places_to_rows(places),
+            'feed_size': search_engine.feed_size,
+            'search_stats': dict(search_engine.search_stats),
+            'wait_stats': search_engine.wait_stats.snapshot()
+        }
+    
+    async def _rotate(self, worker: CdpWorker):
+        """
+        Move a worker off its retired browser onto a fresh profile
+        
+        The first block on a browser retires it and starts its replacement.
+        Its other tabs move over when they next run a task, and the retired
+        browser is closed once its last tab has left.
+        """
+        async with self._rotation_lock:
+            retired = worker.browser
+            if retired.replacement is None:
+                replacement = CdpBrowser(self.config)
+                await replacement.start()
+                self.browsers.append(replacement)
+                retired.replacement = replacement
+                print("  🔄 Browser retired after a block - started a fresh profile")
+            
+            browser = retired.replacement
+            while browser.replacement:  # The replacement may have been retired too
+                browser = browser.replacement
+            
+            await retired.close_tab(worker.tab)
+            if retired.open_tabs == 0:
+                self.browsers.remove(retired)
+                await retired.close()
+            
+            worker.browser = browser
+            worker.tab = await browser.new_tab()
+    
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        """Close every browser and stop the event loop"""
+        if not self._thread.is_alive():
+            return
+        
+        async def close_all():
+            await asyncio.gather(*(browser.close() for browser in self.browsers), return_exceptions=True)
+        
+        asyncio.run_coroutine_threadsafe(close_all(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,89 @@
+"""
+Per-worker circuit breaker for Google block / CAPTCHA pages
+"""
+import time
+import threading
+from typing import Dict
+
+
+class PageBlockedError(Exception):
+    """Google served an unusual-traffic / CAPTCHA page instead of Maps"""
+    pass
+
+
+class CircuitBreaker:
+    """Stops one worker from hammering Google after repeated block pages
+    
+    Closed: the worker runs normally. After ``threshold`` consecutive
+    blocks the breaker opens and the worker pauses for ``cooldown``
+    seconds. After the pause it runs again (half-open): a success closes
+    the breaker, another block re-opens it straight away.
+    """
+    
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.consecutive_blocks = 0
+        self.open_until = 0.0
+        self.times_opened = 0
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether the worker should currently be paused"""
+        return time.monotonic() < self.open_until
+    
+    def record_block(self):
+        """Count a block page, opening the breaker at the threshold"""
+        self.consecutive_blocks += 1
+        if self.consecutive_blocks >= self.threshold:
+            self.open_until = time.monotonic() + self.cooldown
+            self.times_opened += 1
+            # Half-open after the pause: one more block re-opens it
+            self.consecutive_blocks = self.threshold - 1
+    
+    def record_success(self):
+        """A task got through - close the breaker"""
+        self.consecutive_blocks = 0
+    
+    def remaining(self) -> float:
+        """Seconds left in the current pause (0 when closed)"""
+        return max(0.0, self.open_until - time.monotonic())
+    
+    def wait_until_closed(self) -> float:
+        """
+        Sleep while the breaker is open
+        
+        Returns:
+            Seconds spent paused
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            return 0.0
+        time.sleep(remaining)
+        return remaining
+
+
+class WorkerBreakers:
+    """One CircuitBreaker per worker (a thread, or a CDP tab)"""
+    
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def current(self) -> CircuitBreaker:
+        """Breaker for the calling worker thread"""
+        return self.for_worker(threading.current_thread().name)
+    
+    def for_worker(self, name: str) -> CircuitBreaker:
+        """Breaker for a named worker"""
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(self.threshold, self.cooldown)
+            return self._breakers[name]
+    
+    def times_opened(self) -> int:
+        """Total number of times any worker's breaker opened"""
+        with self._lock:
+            return sum(b.times_opened for b in self._breakers.values())
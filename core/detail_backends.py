@@ -0,0 +1,72 @@
+"""
+Place detail backends used by MapsSearchEngine
+
+A backend turns one collected place href into a Place. The browser
+backend opens the place in the engine's own Chrome; the HTTP backend
+fetches it without a browser so detail work can run at a much higher
+concurrency than one Chrome per worker allows.
+"""
+from typing import Optional
+
+from models.place import SearchTask, Place
+from core.circuit_breaker import PageBlockedError
+from core.http_fetcher import HttpPlaceFetcher
+
+
+class DetailBackend:
+    """Interface for fetching the details of one place"""
+    
+    name = "base"
+    needs_browser = True
+    
+    def fetch_place(self, href: str, task: SearchTask, idx: int = 0, total: int = 1) -> Optional[Place]:
+        """Fetch and parse one place"""
+        raise NotImplementedError
+    
+    def close(self):
+        """Release any resources held by the backend"""
+        pass
+
+
+class BrowserDetailBackend(DetailBackend):
+    """Opens places in a MapsSearchEngine's browser"""
+    
+    name = "browser"
+    needs_browser = True
+    
+    def __init__(self, search_engine):
+        self.search_engine = search_engine
+    
+    def fetch_place(self, href: str, task: SearchTask, idx: int = 0, total: int = 1) -> Optional[Place]:
+        """Open the place URL directly in the browser and extract it"""
+        return self.search_engine.extract_place(href, task, idx, total)
+
+
+class HttpDetailBackend(DetailBackend):
+    """Fetches places over pooled HTTP and parses the embedded payload"""
+    
+    name = "http"
+    needs_browser = False
+    
+    def __init__(self, fetcher: HttpPlaceFetcher):
+        self.fetcher = fetcher
+    
+    def fetch_place(self, href: str, task: SearchTask, idx: int = 0, total: int = 1) -> Optional[Place]:
+        """Fetch the place page and parse it without a browser"""
+        try:
+            place = self.fetcher.fetch_place(href, task)
+        except PageBlockedError:
+            print(f"  [{idx+1}/{total}] ⛔ HTTP request blocked")
+            raise
+        except Exception as e:
+            print(f"  [{idx+1}/{total}] ❌ HTTP extract error: {e}")
+            return None
+        
+        if not place or not place.name:
+            print(f"  [{idx+1}/{total}] ❌ No place payload in HTTP response")
+            return None
+        return place
+    
+    def close(self):
+        """Close the shared connection pool"""
+        self.fetcher.close()
@@ -1,28 +1,44 @@
 """
 WebDriver manager for Chrome browser automation
 """
-import time
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
 import os
-from typing import Optional
+import json
+from typing import Dict, List, Optional
 
 from config.settings import ScraperConfig
+from core.waits import PageWaiter, WaitStats
+
+
+# URL fragment of the XHRs that deliver further pages of search results
+SEARCH_RESPONSE_MARKER = '/search?tbm=map'
+
+CONSENT_BUTTON_SELECTORS = [
+    'form[action*="consent"] button',
+    'button[aria-label*="Accept all"]',
+    'button[aria-label*="Terima semua"]',
+]
 
 
 class DriverManager:
     """Manages Chrome WebDriver lifecycle"""
     
-    def __init__(self, config: ScraperConfig):
+    def __init__(self, config: ScraperConfig, profile_template=None, proxy: Optional[str] = None):
         self.config = config
+        self.profile_template = profile_template  # Optional ProfileTemplate to clone
+        self.proxy = proxy or config.proxy
         self.driver: Optional[webdriver.Chrome] = None
         self.temp_dir: Optional[str] = None  # Track temp directory for cleanup
+        self.tasks_completed = 0  # Tasks served since the driver was created
+        self.wait_stats = WaitStats()  # Time spent in readiness waits
+        self._network_totals = {'requests': 0, 'blocked_requests': 0, 'bytes_received': 0}
+        self._pending_search_requests = set()  # Search XHRs seen but not finished yet
+        self._finished_search_requests: List[str] = []  # Search XHRs ready to read
     
     def create_driver(self) -> webdriver.Chrome:
         """Create and configure Chrome WebDriver"""
@@ -50,17 +66,31 @@ class DriverManager:
         if self.config.headless:
             chrome_options.add_argument("--headless=new")
         
-        if self.config.proxy:
-            chrome_options.add_argument(f'--proxy-server={self.config.proxy}')
+        if self.proxy:
+            chrome_options.add_argument(f'--proxy-server={self.proxy}')
+        
+        # Lean profile: skip images entirely
+        if self.config.block_resources:
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2
+            })
+        
+        # Network events feed the lean-profile stats and search response capture
+        if self._uses_performance_log():
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
         
         # Temporary profile directory - UNIQUE for each browser instance
         import tempfile
         import uuid
         import shutil
         try:
-            # Create unique temp directory for each browser instance
-            unique_id = str(uuid.uuid4())[:8]
-            self.temp_dir = tempfile.mkdtemp(prefix=f"chrome_profile_{unique_id}_")
+            if self.profile_template:
+                # Clone the pre-seeded template (consent accepted, caches warm)
+                self.temp_dir = self.profile_template.clone()
+            else:
+                # Create unique temp directory for each browser instance
+                unique_id = str(uuid.uuid4())[:8]
+                self.temp_dir = tempfile.mkdtemp(prefix=f"chrome_profile_{unique_id}_")
             chrome_options.add_argument(f"--user-data-dir={self.temp_dir}")
         except Exception as e:
             print(f"Warning: Could not create custom cache directory: {e}")
@@ -73,11 +103,123 @@ class DriverManager:
             driver = webdriver.Chrome(options=chrome_options)
         
         driver.set_page_load_timeout(self.config.page_load_timeout)
-        driver.delete_all_cookies()
+        if not self.profile_template:
+            # Cloned profiles keep their consent cookies
+            driver.delete_all_cookies()
+        
+        if self.config.block_resources:
+            self._apply_url_blocking(driver)
+        elif self.config.capture_search_responses:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+            except Exception as e:
+                print(f"Warning: Could not enable network capture: {e}")
         
         self.driver = driver
+        self.tasks_completed = 0
         return driver
     
+    def waiter(self) -> PageWaiter:
+        """Readiness waiter bound to the current driver"""
+        return PageWaiter(self.driver, self.wait_stats)
+    
+    def _apply_url_blocking(self, driver: webdriver.Chrome):
+        """Block unused resource classes by URL pattern via CDP"""
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {
+                "urls": self.config.blocked_url_patterns
+            })
+        except Exception as e:
+            print(f"Warning: Could not enable resource blocking: {e}")
+    
+    def _uses_performance_log(self) -> bool:
+        """Whether this driver records DevTools network events"""
+        return self.config.block_resources or self.config.capture_search_responses
+    
+    def _drain_performance_log(self):
+        """Read pending DevTools network events into the running totals"""
+        if not self.driver or not self._uses_performance_log():
+            return
+        
+        try:
+            entries = self.driver.get_log('performance')
+        except Exception:
+            return
+        
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError, TypeError):
+                continue
+            
+            method = message.get('method')
+            params = message.get('params', {})
+            
+            if method == 'Network.requestWillBeSent':
+                self._network_totals['requests'] += 1
+            elif method == 'Network.loadingFailed':
+                self._pending_search_requests.discard(params.get('requestId'))
+                if params.get('blockedReason') or 'BLOCKED' in params.get('errorText', ''):
+                    self._network_totals['blocked_requests'] += 1
+            elif method == 'Network.responseReceived':
+                url = params.get('response', {}).get('url', '')
+                if self.config.capture_search_responses and SEARCH_RESPONSE_MARKER in url:
+                    self._pending_search_requests.add(params.get('requestId'))
+            elif method == 'Network.loadingFinished':
+                self._network_totals['bytes_received'] += int(params.get('encodedDataLength', 0))
+                request_id = params.get('requestId')
+                if request_id in self._pending_search_requests:
+                    self._pending_search_requests.discard(request_id)
+                    self._finished_search_requests.append(request_id)
+    
+    def collect_network_stats(self) -> Dict[str, int]:
+        """
+        Drain the performance log and summarise traffic since the last call
+        
+        A blocked request never gets a response, so its size is unknown and
+        bytes_received only covers what actually downloaded.
+        
+        Returns:
+            Dict with total requests, blocked requests and bytes received
+        """
+        self._drain_performance_log()
+        stats = dict(self._network_totals)
+        for key in self._network_totals:
+            self._network_totals[key] = 0
+        return stats
+    
+    def collect_search_responses(self) -> List[str]:
+        """
+        Bodies of the search-results XHRs that finished since the last call
+        
+        Returns:
+            Raw response bodies (guarded JSON) in arrival order
+        """
+        self._drain_performance_log()
+        
+        bodies = []
+        finished, self._finished_search_requests = self._finished_search_requests, []
+        for request_id in finished:
+            try:
+                response = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                bodies.append(response.get('body', ''))
+            except Exception:
+                # Body already evicted from the DevTools buffer
+                continue
+        
+        return bodies
+    
+    def is_healthy(self) -> bool:
+        """Check that the browser is still alive and responding"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.execute_script("return document.readyState")
+            return len(self.driver.window_handles) > 0
+        except Exception:
+            return False
+    
     def reset_to_maps_home(self) -> bool:
         """Reset browser to Google Maps homepage"""
         try:
@@ -85,20 +227,16 @@ class DriverManager:
                 return False
             
             self.driver.get('https://maps.google.com')
-            time.sleep(2)
+            waiter = self.waiter()
             
-            # Clear search box
-            try:
-                search_box = WebDriverWait(self.driver, 5).until(
-                    EC.presence_of_element_located((
-                        By.CSS_SELECTOR, 
-                        'input[aria-label="Search Google Maps"], input[id="searchboxinput"]'
-                    ))
-                )
-                search_box.clear()
-                time.sleep(0.5)
-            except TimeoutException:
-                pass
+            # Clear search box once it is rendered
+            search_selector = 'input[aria-label="Search Google Maps"], input[id="searchboxinput"]'
+            if waiter.element_present('home_search_box', search_selector, 5):
+                try:
+                    search_box = self.driver.find_element(By.CSS_SELECTOR, search_selector)
+                    search_box.clear()
+                except Exception:
+                    pass
             
             # Close any open panels
             try:
@@ -109,7 +247,6 @@ class DriverManager:
                 for button in close_buttons:
                     try:
                         self.driver.execute_script("arguments[0].click();", button)
-                        time.sleep(0.3)
                     except:
                         pass
             except:
@@ -119,7 +256,6 @@ class DriverManager:
             try:
                 from selenium.webdriver.common.action_chains import ActionChains
                 ActionChains(self.driver).send_keys(Keys.ESCAPE).perform()
-                time.sleep(0.5)
             except:
                 pass
             
@@ -129,6 +265,26 @@ class DriverManager:
             print(f"Error resetting to maps home: {e}")
             return False
     
+    def accept_consent(self) -> bool:
+        """Click through the Google consent interstitial if it is showing"""
+        if not self.driver or 'consent.google' not in self.driver.current_url:
+            return False
+        
+        for selector in CONSENT_BUTTON_SELECTORS:
+            try:
+                buttons = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                if buttons:
+                    # The last button in the consent form is "Accept all"
+                    self.driver.execute_script("arguments[0].click();", buttons[-1])
+                    WebDriverWait(self.driver, 10).until(
+                        lambda d: 'consent.google' not in d.current_url
+                    )
+                    return True
+            except Exception:
+                continue
+        
+        return False
+    
     def quit(self):
         """Close the driver and cleanup temp directory"""
         if self.driver:
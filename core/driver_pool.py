@@ -0,0 +1,145 @@
+"""
+Pool of long-lived Chrome drivers shared across search tasks
+"""
+import itertools
+import threading
+from contextlib import contextmanager
+from queue import Queue, Empty
+from typing import List, Optional
+
+from config.settings import ScraperConfig
+from core.driver_manager import DriverManager
+
+
+class DriverPool:
+    """Keeps one driver per worker alive between tasks
+    
+    Tasks check a driver out with ``lease()`` and return it when done.
+    Returned drivers are reset to the Maps home page and reused; a driver
+    is recycled (quit and replaced lazily) once it has served
+    ``max_tasks_per_driver`` tasks or fails a health check.
+    """
+    
+    def __init__(self, config: ScraperConfig, size: Optional[int] = None, profile_template=None):
+        self.config = config
+        self.size = size or config.max_workers
+        self.profile_template = profile_template
+        self._proxies = itertools.cycle(config.proxies) if config.proxies else None
+        self._idle: Queue = Queue()
+        self._managers: List[DriverManager] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        
+        # Pool statistics
+        self.created = 0
+        self.recycled = 0
+    
+    def acquire(self) -> DriverManager:
+        """Check out a healthy driver, creating one if the pool is not full"""
+        while True:
+            if self._closed:
+                raise RuntimeError("Driver pool is closed")
+            
+            try:
+                manager = self._idle.get_nowait()
+            except Empty:
+                manager = self._create_if_room()
+                if manager is None:
+                    # Pool is full - wait for a driver to be returned or
+                    # for a recycled driver to free its slot
+                    try:
+                        manager = self._idle.get(timeout=1.0)
+                    except Empty:
+                        continue
+            
+            if manager.driver and manager.is_healthy():
+                return manager
+            
+            # Dead driver - replace it and try again
+            self._discard(manager)
+    
+    def release(self, manager: DriverManager, healthy: bool = True):
+        """Return a driver to the pool, recycling it if needed"""
+        manager.tasks_completed += 1
+        
+        if self._closed:
+            self._discard(manager)
+            return
+        
+        if not healthy or manager.tasks_completed >= self.config.max_tasks_per_driver:
+            self._discard(manager)
+            return
+        
+        # Reset state so the next task starts from a clean Maps page
+        if not manager.reset_to_maps_home():
+            self._discard(manager)
+            return
+        
+        self._idle.put(manager)
+    
+    @contextmanager
+    def lease(self):
+        """Context manager that checks a driver out and returns it"""
+        manager = self.acquire()
+        healthy = True
+        try:
+            yield manager
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.release(manager, healthy=healthy)
+    
+    def close(self):
+        """Quit every driver owned by the pool"""
+        with self._lock:
+            self._closed = True
+            managers = list(self._managers)
+            self._managers.clear()
+        
+        for manager in managers:
+            manager.quit()
+        
+        # Wake up any thread still waiting in acquire()
+        while True:
+            try:
+                self._idle.get_nowait()
+            except Empty:
+                break
+    
+    def _create_if_room(self) -> Optional[DriverManager]:
+        """Create a new driver if the pool has not reached its size"""
+        with self._lock:
+            if len(self._managers) >= self.size:
+                return None
+            proxy = next(self._proxies) if self._proxies else None
+            manager = DriverManager(self.config, profile_template=self.profile_template, proxy=proxy)
+            self._managers.append(manager)
+        
+        try:
+            manager.create_driver()
+        except Exception:
+            with self._lock:
+                if manager in self._managers:
+                    self._managers.remove(manager)
+            manager.quit()
+            raise
+        
+        self.created += 1
+        return manager
+    
+    def _discard(self, manager: DriverManager):
+        """Quit a driver and free its slot in the pool"""
+        manager.quit()
+        with self._lock:
+            if manager in self._managers:
+                self._managers.remove(manager)
+                self.recycled += 1
+    
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
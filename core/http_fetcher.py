@@ -0,0 +1,129 @@
+"""
+Browser-free place detail fetcher over pooled HTTP
+"""
+from typing import Optional
+from urllib.parse import urlencode, urlparse, parse_qsl, urlunparse
+
+import urllib3
+from urllib3.util import Retry, Timeout
+
+from config.settings import ScraperConfig
+from core.circuit_breaker import PageBlockedError
+from core.rate_limiter import get_rate_limiter
+from models.place import SearchTask, Place
+from utils.extractors import extract_coordinates_from_link
+from utils.payload_parser import (
+    extract_app_state_blobs,
+    find_place_darray,
+    place_fields_from_darray,
+    build_place_from_payload
+)
+
+
+def place_url_from_id(feature_id: str) -> str:
+    """Build a place URL from a feature ID (0x...:0x...)"""
+    return f"https://www.google.com/maps/place/data=!4m2!3m1!1s{feature_id}"
+
+
+class HttpPlaceFetcher:
+    """Fetches place pages without a browser and parses their embedded payload
+    
+    One fetcher is shared by all HTTP detail workers: the underlying
+    urllib3 pool keeps connections alive and is thread-safe.
+    """
+    
+    def __init__(self, config: ScraperConfig, pool_size: Optional[int] = None):
+        self.config = config
+        self.rate_limiter = get_rate_limiter(config) if config.adaptive_rate_limit else None
+        pool_size = pool_size or config.http_workers
+        
+        headers = {
+            'User-Agent': config.user_agent,
+            'Accept-Language': f"{config.language},en;q=0.8",
+            # Skip the consent interstitial
+            'Cookie': 'CONSENT=YES+cb',
+        }
+        retries = Retry(total=2, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+        timeout = Timeout(connect=5.0, read=config.http_timeout)
+        
+        if config.proxy:
+            proxy = config.proxy if '://' in config.proxy else f"http://{config.proxy}"
+            self.http = urllib3.ProxyManager(
+                proxy, num_pools=4, maxsize=pool_size, block=True,
+                headers=headers, retries=retries, timeout=timeout
+            )
+        else:
+            self.http = urllib3.PoolManager(
+                num_pools=4, maxsize=pool_size, block=True,
+                headers=headers, retries=retries, timeout=timeout
+            )
+    
+    def fetch_html(self, url: str) -> Optional[str]:
+        """
+        GET a URL and return its body, or None on failure
+        
+        A 403, 429 or redirect to Google's /sorry/ page raises
+        PageBlockedError so callers re-queue the work and trip their breaker.
+        """
+        try:
+            response = self.http.request('GET', self._with_language(url))
+        except Exception as e:
+            print(f"  HTTP fetch failed: {e}")
+            self._signal('timeout')
+            return None
+        
+        if response.status in (403, 429) or '/sorry/' in (response.geturl() or ''):
+            self._signal('blocked')
+            raise PageBlockedError(f"HTTP {response.status} for {url}")
+        
+        if response.status != 200:
+            print(f"  HTTP {response.status} for place page")
+            return None
+        
+        self._signal('ok')
+        return response.data.decode('utf-8', errors='replace')
+    
+    def _signal(self, outcome: str):
+        """Report a response outcome to the shared rate limiter"""
+        if not self.rate_limiter:
+            return
+        if outcome == 'ok':
+            self.rate_limiter.record_success()
+        else:
+            self.rate_limiter.record_failure(outcome)
+    
+    def fetch_place(self, href_or_id: str, task: SearchTask) -> Optional[Place]:
+        """
+        Fetch one place by URL or feature ID and parse it into a Place
+        
+        Args:
+            href_or_id: Place URL or feature ID
+            task: Task the place is attributed to
+            
+        Returns:
+            Place object, or None if the page carried no place payload
+        """
+        url = href_or_id if href_or_id.startswith('http') else place_url_from_id(href_or_id)
+        html = self.fetch_html(url)
+        if not html:
+            return None
+        
+        darray = find_place_darray(extract_app_state_blobs(html))
+        if darray is None:
+            return None
+        
+        place = build_place_from_payload(place_fields_from_darray(darray), url, task)
+        if place.latitude is None:
+            place.latitude, place.longitude = extract_coordinates_from_link(url)
+        return place
+    
+    def close(self):
+        """Close all pooled connections"""
+        self.http.clear()
+    
+    def _with_language(self, url: str) -> str:
+        """Add the hl= language parameter so text fields come back localised"""
+        parts = urlparse(url)
+        query = dict(parse_qsl(parts.query))
+        query.setdefault('hl', self.config.language)
+        return urlunparse(parts._replace(query=urlencode(query)))
@@ -2,17 +2,38 @@
 Scraper orchestrator with multi-threading support
 """
 import os
+import json
 import time
+import random
+import itertools
+import multiprocessing
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor, as_completed, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from queue import Queue, Empty
 from threading import Lock
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from models.place import SearchTask, Place
+from models.place import SearchTask, Place, PLACE_COLUMNS
 from config.settings import ScraperConfig
 from core.driver_manager import DriverManager
-from core.search_engine import MapsSearchEngine
+from core.driver_pool import DriverPool
+from core.detail_backends import DetailBackend, BrowserDetailBackend, HttpDetailBackend
+from core.http_fetcher import HttpPlaceFetcher
+from core.rate_limiter import get_rate_limiter, reset_rate_limiter
+from core.profile_template import ProfileTemplate
+from core.result_writer import IncrementalCsvWriter
+from core.run_journal import RunJournal, JournalState, load_journal
+from core import process_worker
+from core.cdp_engine import CdpExecutor
+from core.search_engine import MapsSearchEngine, PageBlockedError
+from core.circuit_breaker import WorkerBreakers
+from core.waits import WaitStats
+from utils.extractors import canonical_place_id
+from utils.task_generator import TaskGenerator
 
 
 class ScraperOrchestrator:
@@ -23,6 +44,21 @@ class ScraperOrchestrator:
         self.results: List[Place] = []
         self.lock = Lock()
         self.seen_links = set()
+        self.driver_pool: Optional[DriverPool] = None
+        self.profile_template: Optional[ProfileTemplate] = None
+        self.http_backend: Optional[HttpDetailBackend] = None  # Shared when detail_backend == "http"
+        self.incremental_writer: Optional[IncrementalCsvWriter] = None  # Streams rows to incremental_all.csv
+        self.journal: Optional[RunJournal] = None  # Run journal in checkpoint_dir
+        self.resume_state: Optional[JournalState] = None  # Set while resuming a journaled run
+        self.wait_stats = WaitStats()  # Readiness wait timings across the run
+        self.search_stats = Counter()  # Search engine counters across the run
+        self.breakers = WorkerBreakers(config.block_breaker_threshold, config.block_breaker_cooldown)
+        self.block_wasted_seconds = 0.0  # Time spent on task attempts that ended in a block
+        self._proxies = itertools.cycle(config.proxies) if config.proxies else None
+        self.feed_sizes: Dict[int, int] = {}  # id(task) -> hrefs its feed returned
+        self.expanded_place_ids = set()  # (keyword, place_id) already collected by an expanded task
+        self.expanded_task_ids = set()  # id(task) for tasks created by expanding a saturated one
+        self.expansions: List[Dict] = []  # Parent -> children edges of the expansion tree
         
         # Create output directories
         os.makedirs(self.config.output_dir, exist_ok=True)
@@ -45,82 +81,91 @@ class ScraperOrchestrator:
         
         start_time = time.time()
         
+        # Every run starts its shared rate limiter from this run's config
+        reset_rate_limiter()
+        
+        # The CDP engine launches and recycles its own browsers
+        uses_selenium = self.config.engine != 'cdp'
+        
+        if uses_selenium and self.config.use_profile_template:
+            self._build_profile_template()
+        
+        if uses_selenium and self.config.reuse_drivers:
+            self.driver_pool = DriverPool(self.config, profile_template=self.profile_template)
+        
+        if self.config.detail_backend == 'http':
+            self.http_backend = HttpDetailBackend(HttpPlaceFetcher(self.config))
+        
+        self.incremental_writer = IncrementalCsvWriter(
+            os.path.join(self.config.output_dir, "incremental_all.csv"),
+            fsync_interval=self.config.incremental_fsync_interval,
+            background=self.config.background_writer
+        )
+        
+        # Journal the run so it can be resumed after a crash
+        if self.resume_state:
+            self.journal = RunJournal(self.resume_state.path)
+            self.incremental_writer.append(self.results)
+        else:
+            self.journal = RunJournal(RunJournal.new_path(self.config.checkpoint_dir))
+            self.journal.run_started(tasks, self.config)
+        print(f"Run journal: {self.journal.path}")
+        
         # Execute tasks in parallel
-        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
-            # Submit all tasks
-            future_to_task = {
-                executor.submit(self._execute_task, task): task 
-                for task in tasks
-            }
-            
-            # Process completed tasks
-            completed = 0
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
-                completed += 1
-                
-                try:
-                    places = future.result()
-                    
-                    # Thread-safe addition of all results (including duplicates)
-                    with self.lock:
-                        self.results.extend(places)
-                    
-                    print(f"\n[{completed}/{len(tasks)}] Completed: {task}")
-                    print(f"  Found {len(places)} places")
-                    print(f"  Total places so far: {len(self.results)}")
-                    
-                    # Save THIS task's results immediately to its own CSV
-                    try:
-                        if len(places) > 0:
-                            # Create DataFrame for just this task
-                            task_df = pd.DataFrame([place.to_dict() for place in places])
-                            
-                            # Reorder columns
-                            column_order = [
-                                'name', 'category', 'address', 'subdistrict', 'district', 'city', 'province', 'zip_code',
-                                'latitude', 'longitude', 'rating', 'reviews_count',
-                                'phone', 'website', 'google_maps_link', 'opening_hours',
-                                'star_1', 'star_2', 'star_3', 'star_4', 'star_5',
-                                'search_keyword', 'search_location', 'scraped_at'
-                            ]
-                            column_order = [col for col in column_order if col in task_df.columns]
-                            task_df = task_df[column_order]
-                            
-                            # Create safe filename from task
-                            safe_keyword = task.keyword.replace(' ', '_').replace('/', '_')
-                            safe_location = task.location.replace(' ', '_').replace(',', '').replace('/', '_')
-                            task_filename = f"task_{completed:03d}_{safe_keyword}_{safe_location}.csv"
-                            
-                            task_csv = os.path.join(
-                                self.config.output_dir,
-                                task_filename
-                            )
-                            
-                            # Save immediately - this task only
-                            task_df.to_csv(task_csv, index=False, sep='|')
-                            print(f"  💾 Saved task file: {task_filename} ({len(places)} places)")
-                        
-                        # Also update the combined incremental file
-                        incremental_df = self._create_dataframe()
-                        incremental_csv = os.path.join(
-                            self.config.output_dir,
-                            "incremental_all.csv"
-                        )
-                        incremental_df.to_csv(incremental_csv, index=False, sep='|')
-                        print(f"  💾 Updated combined: incremental_all.csv ({len(self.results)} total places)")
-                        
-                    except Exception as e:
-                        print(f"  ⚠️  Save failed: {e}")
-                    
-                except Exception as e:
-                    print(f"\n[{completed}/{len(tasks)}] Failed: {task}")
-                    print(f"  Error: {e}")
+        try:
+            if self.config.pipeline == 'two_phase':
+                self._run_two_phase(tasks)
+            else:
+                self._run_tasks(tasks)
+        finally:
+            if self.driver_pool:
+                print(f"Closing driver pool ({self.driver_pool.created} browsers started, "
+                      f"{self.driver_pool.recycled} recycled)")
+                self.driver_pool.close()
+                self.driver_pool = None
+            if self.profile_template:
+                self.profile_template.cleanup()
+                self.profile_template = None
+            if self.http_backend:
+                self.http_backend.close()
+                self.http_backend = None
+            try:
+                rows = self.incremental_writer.compact()
+                print(f"Compacted incremental_all.csv ({rows} rows)")
+            except Exception as e:
+                print(f"⚠️  Could not compact incremental_all.csv: {e}")
+            self.incremental_writer = None
+            self.journal.close()
+            self.journal = None
+            self.resume_state = None
         
         elapsed = time.time() - start_time
         print(f"\n{'='*70}")
         print(f"Scraping completed in {elapsed:.2f} seconds")
         print(f"Total places collected: {len(self.results)}")
+        if self.search_stats['url_searches']:
+            print(f"URL search fallbacks: {self.search_stats['url_fallbacks']}/"
+                  f"{self.search_stats['url_searches']}")
+        if self.config.extraction_backend == 'payload':
+            print(f"Payload extraction: {self.search_stats['payload_hits']} hits, "
+                  f"{self.search_stats['payload_fallbacks']} DOM fallbacks")
+        self._print_rate_metrics()
+        if self.search_stats['blocked_attempts']:
+            print(f"Blocked task attempts: {self.search_stats['blocked_attempts']} "
+                  f"({self.block_wasted_seconds:.0f}s wasted, "
+                  f"{self.search_stats['blocked_requeues']} re-queued, "
+                  f"breakers opened {self.breakers.times_opened()}x)")
+        if self.search_stats['out_of_area_skipped'] or self.search_stats['out_of_area_stops']:
+            print(f"Out-of-area places skipped: {self.search_stats['out_of_area_skipped']} "
+                  f"({self.search_stats['out_of_area_stops']} feeds stopped early)")
+        if self.expansions:
+            print(f"Saturated tasks expanded: {self.search_stats['subdistricts_expanded']} districts, "
+                  f"{self.search_stats['tiles_expanded']} tiles "
+                  f"({self.search_stats['tiles_at_max_depth']} tiles still saturated at max depth)")
+            self._save_expansion_tree()
+        print(f"Time spent in readiness waits: {self.wait_stats.total_seconds():.1f}s")
+        for line in self.wait_stats.summary_lines():
+            print(f"  - {line}")
         print(f"{'='*70}\n")
         
         # Convert to DataFrame
@@ -150,13 +195,585 @@ class ScraperOrchestrator:
         
         return df
     
+    def resume(self, journal_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        Resume a crashed or interrupted run from its journal
+        
+        Completed tasks are skipped and their places restored. In-flight tasks
+        are run again, skipping the hrefs they already extracted. The config
+        must match the journaled run's RUN_SETTINGS (pipeline, detail level,
+        backends, ...); JournalState.config_for_resume builds one that does.
+        
+        Args:
+            journal_path: Journal to resume (defaults to the latest in checkpoint_dir)
+            
+        Returns:
+            DataFrame with all collected places, restored and new
+        """
+        journal_path = journal_path or RunJournal.latest(self.config.checkpoint_dir)
+        if not journal_path:
+            raise FileNotFoundError(f"No run journal found in {self.config.checkpoint_dir}")
+        
+        state = load_journal(journal_path)
+        if not state.settings:
+            raise ValueError(f"{journal_path} does not record its run settings, so it cannot be resumed safely")
+        mismatches = state.settings_mismatches(self.config)
+        if mismatches:
+            raise ValueError(f"Config differs from the journaled run ({'; '.join(mismatches)})")
+        
+        in_flight = state.in_flight()
+        print(f"Resuming {journal_path}: {len(state.completed)}/{len(state.tasks)} tasks completed, "
+              f"{len(in_flight)} in flight, {len(state.places)} places restored")
+        
+        self.resume_state = state
+        self.results = list(state.places)
+        return self.scrape_tasks(state.tasks)
+    
+    def _is_resumed_complete(self, task: SearchTask) -> bool:
+        """Whether a resumed run already completed this task"""
+        return bool(self.resume_state) and self.resume_state.is_completed(task)
+    
+    def _journal_places(self, search_engine: MapsSearchEngine, task: SearchTask):
+        """Journal every href the engine processes, skipping ones a resumed run already did"""
+        if self.resume_state:
+            search_engine.completed_hrefs = self.resume_state.done_hrefs.get(task.key(), set())
+        search_engine.on_place = lambda href, place: self.journal.places_persisted(
+            task, href, [place] if place else []
+        )
+    
+    def _build_profile_template(self):
+        """Seed the Chrome profile template shared by every driver in this run"""
+        template = ProfileTemplate(self.config)
+        try:
+            template.build()
+            self.profile_template = template
+            print("Profile template ready (consent accepted, caches warmed)")
+        except Exception as e:
+            template.cleanup()
+            print(f"⚠️  Could not build profile template, using blank profiles: {e}")
+    
+    def _run_tasks(self, tasks: List[SearchTask]):
+        """Run tasks on the thread (or process) pool and save results as they complete"""
+        tasks = [task for task in tasks if not self._is_resumed_complete(task)]  # Grows as saturated tiles are split
+        
+        if self.config.engine == 'cdp':
+            # One event loop drives every tab; workers are tabs, not threads
+            done_hrefs = self.resume_state.done_hrefs if self.resume_state else {}
+            with CdpExecutor(self.config, self.breakers, self.journal, done_hrefs) as executor:
+                self._consume_tasks(executor, executor.run_task, tasks)
+            self.search_stats['blocked_attempts'] += executor.blocked_attempts
+            self.block_wasted_seconds += executor.block_wasted_seconds
+            return
+        
+        if self.config.execution_mode == 'process':
+            self._run_tasks_in_processes(tasks)
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            self._consume_tasks(executor, self._execute_task, tasks)
+    
+    def _run_tasks_in_processes(self, tasks: List[SearchTask]):
+        """
+        Run tasks on a process pool where each process owns its own browser
+        
+        Workers send back compact row batches. If a worker dies, its process
+        group (chromedriver and Chrome included) is killed and the tasks the
+        crash took down are run once more on a fresh pool.
+        """
+        context = multiprocessing.get_context('spawn')
+        pid_queue = context.Queue()
+        done_hrefs = self.resume_state.done_hrefs if self.resume_state else {}
+        worker_pids: List[int] = []
+        
+        for attempt in range(2):
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    mp_context=context,
+                    initializer=process_worker.init_worker,
+                    initargs=(self.config, self.journal.path, done_hrefs, self.profile_template, pid_queue)
+                ) as executor:
+                    crashed = self._consume_tasks(executor, process_worker.run_task, tasks)
+            finally:
+                while not pid_queue.empty():
+                    worker_pids.append(pid_queue.get())
+                killed = process_worker.kill_process_groups(worker_pids)
+                if killed:
+                    print(f"Killed {killed} leftover worker process groups")
+            
+            if not crashed:
+                break
+            
+            self.search_stats['worker_crashes'] += 1
+            print(f"\n⚠️  A worker process crashed - {len(crashed)} tasks lost with it")
+            if attempt == 0:
+                print(f"Re-running them on a fresh process pool")
+                tasks = crashed
+    
+    def _task_places(self, task: SearchTask, result) -> List[Place]:
+        """Places from a task result - unpacking a worker process's batch if needed"""
+        if not isinstance(result, dict):
+            return result
+        
+        with self.lock:
+            self.feed_sizes[id(task)] = result['feed_size']
+            self.search_stats.update(result['search_stats'])
+        self.wait_stats.merge_snapshot(result['wait_stats'])
+        return process_worker.rows_to_places(result['rows'])
+    
+    def _consume_tasks(self, executor: Executor, fn, tasks: List[SearchTask]) -> List[SearchTask]:
+        """
+        Submit tasks to the executor and save results as they complete
+        
+        Returns:
+            Tasks lost to a crashed worker process (always empty for threads)
+        """
+        crashed = []
+        
+        # Submit all tasks
+        future_to_task = {
+            executor.submit(fn, task): task 
+            for task in tasks
+        }
+        
+        # Process completed tasks (blocked tasks are re-queued, not yielded)
+        completed = 0
+        for future in self._completed_futures(executor, future_to_task, fn):
+            task = future_to_task[future]
+            completed += 1
+            
+            try:
+                places = self._task_places(task, future.result())
+                children = self._expand_if_saturated(executor, fn, task, future_to_task, tasks)
+                if children or task.is_tile or id(task) in self.expanded_task_ids:
+                    places = self._merge_expanded_places(task, places)
+                
+                # Thread-safe addition of all results (including duplicates)
+                with self.lock:
+                    self.results.extend(places)
+                self.journal.task_completed(task, len(places))
+                
+                print(f"\n[{completed}/{len(tasks)}] Completed: {task}")
+                print(f"  Found {len(places)} places")
+                print(f"  Total places so far: {len(self.results)}")
+                self._print_rate_metrics()
+                
+                # Save THIS task's results immediately to its own CSV
+                try:
+                    if len(places) > 0:
+                        # Create DataFrame for just this task
+                        task_df = pd.DataFrame([place.to_dict() for place in places])
+                        
+                        # Reorder columns
+                        column_order = [col for col in PLACE_COLUMNS if col in task_df.columns]
+                        task_df = task_df[column_order]
+                        
+                        # Create safe filename from task
+                        safe_keyword = task.keyword.replace(' ', '_').replace('/', '_')
+                        safe_location = task.location.replace(' ', '_').replace(',', '').replace('/', '_')
+                        task_filename = f"task_{completed:03d}_{safe_keyword}_{safe_location}.csv"
+                        
+                        task_csv = os.path.join(
+                            self.config.output_dir,
+                            task_filename
+                        )
+                        
+                        # Save immediately - this task only
+                        task_df.to_csv(task_csv, index=False, sep='|')
+                        print(f"  💾 Saved task file: {task_filename} ({len(places)} places)")
+                    
+                    # Also append this task's rows to the combined incremental file
+                    self.incremental_writer.append(places)
+                    print(f"  💾 Appended to combined: incremental_all.csv ({len(self.results)} total places)")
+                
+                except Exception as e:
+                    print(f"  ⚠️  Save failed: {e}")
+            
+            except BrokenProcessPool:
+                crashed.append(task)
+            except Exception as e:
+                print(f"\n[{completed}/{len(tasks)}] Failed: {task}")
+                print(f"  Error: {e}")
+        
+        return crashed
+    
+    @contextmanager
+    def _driver_session(self):
+        """Yield a driver for one unit of work - pooled when reuse is enabled"""
+        if self.driver_pool:
+            with self.driver_pool.lease() as driver_manager:
+                yield driver_manager
+        else:
+            proxy = next(self._proxies) if self._proxies else None
+            with DriverManager(self.config, profile_template=self.profile_template, proxy=proxy) as driver_manager:
+                yield driver_manager
+    
+    def _completed_futures(self, executor: Executor, future_to_task: Dict, fn):
+        """
+        Yield futures as they complete, re-queueing tasks that hit a block page
+        
+        A task whose future raised PageBlockedError is submitted again (up to
+        max_block_requeues times) instead of being reported as failed. Futures
+        the caller adds to future_to_task while iterating are picked up too.
+        """
+        handled = set()
+        requeues: Dict[int, int] = {}
+        
+        while True:
+            pending = set(future_to_task) - handled
+            if not pending:
+                break
+            
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                handled.add(future)
+                task = future_to_task[future]
+                if isinstance(future.exception(), PageBlockedError):
+                    attempts = requeues.get(id(task), 0)
+                    if attempts < self.config.max_block_requeues:
+                        requeues[id(task)] = attempts + 1
+                        with self.lock:
+                            self.search_stats['blocked_requeues'] += 1
+                        print(f"\n⛔ Blocked: {task} - re-queued ({attempts + 1}/{self.config.max_block_requeues})")
+                        future_to_task[executor.submit(fn, task)] = task
+                        continue
+                yield future
+    
+    def _expand_if_saturated(self, executor: Executor, fn, task: SearchTask,
+                             future_to_task: Dict, tasks: List[SearchTask]) -> List[SearchTask]:
+        """
+        Queue narrower tasks for a task whose feed hit the result cap
+        
+        Tiles are split into quadrants; district tasks are expanded into their
+        subdistricts. Tasks that did not saturate are left alone.
+        
+        Returns:
+            The child tasks that were queued (empty if none)
+        """
+        with self.lock:
+            feed_size = self.feed_sizes.pop(id(task), 0)
+        if feed_size < min(self.config.tile_split_threshold, task.max_results):
+            return []
+        
+        if task.is_tile:
+            if task.tile_depth >= self.config.max_tile_depth:
+                self.search_stats['tiles_at_max_depth'] += 1
+                print(f"  ⚠️  Tile {task.tile_id} still saturated at max depth ({feed_size} results)")
+                return []
+            kind, children = 'tiles', TaskGenerator.split_tile(task)
+        elif self.config.expand_saturated_districts and task.district and not task.subdistrict:
+            kind, children = 'subdistricts', TaskGenerator.split_district(task)
+            if not children:
+                print(f"  ⚠️  {task} saturated ({feed_size} results) but no subdistricts are known")
+                return []
+        else:
+            return []
+        
+        for child in children:
+            self.journal.task_added(child, task)
+            self.expanded_task_ids.add(id(child))
+            future_to_task[executor.submit(fn, child)] = child
+        tasks.extend(children)
+        
+        self.search_stats[f'{kind}_expanded'] += 1
+        self.expansions.append({
+            'task': str(task),
+            'kind': kind,
+            'feed_size': feed_size,
+            'children': [str(child) for child in children]
+        })
+        print(f"  🔲 {task} saturated ({feed_size} results) - expanded into {len(children)} {kind}")
+        return children
+    
+    def _merge_expanded_places(self, task: SearchTask, places: List[Place]) -> List[Place]:
+        """Drop places an overlapping expanded task for the same keyword already collected"""
+        merged = []
+        with self.lock:
+            for place in places:
+                key = (task.keyword, place.place_id or place.google_maps_link)
+                if key not in self.expanded_place_ids:
+                    self.expanded_place_ids.add(key)
+                    merged.append(place)
+        return merged
+    
+    def _save_expansion_tree(self):
+        """Write the saturated-task expansion tree to expansion_tree.json in output_dir"""
+        children_of = {edge['task']: edge for edge in self.expansions}
+        child_names = {child for edge in self.expansions for child in edge['children']}
+        
+        def build(name: str) -> Dict:
+            edge = children_of.get(name)
+            if not edge:
+                return {'task': name}
+            return {
+                'task': name,
+                'kind': edge['kind'],
+                'feed_size': edge['feed_size'],
+                'children': [build(child) for child in edge['children']]
+            }
+        
+        tree = [build(edge['task']) for edge in self.expansions if edge['task'] not in child_names]
+        path = os.path.join(self.config.output_dir, "expansion_tree.json")
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(tree, f, indent=2, ensure_ascii=False)
+            print(f"Expansion tree saved: {path}")
+        except Exception as e:
+            print(f"⚠️  Could not save expansion tree: {e}")
+    
+    def _run_guarded(self, task: SearchTask, work):
+        """
+        Run work(search_engine) for a task behind this worker's circuit breaker
+        
+        On a block page the driver is discarded (a fresh profile, and the next
+        proxy if configured, is used next time), the wasted time is recorded
+        and PageBlockedError propagates so the task gets re-queued.
+        """
+        breaker = self.breakers.current()
+        paused = breaker.wait_until_closed()
+        if paused:
+            print(f"  Worker resumed after {paused:.0f}s circuit-breaker pause")
+        
+        start = time.time()
+        try:
+            with self._driver_session() as driver_manager:
+                search_engine = MapsSearchEngine(driver_manager, self.config, detail_backend=self.http_backend)
+                try:
+                    result = work(search_engine)
+                    with self.lock:
+                        self.feed_sizes[id(task)] = search_engine.feed_size
+                finally:
+                    self._record_engine_stats(search_engine)
+        except PageBlockedError:
+            wasted = time.time() - start
+            breaker.record_block()
+            with self.lock:
+                self.search_stats['blocked_attempts'] += 1
+                self.block_wasted_seconds += wasted
+            state = "breaker open, pausing worker" if breaker.is_open else "rotating driver"
+            print(f"  ⛔ Block page on {task} after {wasted:.1f}s ({state})")
+            raise
+        
+        breaker.record_success()
+        return result
+    
     def _execute_task(self, task: SearchTask) -> List[Place]:
         """Execute a single search task (runs in separate thread)"""
-        # Each thread gets its own driver
-        with DriverManager(self.config) as driver_manager:
-            search_engine = MapsSearchEngine(driver_manager, self.config)
-            places = search_engine.search(task)
-            return places
+        self.journal.task_started(task)
+        
+        def work(search_engine: MapsSearchEngine) -> List[Place]:
+            self._journal_places(search_engine, task)
+            return search_engine.search(task)
+        
+        return self._run_guarded(task, work)
+    
+    def _run_two_phase(self, tasks: List[SearchTask]):
+        """
+        Discover hrefs for every task first, then extract each unique place once
+        
+        Phase one runs every task's search and scroll. Hrefs are deduplicated by
+        canonical place ID across all tasks, keeping every (keyword, location)
+        that surfaced each place. Phase two feeds the unique places to all
+        workers through a shared queue.
+        """
+        tasks = list(tasks)  # Grows as saturated tiles are split
+        
+        # Phase 1: discovery
+        registry: Dict[str, Dict] = {}  # place_id -> {'href', 'task', 'sources'}
+        total_hrefs = 0
+        
+        # A resumed run reuses the hrefs its completed discovery tasks found
+        if self.resume_state:
+            for task in [task for task in tasks if self._is_resumed_complete(task)]:
+                hrefs = self.resume_state.completed[task.key()].get('hrefs') or []
+                total_hrefs += len(hrefs)
+                self._register_hrefs(registry, task, hrefs)
+                tasks.remove(task)
+        
+        with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+            future_to_task = {
+                executor.submit(self._discover_task, task): task
+                for task in tasks
+            }
+            
+            completed = 0
+            for future in self._completed_futures(executor, future_to_task, self._discover_task):
+                task = future_to_task[future]
+                completed += 1
+                
+                try:
+                    hrefs = future.result()
+                except Exception as e:
+                    print(f"\n[{completed}/{len(tasks)}] Discovery failed: {task}")
+                    print(f"  Error: {e}")
+                    continue
+                
+                total_hrefs += len(hrefs)
+                self._register_hrefs(registry, task, hrefs)
+                self.journal.task_completed(task, len(hrefs), hrefs=hrefs)
+                
+                print(f"\n[{completed}/{len(tasks)}] Discovered: {task}")
+                print(f"  {len(hrefs)} hrefs, {len(registry)} unique places so far")
+                
+                self._expand_if_saturated(executor, self._discover_task, task, future_to_task, tasks)
+        
+        print(f"\n{'='*70}")
+        print(f"Discovery complete: {total_hrefs} hrefs -> {len(registry)} unique places")
+        if total_hrefs:
+            print(f"Detail page loads saved by dedup: {total_hrefs - len(registry)} "
+                  f"({(total_hrefs - len(registry)) / total_hrefs * 100:.1f}%)")
+        print(f"{'='*70}\n")
+        
+        # Phase 2: shared detail queue
+        detail_queue: Queue = Queue()
+        persisted = self.resume_state.persisted_ids if self.resume_state else set()
+        for place_id, entry in registry.items():
+            if place_id not in persisted:
+                detail_queue.put((place_id, entry))
+        if persisted:
+            print(f"Skipping {len(registry) - detail_queue.qsize()} places extracted before the resume")
+        
+        progress = {'done': 0, 'total': detail_queue.qsize()}
+        
+        # HTTP workers need no browser, so many more of them can run at once
+        if self.http_backend:
+            worker_fn, worker_count = self._http_detail_worker, self.config.http_workers
+        else:
+            worker_fn, worker_count = self._detail_worker, self.config.max_workers
+        worker_count = min(worker_count, progress['total'])
+        
+        with ThreadPoolExecutor(max_workers=max(worker_count, 1)) as executor:
+            workers = [
+                executor.submit(worker_fn, detail_queue, progress)
+                for _ in range(worker_count)
+            ]
+            for future in as_completed(workers):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"  ⚠️  Detail worker stopped: {e}")
+    
+    def _register_hrefs(self, registry: Dict[str, Dict], task: SearchTask, hrefs: List[str]):
+        """Add a discovery task's hrefs to the registry, deduplicated by place ID"""
+        source = f"{task.keyword} @ {task.location}"
+        for href in hrefs:
+            place_id = canonical_place_id(href)
+            entry = registry.setdefault(place_id, {'href': href, 'task': task, 'sources': []})
+            if source not in entry['sources']:
+                entry['sources'].append(source)
+    
+    def _discover_task(self, task: SearchTask) -> List[str]:
+        """Run discovery for a single task (runs in separate thread)"""
+        self.journal.task_started(task)
+        return self._run_guarded(task, lambda search_engine: search_engine.discover(task))
+    
+    def _detail_worker(self, detail_queue: Queue, progress: Dict[str, int]):
+        """Extract places from the shared queue in a browser (runs in separate thread)"""
+        breaker = self.breakers.current()
+        
+        while not detail_queue.empty():
+            breaker.wait_until_closed()
+            start = time.time()
+            try:
+                with self._driver_session() as driver_manager:
+                    search_engine = MapsSearchEngine(driver_manager, self.config)
+                    try:
+                        self._drain_detail_queue(
+                            BrowserDetailBackend(search_engine), detail_queue, progress,
+                            search_engine.pause_between_places
+                        )
+                    finally:
+                        self._record_engine_stats(search_engine)
+            except PageBlockedError:
+                # The blocked place was put back on the queue; rotate the driver
+                breaker.record_block()
+                with self.lock:
+                    self.search_stats['blocked_attempts'] += 1
+                    self.block_wasted_seconds += time.time() - start
+                continue
+            breaker.record_success()
+    
+    def _http_detail_worker(self, detail_queue: Queue, progress: Dict[str, int]):
+        """Extract places from the shared queue over HTTP (runs in separate thread)"""
+        if self.config.adaptive_rate_limit:
+            pause = get_rate_limiter(self.config).acquire
+        else:
+            pause = lambda: time.sleep(random.uniform(self.config.min_delay, self.config.max_delay))
+        
+        breaker = self.breakers.current()
+        while not detail_queue.empty():
+            breaker.wait_until_closed()
+            start = time.time()
+            try:
+                self._drain_detail_queue(self.http_backend, detail_queue, progress, pause)
+            except PageBlockedError:
+                # The blocked place was put back on the queue; back off before retrying
+                breaker.record_block()
+                with self.lock:
+                    self.search_stats['blocked_attempts'] += 1
+                    self.block_wasted_seconds += time.time() - start
+                continue
+            breaker.record_success()
+    
+    def _drain_detail_queue(self, backend: DetailBackend, detail_queue: Queue,
+                            progress: Dict[str, int], pause):
+        """Fetch places from the shared queue with the given backend until it is empty"""
+        while True:
+            try:
+                place_id, entry = detail_queue.get_nowait()
+            except Empty:
+                break
+            
+            with self.lock:
+                progress['done'] += 1
+                idx = progress['done'] - 1
+            
+            try:
+                place = backend.fetch_place(entry['href'], entry['task'], idx, progress['total'])
+            except PageBlockedError:
+                # Give the place back so another (or a fresh) driver retries it
+                entry['blocks'] = entry.get('blocks', 0) + 1
+                if entry['blocks'] <= self.config.max_block_requeues:
+                    detail_queue.put((place_id, entry))
+                    with self.lock:
+                        progress['done'] -= 1
+                        self.search_stats['blocked_requeues'] += 1
+                raise
+            
+            if place:
+                # Keep provenance: every search that surfaced this place
+                place.place_id = place.place_id or place_id
+                place.sources = "; ".join(entry['sources'])
+                with self.lock:
+                    self.results.append(place)
+                self.incremental_writer.append([place])
+                print(f"  [{idx+1}/{progress['total']}] ✓ {place.name}")
+            
+            # Journal the href even without a place so a resume does not retry it
+            self.journal.places_persisted(entry['task'], entry['href'], [place] if place else [], place_id=place_id)
+            
+            pause()
+    
+    def rate_limiter_metrics(self) -> Dict:
+        """Current shared rate limiter metrics (empty if adaptive limiting is off)"""
+        if not self.config.adaptive_rate_limit:
+            return {}
+        return get_rate_limiter(self.config).metrics()
+    
+    def _print_rate_metrics(self):
+        """Print the shared rate limiter's current state"""
+        metrics = self.rate_limiter_metrics()
+        if not metrics:
+            return
+        state = f"cooldown {metrics['cooldown_remaining']}s" if metrics['in_cooldown'] else "normal"
+        print(f"  Rate: limit {metrics['rate_limit']}/s, observed {metrics['observed_rate']}/s, "
+              f"{metrics['backoffs']} backoffs ({state})")
+    
+    def _record_engine_stats(self, search_engine: MapsSearchEngine):
+        """Fold one task's search engine stats into the run totals"""
+        self.wait_stats.merge(search_engine.wait_stats)
+        with self.lock:
+            self.search_stats.update(search_engine.search_stats)
     
     def _create_dataframe(self) -> pd.DataFrame:
         """Convert results to pandas DataFrame"""
@@ -166,17 +783,8 @@ class ScraperOrchestrator:
         data = [place.to_dict() for place in self.results]
         df = pd.DataFrame(data)
         
-        # Reorder columns for better readability
-        column_order = [
-            'name', 'category', 'address', 'subdistrict', 'district', 'city', 'province', 'zip_code',
-            'latitude', 'longitude', 'rating', 'reviews_count',
-            'phone', 'website', 'google_maps_link', 'opening_hours',
-            'star_1', 'star_2', 'star_3', 'star_4', 'star_5',
-            'search_keyword', 'search_location', 'scraped_at'
-        ]
-        
-        # Only include columns that exist
-        column_order = [col for col in column_order if col in df.columns]
+        # Reorder columns for better readability (only columns that exist)
+        column_order = [col for col in PLACE_COLUMNS if col in df.columns]
         df = df[column_order]
         
         return df
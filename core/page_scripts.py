@@ -0,0 +1,281 @@
+"""
+JavaScript snippets injected into Google Maps pages
+
+Each script does its DOM work inside the browser and returns plain JSON,
+so a whole extraction step costs a single WebDriver round trip.
+"""
+
+# Collects every Place field from an open place panel. Selector fallbacks
+# mirror the order the Python extractor used to try them in.
+PLACE_DETAILS_SCRIPT = """
+function firstText(selectors) {
+    for (var i = 0; i < selectors.length; i++) {
+        var el = document.querySelector(selectors[i]);
+        if (el && el.innerText && el.innerText.trim()) {
+            return el.innerText.trim();
+        }
+    }
+    return null;
+}
+
+function ariaValue(selector) {
+    var els = document.querySelectorAll(selector);
+    for (var i = 0; i < els.length; i++) {
+        var aria = els[i].getAttribute('aria-label');
+        if (aria && aria.indexOf(':') >= 0) {
+            return aria.split(':').slice(1).join(':').trim();
+        }
+    }
+    return null;
+}
+
+var ratingBlock = document.querySelector('div.F7nice');
+var website = document.querySelector('a[data-item-id="authority"]');
+var hours = document.querySelector('button[data-item-id*="oh"]');
+var starRows = Array.prototype.slice.call(document.querySelectorAll('tr.BHOKXe'), 0, 5);
+
+return {
+    name: firstText(['h1.DUwDvf', 'h1.fontHeadlineLarge', 'h1']),
+    category: firstText(['button.DkEaL', 'div.LBgpqf button', 'button[jsaction*="category"]']),
+    address: firstText(['button[data-item-id="address"]', 'div.rogA2c', 'button[aria-label*="Address"]']),
+    address_aria: ariaValue('button[data-item-id*="address"]'),
+    rating_block: ratingBlock ? ratingBlock.innerText : null,
+    rating_text: firstText(['div.F7nice span[aria-hidden="true"]', 'span.ceNzKf[aria-hidden="true"]']),
+    phone: firstText(['button[data-item-id*="phone"]']),
+    phone_aria: ariaValue('button[data-item-id*="phone"]'),
+    website: website ? website.href : null,
+    opening_hours: hours ? hours.innerText : null,
+    star_rows: starRows.map(function (row) { return row.innerText; }),
+    url: window.location.href
+};
+"""
+
+# Finds the feed card link whose resolved href matches arguments[0]
+FIND_PLACE_LINK_SCRIPT = """
+var links = document.querySelectorAll('div[role="feed"] a.hfpxzc, div.m6QErb a.hfpxzc');
+for (var i = 0; i < links.length; i++) {
+    if (links[i].href === arguments[0]) {
+        return links[i];
+    }
+}
+return null;
+"""
+
+# Snapshot of the results feed: every place href in feed order, whether the
+# "end of the list" marker is shown, and (if arguments[0] is true and the
+# list has not ended) a scroll to the bottom to trigger the next page.
+FEED_LINKS_SCRIPT = """
+var feed = document.querySelector('div[role="feed"]') || document.querySelector('div.m6QErb');
+if (!feed) {
+    return null;
+}
+
+var links = feed.querySelectorAll('a.hfpxzc');
+var hrefs = [];
+for (var i = 0; i < links.length; i++) {
+    if (links[i].href) {
+        hrefs.push(links[i].href);
+    }
+}
+
+var endOfList = !!feed.querySelector('span.HlvSq');
+if (!endOfList) {
+    var tail = feed.lastElementChild;
+    var tailText = tail ? (tail.innerText || '') : '';
+    endOfList = /end of the list|akhir daftar/i.test(tailText);
+}
+
+if (arguments[0] && !endOfList) {
+    feed.scrollTop = feed.scrollHeight;
+}
+
+return {hrefs: hrefs, count: links.length, end_of_list: endOfList};
+"""
+
+# Installs a MutationObserver on the results feed that records every new
+# place href the moment the feed appends it, plus how long each page of
+# results took to arrive after a scroll. Returns false if there is no feed.
+INSTALL_FEED_OBSERVER_SCRIPT = """
+var feed = document.querySelector('div[role="feed"]');
+if (!feed) {
+    return false;
+}
+
+var existing = window.__gmapsFeedCollector;
+if (existing && existing.feed === feed) {
+    return true;
+}
+if (existing && existing.observer) {
+    existing.observer.disconnect();
+}
+
+var collector = {
+    feed: feed,
+    hrefs: [],
+    seen: {},
+    pageTimes: [],
+    scrollAt: null,
+    endOfList: false,
+    observer: null
+};
+
+function harvest(root) {
+    var added = 0;
+    var links = root.querySelectorAll ? root.querySelectorAll('a.hfpxzc') : [];
+    if (root.matches && root.matches('a.hfpxzc')) {
+        links = [root];
+    }
+    for (var i = 0; i < links.length; i++) {
+        var href = links[i].href;
+        if (href && !collector.seen[href]) {
+            collector.seen[href] = true;
+            collector.hrefs.push(href);
+            added++;
+        }
+    }
+    if (!collector.endOfList && root.querySelector && root.querySelector('span.HlvSq')) {
+        collector.endOfList = true;
+    }
+    if (!collector.endOfList && root.innerText && /end of the list|akhir daftar/i.test(root.innerText)) {
+        collector.endOfList = true;
+    }
+    return added;
+}
+
+collector.observer = new MutationObserver(function (mutations) {
+    var added = 0;
+    for (var m = 0; m < mutations.length; m++) {
+        var nodes = mutations[m].addedNodes;
+        for (var n = 0; n < nodes.length; n++) {
+            if (nodes[n].nodeType === 1) {
+                added += harvest(nodes[n]);
+            }
+        }
+    }
+    if (added > 0 && collector.scrollAt !== null) {
+        collector.pageTimes.push((performance.now() - collector.scrollAt) / 1000);
+        collector.scrollAt = null;
+    }
+});
+
+harvest(feed);
+collector.observer.observe(feed, {childList: true, subtree: true});
+window.__gmapsFeedCollector = collector;
+return true;
+"""
+
+# Reads the observer buffer from offset arguments[0] and, if arguments[1]
+# is true and the list has not ended, scrolls the feed for the next page.
+DRAIN_FEED_OBSERVER_SCRIPT = """
+var collector = window.__gmapsFeedCollector;
+if (!collector) {
+    return null;
+}
+
+var pageTimes = collector.pageTimes;
+collector.pageTimes = [];
+
+if (arguments[1] && !collector.endOfList) {
+    if (collector.scrollAt === null) {
+        collector.scrollAt = performance.now();
+    }
+    collector.feed.scrollTop = collector.feed.scrollHeight;
+}
+
+return {
+    hrefs: collector.hrefs.slice(arguments[0]),
+    total: collector.hrefs.length,
+    end_of_list: collector.endOfList,
+    page_times: pageTimes
+};
+"""
+
+# Number of hrefs the feed observer has recorded so far
+FEED_OBSERVER_COUNT_SCRIPT = """
+var collector = window.__gmapsFeedCollector;
+return collector ? collector.hrefs.length : 0;
+"""
+
+# Classifies the page a search landed on: "feed" (results list), "place"
+# (Maps jumped straight to a single place), "no_results", "consent",
+# "blocked" (unusual-traffic / CAPTCHA page) or "loading" (not settled yet).
+CLASSIFY_PAGE_SCRIPT = """
+var url = window.location.href;
+var bodyText = document.body ? (document.body.innerText || '').slice(0, 3000) : '';
+
+if (/consent\\.google\\./.test(window.location.hostname)) {
+    return 'consent';
+}
+if (url.indexOf('/sorry/') >= 0 ||
+        document.querySelector('iframe[src*="recaptcha"], #captcha-form') ||
+        /unusual traffic|traffic yang tidak biasa/i.test(bodyText)) {
+    return 'blocked';
+}
+if (document.querySelector('div[role="feed"]')) {
+    return 'feed';
+}
+
+var title = document.querySelector('h1.DUwDvf, h1.fontHeadlineLarge');
+if (title && title.innerText.trim() && url.indexOf('/maps/place/') >= 0) {
+    return 'place';
+}
+if (/can.t find|tidak dapat menemukan|no results found|tidak ada hasil/i.test(bodyText)) {
+    return 'no_results';
+}
+return 'loading';
+"""
+
+# Reads the data shown on every result card in the feed: link, name,
+# rating, review count and the card's info lines (category, street, hours).
+FEED_CARDS_SCRIPT = """
+var feed = document.querySelector('div[role="feed"]') || document.querySelector('div.m6QErb');
+if (!feed) {
+    return [];
+}
+
+var cards = [];
+var links = feed.querySelectorAll('a.hfpxzc');
+for (var i = 0; i < links.length; i++) {
+    var link = links[i];
+    var card = link.closest('div.Nv2PK') || link.parentElement;
+    var rating = card.querySelector('span.MW4etd');
+    var reviews = card.querySelector('span.UY7F9');
+    var title = card.querySelector('div.qBF1Pd, .fontHeadlineSmall');
+    var infoLines = [];
+    var blocks = card.querySelectorAll('div.W4Efsd');
+    for (var b = 0; b < blocks.length; b++) {
+        // Only leaf blocks - nested W4Efsd divs repeat their children's text
+        if (!blocks[b].querySelector('div.W4Efsd')) {
+            var text = (blocks[b].innerText || '').trim();
+            if (text) {
+                infoLines.push(text);
+            }
+        }
+    }
+    cards.push({
+        href: link.href,
+        name: (title && title.innerText.trim()) || link.getAttribute('aria-label'),
+        rating_text: rating ? rating.innerText : null,
+        reviews_text: reviews ? reviews.innerText : null,
+        info_lines: infoLines
+    });
+}
+return cards;
+"""
+
+# Returns the guarded JSON blobs embedded in APP_INITIALIZATION_STATE[3],
+# one of which holds the place payload on a freshly loaded place page.
+APP_STATE_BLOBS_SCRIPT = """
+var state = window.APP_INITIALIZATION_STATE;
+if (!state || !state[3]) {
+    return [];
+}
+var blobs = [];
+for (var i = 0; i < state[3].length; i++) {
+    var value = state[3][i];
+    if (typeof value === 'string' && value.indexOf(")]}'") === 0) {
+        blobs.push(value);
+    }
+}
+return blobs;
+"""
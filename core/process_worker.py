@@ -0,0 +1,144 @@
+"""
+Worker-process side of the orchestrator's process-pool execution mode
+"""
+import os
+import signal
+import time
+from multiprocessing import util
+from typing import Dict, List, Optional, Set
+
+from config.settings import ScraperConfig
+from models.place import SearchTask, Place, PLACE_COLUMNS
+from core.circuit_breaker import CircuitBreaker
+from core.detail_backends import HttpDetailBackend
+from core.driver_pool import DriverPool
+from core.http_fetcher import HttpPlaceFetcher
+from core.rate_limiter import split_rate_budget
+from core.run_journal import RunJournal
+from core.search_engine import MapsSearchEngine, PageBlockedError
+
+
+# State owned by this worker process, set up once by init_worker
+_state: Dict = {}
+
+
+def init_worker(config: ScraperConfig, journal_path: str, done_hrefs: Dict[str, Set[str]],
+                profile_template, pid_queue):
+    """
+    Process pool initializer: give this process its own driver, breaker and journal handle
+    
+    The process moves into its own process group so the parent can kill it
+    together with its chromedriver and Chrome children if it crashes.
+    
+    Args:
+        config: Run configuration
+        journal_path: Run journal shared with the parent (appended line by line)
+        done_hrefs: Task key -> hrefs a resumed run already extracted
+        profile_template: Parent's ProfileTemplate, or None
+        pid_queue: Queue the process reports its process group ID on
+    """
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+    pid_queue.put(os.getpid())
+    
+    # The request budget is per process, so split it across the pool
+    config = split_rate_budget(config, config.max_workers)
+    
+    _state['config'] = config
+    _state['pool'] = DriverPool(config, size=1, profile_template=profile_template)
+    _state['breaker'] = CircuitBreaker(config.block_breaker_threshold, config.block_breaker_cooldown)
+    _state['journal'] = RunJournal(journal_path)
+    _state['done_hrefs'] = done_hrefs
+    _state['http_backend'] = (
+        HttpDetailBackend(HttpPlaceFetcher(config)) if config.detail_backend == 'http' else None
+    )
+    
+    # Quit the browser when the pool shuts this process down (or SIGTERMs it)
+    util.Finalize(None, _shutdown_worker, exitpriority=10)
+    signal.signal(signal.SIGTERM, lambda signum, frame: (_shutdown_worker(), os._exit(1)))
+
+
+def _shutdown_worker():
+    """Close this process's driver, HTTP backend and journal handle"""
+    pool: Optional[DriverPool] = _state.pop('pool', None)
+    if pool:
+        pool.close()
+    http_backend = _state.pop('http_backend', None)
+    if http_backend:
+        http_backend.close()
+    journal: Optional[RunJournal] = _state.pop('journal', None)
+    if journal:
+        journal.close()
+
+
+def run_task(task: SearchTask) -> Dict:
+    """
+    Run one search task in this worker process
+    
+    Args:
+        task: SearchTask to execute
+    
+    Returns:
+        Compact batch: place rows as tuples in PLACE_COLUMNS order, plus the
+        feed size and engine stats for the parent to merge
+    """
+    config: ScraperConfig = _state['config']
+    breaker: CircuitBreaker = _state['breaker']
+    journal: RunJournal = _state['journal']
+    breaker.wait_until_closed()
+    
+    journal.task_started(task)
+    start = time.time()
+    try:
+        with _state['pool'].lease() as driver_manager:
+            search_engine = MapsSearchEngine(driver_manager, config, detail_backend=_state['http_backend'])
+            search_engine.completed_hrefs = _state['done_hrefs'].get(task.key(), set())
+            search_engine.on_place = lambda href, place: journal.places_persisted(
+                task, href, [place] if place else []
+            )
+            places = search_engine.search(task)
+    except PageBlockedError:
+        breaker.record_block()
+        print(f"  ⛔ Block page on {task} after {time.time() - start:.1f}s (worker {os.getpid()})")
+        raise
+    
+    breaker.record_success()
+    return {
+        'rows': places_to_rows(places),
+        'feed_size': search_engine.feed_size,
+        'search_stats': dict(search_engine.search_stats),
+        'wait_stats': search_engine.wait_stats.snapshot()
+    }
+
+
+def places_to_rows(places: List[Place]) -> List[tuple]:
+    """Pack places as plain tuples, which pickle far smaller than dataclasses"""
+    return [tuple(getattr(place, column) for column in PLACE_COLUMNS) for place in places]
+
+
+def rows_to_places(rows: List[tuple]) -> List[Place]:
+    """Unpack rows produced by places_to_rows"""
+    return [Place(**dict(zip(PLACE_COLUMNS, row))) for row in rows]
+
+
+def kill_process_groups(pids: List[int]) -> int:
+    """
+    Kill whatever is left of worker process groups (chromedriver, Chrome)
+    
+    Args:
+        pids: Worker process IDs, each the leader of its own process group
+    
+    Returns:
+        Number of process groups that still had live members
+    """
+    if not hasattr(os, 'killpg'):
+        return 0
+    
+    killed = 0
+    for pid in pids:
+        try:
+            os.killpg(pid, signal.SIGKILL)
+            killed += 1
+        except (ProcessLookupError, PermissionError):
+            continue
+    return killed
@@ -0,0 +1,113 @@
+"""
+Pre-seeded Chrome profile shared by all drivers in a run
+"""
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from typing import Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from config.settings import ScraperConfig
+from core.driver_manager import DriverManager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# ioctl request for a copy-on-write clone (Linux btrfs/xfs/overlayfs)
+_FICLONE = 0x40049409
+
+# Files Chrome uses to lock a live profile - never copy these
+_PROFILE_LOCK_FILES = ('SingletonLock', 'SingletonSocket', 'SingletonCookie', 'lockfile')
+
+# Disposable caches that only slow the clone down
+_PROFILE_SKIP_DIRS = ('Cache', 'GPUCache', 'Crashpad', 'ShaderCache', 'GrShaderCache')
+
+
+def _clone_file(src: str, dst: str):
+    """Copy a file as a copy-on-write clone when supported, plain copy otherwise"""
+    if fcntl is not None:
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _ignore_profile_files(directory: str, names):
+    """shutil.copytree ignore hook for lock files and caches"""
+    return [n for n in names if n in _PROFILE_LOCK_FILES or n in _PROFILE_SKIP_DIRS]
+
+
+class ProfileTemplate:
+    """Chrome profile seeded once per run and cloned for every driver
+    
+    The template is created by a real browser session that accepts the
+    Google consent dialog and loads Maps in the configured language, so
+    clones start with consent cookies and a warm compiled-code cache.
+    """
+    
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self.path: Optional[str] = None
+    
+    def build(self) -> str:
+        """Launch a browser once, seed its profile and keep it as the template"""
+        manager = DriverManager(self.config)
+        driver = manager.create_driver()
+        try:
+            driver.get(f'https://www.google.com/maps?hl={self.config.language}')
+            manager.accept_consent()
+            
+            # Wait until Maps itself has loaded so its scripts get cached
+            try:
+                WebDriverWait(driver, self.config.element_wait_timeout).until(
+                    EC.presence_of_element_located((
+                        By.CSS_SELECTOR,
+                        'input[aria-label="Search Google Maps"], input[id="searchboxinput"]'
+                    ))
+                )
+            except TimeoutException:
+                print("Warning: Maps did not finish loading while seeding profile template")
+            
+            # Keep the profile directory instead of deleting it on quit
+            self.path = manager.temp_dir
+            manager.temp_dir = None
+        finally:
+            manager.quit()
+        
+        # Give Chrome a moment to flush cookies and preferences to disk
+        time.sleep(0.5)
+        return self.path
+    
+    def clone(self) -> str:
+        """Create a private copy of the template for one browser instance"""
+        if not self.path:
+            raise RuntimeError("Profile template has not been built")
+        
+        unique_id = str(uuid.uuid4())[:8]
+        target = os.path.join(tempfile.gettempdir(), f"chrome_profile_{unique_id}")
+        shutil.copytree(
+            self.path,
+            target,
+            ignore=_ignore_profile_files,
+            copy_function=_clone_file,
+            symlinks=True
+        )
+        return target
+    
+    def cleanup(self):
+        """Delete the template directory"""
+        if self.path and os.path.exists(self.path):
+            shutil.rmtree(self.path, ignore_errors=True)
+        self.path = None
@@ -0,0 +1,203 @@
+"""
+Process-wide adaptive rate limiter shared by all scraping workers
+"""
+import asyncio
+import time
+import threading
+from collections import deque
+from dataclasses import replace
+from typing import Dict, Optional
+
+from config.settings import ScraperConfig
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate adapts to how Google is responding
+    
+    Every page load (search or place) takes one token. The refill rate
+    grows additively while responses stay healthy and is cut
+    multiplicatively on block/CAPTCHA signals or timeouts (AIMD). A block
+    signal also pauses all workers for a cooldown period.
+    """
+    
+    def __init__(
+        self,
+        initial_rate: float,
+        min_rate: float,
+        max_rate: float,
+        increase: float,
+        backoff: float,
+        block_cooldown: float,
+        burst: float = 1.0
+    ):
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.backoff = backoff
+        self.block_cooldown = block_cooldown
+        self.burst = burst
+        
+        self._lock = threading.Lock()
+        self._tokens = burst
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._recent = deque()  # Timestamps of granted tokens (last 60s)
+        
+        # Metrics
+        self.successes = 0
+        self.failures: Dict[str, int] = {}
+        self.backoffs = 0
+        self.last_failure: Optional[str] = None
+        self.total_wait = 0.0
+    
+    def acquire(self) -> float:
+        """
+        Block until a request may be made
+        
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        while True:
+            sleep_for = self._try_take(start)
+            if sleep_for is None:
+                return time.monotonic() - start
+            time.sleep(sleep_for)
+    
+    async def acquire_async(self) -> float:
+        """
+        acquire() for event-loop callers: waits with asyncio.sleep, so no thread is parked
+        
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        while True:
+            sleep_for = self._try_take(start)
+            if sleep_for is None:
+                return time.monotonic() - start
+            await asyncio.sleep(sleep_for)
+    
+    def _try_take(self, start: float) -> Optional[float]:
+        """
+        Take a token if one is available
+        
+        Args:
+            start: When the caller started waiting (for the wait metric)
+        
+        Returns:
+            None once a token was taken, otherwise seconds to wait before trying again
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            
+            if now >= self._paused_until and self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self._recent.append(now)
+                self.total_wait += now - start
+                return None
+            
+            if now < self._paused_until:
+                sleep_for = self._paused_until - now
+            else:
+                sleep_for = (1.0 - self._tokens) / self.rate
+        
+        return min(max(sleep_for, 0.01), 1.0)
+    
+    def record_success(self):
+        """A response came back healthy - additively speed up"""
+        with self._lock:
+            self.successes += 1
+            self.rate = min(self.max_rate, self.rate + self.increase)
+    
+    def record_failure(self, kind: str):
+        """
+        A response showed trouble - multiplicatively back off
+        
+        Args:
+            kind: "blocked" (unusual traffic / CAPTCHA / HTTP 429) or "timeout"
+        """
+        with self._lock:
+            self.failures[kind] = self.failures.get(kind, 0) + 1
+            self.last_failure = kind
+            self.backoffs += 1
+            self.rate = max(self.min_rate, self.rate * self.backoff)
+            self._tokens = min(self._tokens, 0.0)
+            
+            if kind == 'blocked':
+                self._paused_until = max(self._paused_until, time.monotonic() + self.block_cooldown)
+    
+    def metrics(self) -> Dict:
+        """Current rate, observed request rate and backoff state"""
+        with self._lock:
+            now = time.monotonic()
+            self._trim_recent(now)
+            return {
+                'rate_limit': round(self.rate, 3),
+                'requests_last_minute': len(self._recent),
+                'observed_rate': round(len(self._recent) / 60.0, 3),
+                'in_cooldown': now < self._paused_until,
+                'cooldown_remaining': round(max(0.0, self._paused_until - now), 1),
+                'successes': self.successes,
+                'failures': dict(self.failures),
+                'backoffs': self.backoffs,
+                'last_failure': self.last_failure,
+                'total_wait_seconds': round(self.total_wait, 1),
+            }
+    
+    def _refill(self, now: float):
+        """Add tokens for the time elapsed since the last refill"""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._trim_recent(now)
+    
+    def _trim_recent(self, now: float):
+        """Drop request timestamps older than a minute"""
+        while self._recent and now - self._recent[0] > 60.0:
+            self._recent.popleft()
+
+
+_limiter: Optional[AdaptiveRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter(config: ScraperConfig) -> AdaptiveRateLimiter:
+    """Return the process-wide limiter, creating it from config on first use"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = AdaptiveRateLimiter(
+                initial_rate=config.rate_limit_initial,
+                min_rate=config.rate_limit_min,
+                max_rate=config.rate_limit_max,
+                increase=config.rate_limit_increase,
+                backoff=config.rate_limit_backoff,
+                block_cooldown=config.rate_limit_block_cooldown
+            )
+        return _limiter
+
+
+def reset_rate_limiter():
+    """Drop the process-wide limiter so the next run starts from its config"""
+    global _limiter
+    with _limiter_lock:
+        _limiter = None
+
+
+def split_rate_budget(config: ScraperConfig, workers: int) -> ScraperConfig:
+    """
+    Copy of config with each rate limit divided by the number of workers
+    
+    For workers that each run their own process (and so their own
+    process-wide limiter), so together they stay within the configured budget.
+    """
+    workers = max(1, workers)
+    return replace(
+        config,
+        rate_limit_initial=config.rate_limit_initial / workers,
+        rate_limit_max=config.rate_limit_max / workers,
+        rate_limit_min=config.rate_limit_min / workers
+    )
@@ -0,0 +1,129 @@
+"""
+Append-only incremental CSV writer for results collected during a run
+"""
+import csv
+import os
+import time
+from queue import Queue
+from threading import Lock, Thread
+from typing import List, Optional
+
+from models.place import Place, PLACE_COLUMNS
+
+
+class IncrementalCsvWriter:
+    """
+    Stream places to a CSV file as they are collected
+    
+    Each append writes only the new rows, so the cost per task no longer grows
+    with the size of the run. The file is fsynced at most every fsync_interval
+    seconds. With background=True, rows are handed to a writer thread and
+    append() never blocks on disk.
+    """
+    
+    def __init__(self, path: str, fsync_interval: float = 5.0, background: bool = True, sep: str = '|'):
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.sep = sep
+        self.rows_written = 0
+        self._lock = Lock()
+        self._last_fsync = time.time()
+        
+        # Start every run from a fresh file with just the header
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=PLACE_COLUMNS, delimiter=sep, extrasaction='ignore')
+        self._writer.writeheader()
+        self._file.flush()
+        
+        self._queue: Optional[Queue] = None
+        self._thread: Optional[Thread] = None
+        if background:
+            self._queue = Queue()
+            self._thread = Thread(target=self._drain, name="incremental-writer", daemon=True)
+            self._thread.start()
+    
+    def append(self, places: List[Place]):
+        """
+        Append places to the file
+        
+        Args:
+            places: Newly collected places
+        """
+        if not places:
+            return
+        
+        rows = [place.to_dict() for place in places]
+        if self._queue is not None:
+            self._queue.put(rows)
+        else:
+            self._write(rows)
+    
+    def close(self):
+        """Write anything still queued, fsync and close the file"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        
+        with self._lock:
+            if not self._file.closed:
+                self._fsync()
+                self._file.close()
+    
+    def compact(self) -> int:
+        """
+        Rewrite the closed file without duplicate rows
+        
+        Rows that differ only in scraped_at (e.g. a task that was run twice)
+        are duplicates. Rows with different search provenance are kept.
+        
+        Returns:
+            Number of rows in the compacted file
+        """
+        self.close()
+        
+        seen = set()
+        tmp_path = f"{self.path}.tmp"
+        with open(self.path, newline='', encoding='utf-8') as src, \
+                open(tmp_path, 'w', newline='', encoding='utf-8') as dst:
+            reader = csv.reader(src, delimiter=self.sep)
+            writer = csv.writer(dst, delimiter=self.sep)
+            header = next(reader, PLACE_COLUMNS)
+            writer.writerow(header)
+            key_columns = [idx for idx, column in enumerate(header) if column != 'scraped_at']
+            for row in reader:
+                key = tuple(row[idx] for idx in key_columns if idx < len(row))
+                if key not in seen:
+                    seen.add(key)
+                    writer.writerow(row)
+            dst.flush()
+            os.fsync(dst.fileno())
+        
+        os.replace(tmp_path, self.path)
+        return len(seen)
+    
+    def _drain(self):
+        """Background thread: write queued batches until close() sends None"""
+        while True:
+            rows = self._queue.get()
+            if rows is None:
+                break
+            try:
+                self._write(rows)
+            except Exception as e:
+                print(f"  ⚠️  Incremental write failed: {e}")
+    
+    def _write(self, rows: List[dict]):
+        """Append rows and fsync if the interval has passed"""
+        with self._lock:
+            self._writer.writerows(rows)
+            self.rows_written += len(rows)
+            self._file.flush()
+            if time.time() - self._last_fsync >= self.fsync_interval:
+                self._fsync()
+    
+    def _fsync(self):
+        """Force written rows to disk"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_fsync = time.time()
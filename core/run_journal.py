@@ -0,0 +1,200 @@
+"""
+Durable JSONL journal of a scraping run, used to resume after a crash
+"""
+import os
+import json
+import glob
+from dataclasses import dataclass, field, asdict, replace
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set
+
+from config.settings import ScraperConfig
+from models.place import SearchTask, Place
+
+
+# Journal event types
+RUN_STARTED = "run_started"
+TASK_ADDED = "task_added"          # A task created mid-run (e.g. by expanding a saturated one)
+TASK_STARTED = "task_started"
+PLACES_PERSISTED = "places_persisted"  # One href processed, with the place it produced (if any)
+TASK_COMPLETED = "task_completed"
+
+# Config fields that decide what a run discovers, extracts and journals. They
+# are recorded with the run, and a resume must use the same values.
+RUN_SETTINGS = (
+    'pipeline',
+    'detail_level',
+    'detail_backend',
+    'extraction_backend',
+    'capture_search_responses',
+    'engine',
+    'search_mode',
+    'language',
+    'skip_out_of_area',
+    'expand_saturated_districts',
+    'tile_split_threshold',
+    'max_tile_depth',
+)
+
+
+def run_settings(config: ScraperConfig) -> Dict[str, Any]:
+    """The RUN_SETTINGS values of a config"""
+    return {name: getattr(config, name) for name in RUN_SETTINGS}
+
+
+def task_from_dict(data: Dict) -> SearchTask:
+    """Rebuild a SearchTask from its journaled fields"""
+    data = dict(data)
+    if data.get('bounds') is not None:
+        data['bounds'] = tuple(data['bounds'])
+    return SearchTask(**data)
+
+
+@dataclass
+class JournalState:
+    """What a journal says about a run so far"""
+    path: str
+    tasks: List[SearchTask] = field(default_factory=list)
+    started: Set[str] = field(default_factory=set)  # Task keys that were started
+    completed: Dict[str, Dict] = field(default_factory=dict)  # Task key -> task_completed event
+    places: List[Place] = field(default_factory=list)  # Every persisted place
+    done_hrefs: Dict[str, Set[str]] = field(default_factory=dict)  # Task key -> hrefs already processed
+    persisted_ids: Set[str] = field(default_factory=set)  # Place IDs persisted by the two-phase pipeline
+    settings: Dict[str, Any] = field(default_factory=dict)  # RUN_SETTINGS of the journaled run
+    
+    def config_for_resume(self, config: ScraperConfig) -> ScraperConfig:
+        """Copy of config with the journaled run's settings applied"""
+        return replace(config, **{name: value for name, value in self.settings.items() if name in RUN_SETTINGS})
+    
+    def settings_mismatches(self, config: ScraperConfig) -> List[str]:
+        """Settings where config differs from the journaled run, as "name: run -> config" lines"""
+        current = run_settings(config)
+        return [
+            f"{name}: {self.settings[name]!r} -> {current[name]!r}"
+            for name in RUN_SETTINGS
+            if name in self.settings and self.settings[name] != current[name]
+        ]
+    
+    def is_completed(self, task: SearchTask) -> bool:
+        """Whether the task finished in the journaled run"""
+        return task.key() in self.completed
+    
+    def in_flight(self) -> List[SearchTask]:
+        """Tasks that were started but never completed"""
+        return [task for task in self.tasks if task.key() in self.started and not self.is_completed(task)]
+
+
+class RunJournal:
+    """
+    Append-only JSONL journal in checkpoint_dir
+    
+    Each event is one line, flushed and fsynced before record() returns, so a
+    crash loses at most the event being written. load_journal() ignores a
+    truncated last line.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+    
+    @staticmethod
+    def new_path(checkpoint_dir: str) -> str:
+        """Journal path for a new run"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return os.path.join(checkpoint_dir, f"run_{timestamp}.jsonl")
+    
+    @staticmethod
+    def latest(checkpoint_dir: str) -> Optional[str]:
+        """Most recent journal in checkpoint_dir, or None"""
+        journals = sorted(glob.glob(os.path.join(checkpoint_dir, "run_*.jsonl")))
+        return journals[-1] if journals else None
+    
+    def record(self, event: str, **fields):
+        """
+        Append one event to the journal
+        
+        Args:
+            event: Event type (e.g. TASK_STARTED)
+            **fields: JSON-serialisable event data
+        """
+        line = json.dumps({'event': event, 'at': datetime.now().isoformat(), **fields}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+    
+    def run_started(self, tasks: List[SearchTask], config: ScraperConfig):
+        """Record the full task list and the settings of a new run"""
+        self.record(RUN_STARTED, tasks=[asdict(task) for task in tasks], settings=run_settings(config))
+    
+    def task_added(self, task: SearchTask, parent: SearchTask):
+        """Record a task created mid-run"""
+        self.record(TASK_ADDED, task=asdict(task), parent=parent.key())
+    
+    def task_started(self, task: SearchTask):
+        """Record that a worker picked up a task"""
+        self.record(TASK_STARTED, task=task.key())
+    
+    def places_persisted(self, task: SearchTask, href: str, places: List[Place], place_id: Optional[str] = None):
+        """Record one processed href and the places it produced"""
+        self.record(PLACES_PERSISTED, task=task.key(), href=href, place_id=place_id,
+                    places=[place.to_dict() for place in places])
+    
+    def task_completed(self, task: SearchTask, places: int, hrefs: Optional[List[str]] = None):
+        """Record that a task finished (with its hrefs for discovery tasks)"""
+        self.record(TASK_COMPLETED, task=task.key(), places=places, hrefs=hrefs)
+    
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def load_journal(path: str) -> JournalState:
+    """
+    Replay a journal into a JournalState
+    
+    Args:
+        path: Journal file written by RunJournal
+    
+    Returns:
+        JournalState describing the run so far
+    """
+    state = JournalState(path=path)
+    known_keys: Set[str] = set()
+    
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write leaves a partial last line
+                continue
+            
+            event = entry.get('event')
+            if event == RUN_STARTED:
+                state.settings = entry.get('settings') or {}
+                for data in entry['tasks']:
+                    task = task_from_dict(data)
+                    if task.key() not in known_keys:
+                        known_keys.add(task.key())
+                        state.tasks.append(task)
+            elif event == TASK_ADDED:
+                task = task_from_dict(entry['task'])
+                if task.key() not in known_keys:
+                    known_keys.add(task.key())
+                    state.tasks.append(task)
+            elif event == TASK_STARTED:
+                state.started.add(entry['task'])
+            elif event == PLACES_PERSISTED:
+                state.done_hrefs.setdefault(entry['task'], set()).add(entry['href'])
+                if entry.get('place_id'):
+                    state.persisted_ids.add(entry['place_id'])
+                state.places.extend(Place(**data) for data in entry['places'])
+            elif event == TASK_COMPLETED:
+                state.completed[entry['task']] = entry
+    
+    return state
@@ -0,0 +1,78 @@
+"""
+Out-of-area filtering for search results, shared by the search engines
+"""
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import ScraperConfig
+from models.place import SearchTask
+from utils.extractors import extract_coordinates_from_link
+from utils.geo import Bounds, bounds_from_viewport, expand_bounds, in_bounds
+
+
+class SearchAreaFilter:
+    """Keeps one search's results inside the area it is meant to cover
+    
+    A task's explicit bounds always apply. Tasks without bounds fall back
+    to the viewport the results landed on, but only with skip_out_of_area.
+    Skipped places and early scroll stops are counted in the engine's
+    search_stats.
+    """
+    
+    def __init__(self, config: ScraperConfig, search_stats: Dict[str, int]):
+        self.config = config
+        self.search_stats = search_stats
+        self.area: Optional[Bounds] = None  # Set per search, None = keep everything
+    
+    def needs_viewport(self, task: SearchTask, page_state: str) -> bool:
+        """Whether set_area() will use the results viewport for this search"""
+        return page_state == 'feed' and task.bounds is None and self.config.skip_out_of_area
+    
+    def set_area(self, task: SearchTask, page_state: str,
+                 viewport: Optional[Tuple[float, float, float]] = None):
+        """
+        Pick the area results must fall in
+        
+        Args:
+            task: Task whose search just landed
+            page_state: Where the search landed (only a feed gets an area)
+            viewport: Results viewport (lat, lng, zoom), if needs_viewport()
+        """
+        self.area = None
+        if page_state != 'feed':
+            return
+        
+        area = task.bounds
+        if area is None and self.config.skip_out_of_area and viewport:
+            area = bounds_from_viewport(*viewport)
+        
+        if area is not None:
+            self.area = expand_bounds(area, self.config.out_of_area_margin)
+    
+    def contains(self, href: str) -> bool:
+        """Whether a place link lies in the area (unknown positions count as inside)"""
+        if self.area is None:
+            return True
+        latitude, longitude = extract_coordinates_from_link(href)
+        return in_bounds(latitude, longitude, self.area)
+    
+    def drifted(self, new_hrefs: List[str]) -> bool:
+        """Whether a page of new feed results is mostly outside the area"""
+        if self.area is None or len(new_hrefs) < 3:
+            return False
+        
+        outside = sum(1 for href in new_hrefs if not self.contains(href))
+        if outside / len(new_hrefs) < self.config.out_of_area_stop_share:
+            return False
+        
+        self.search_stats['out_of_area_stops'] += 1
+        print(f"  Results drifted out of area ({outside}/{len(new_hrefs)} new results outside) - stopping scroll")
+        return True
+    
+    def filter(self, hrefs: List[str]) -> List[str]:
+        """Drop hrefs outside the area so no detail time is spent on them"""
+        kept = [href for href in hrefs if self.contains(href)]
+        skipped = len(hrefs) - len(kept)
+        if skipped:
+            self.search_stats['out_of_area_skipped'] += skipped
+            print(f"  Skipped {skipped} out-of-area places")
+        return kept
@@ -4,34 +4,175 @@ Search engine for Google Maps
 import re
 import time
 import random
-from typing import List, Set, Optional
+from urllib.parse import quote_plus
+from typing import Callable, Dict, List, Set, Optional, Tuple
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
-from models.place import SearchTask, Place
+from models.place import SearchTask, Place, CARD_MISSING_FIELDS, PLACE_DATA_FIELDS
 from config.settings import ScraperConfig
 from core.driver_manager import DriverManager
+from core.circuit_breaker import PageBlockedError
+from core.detail_backends import DetailBackend
+from core.rate_limiter import get_rate_limiter
+from core.search_area import SearchAreaFilter
+from core.page_scripts import (
+    PLACE_DETAILS_SCRIPT,
+    FIND_PLACE_LINK_SCRIPT,
+    FEED_LINKS_SCRIPT,
+    INSTALL_FEED_OBSERVER_SCRIPT,
+    DRAIN_FEED_OBSERVER_SCRIPT,
+    FEED_OBSERVER_COUNT_SCRIPT,
+    CLASSIFY_PAGE_SCRIPT,
+    FEED_CARDS_SCRIPT,
+    APP_STATE_BLOBS_SCRIPT
+)
+from core.waits import PLACEHOLDER_TITLES
 from utils.extractors import (
     extract_coordinates_from_link, 
+    canonical_place_id,
     parse_address, 
     clean_text,
     parse_rating,
     parse_reviews_count
 )
+from utils.geo import viewport_from_url
+from utils.payload_parser import (
+    find_place_darray,
+    place_fields_from_darray,
+    build_place_from_payload,
+    parse_search_response
+)
+
+
+# Page states a search can settle on without needing another attempt
+SETTLED_PAGE_STATES = ('feed', 'place', 'no_results', 'blocked')
+
+
+def build_search_url(task: SearchTask, language: str) -> str:
+    """Build a Maps search URL for the task, centred on its viewport if set"""
+    url = f"https://www.google.com/maps/search/{quote_plus(task.get_query())}/"
+    if task.center_lat is not None and task.center_lng is not None:
+        zoom = task.zoom if task.zoom is not None else 15
+        url += f"@{task.center_lat},{task.center_lng},{zoom}z"
+    return f"{url}?hl={language}"
+
+
+def build_place_from_details(fields: dict, link: str, task: SearchTask) -> Place:
+    """
+    Build a Place from the raw fields returned by PLACE_DETAILS_SCRIPT
+    
+    Args:
+        fields: Fields read from the place panel
+        link: URL the panel was read from (coordinates and place ID come from it)
+        task: Task the place is attributed to
+    
+    Returns:
+        Place object (check it with is_valid_place)
+    """
+    # Address - fall back to the aria-label if no visible text
+    address = fields.get('address') or fields.get('address_aria')
+    subdistrict, district, city, province, zip_code = parse_address(address) if address else (None, None, None, None, None)
+    
+    latitude, longitude = extract_coordinates_from_link(link)
+    
+    # Rating - prefer the full "4.5 (123)" block, then the standard selectors
+    rating_block = fields.get('rating_block') or ''
+    rating_text = None
+    match = re.search(r'(\d+[.,]\d+)', rating_block)
+    if match:
+        rating_text = match.group(1).replace(',', '.')
+    if not rating_text:
+        rating_text = fields.get('rating_text')
+    rating = parse_rating(rating_text)
+    
+    # Reviews count from the same block
+    reviews_text = None
+    match = re.search(r'\(([0-9.,\s]+)\)', rating_block)
+    if match:
+        reviews_text = match.group(1)
+    reviews_count = parse_reviews_count(reviews_text)
+    
+    phone = fields.get('phone') or fields.get('phone_aria')
+    stars = parse_star_rows(fields.get('star_rows') or [])
+    
+    return Place(
+        name=clean_text(fields.get('name')),
+        category=clean_text(fields.get('category')),
+        address=clean_text(address),
+        subdistrict=clean_text(subdistrict),
+        district=clean_text(district),
+        city=clean_text(city),
+        province=clean_text(province),
+        zip_code=clean_text(zip_code),
+        latitude=latitude,
+        longitude=longitude,
+        rating=rating,
+        reviews_count=reviews_count,
+        phone=clean_text(phone),
+        website=clean_text(fields.get('website')),
+        google_maps_link=link,
+        place_id=canonical_place_id(link),
+        opening_hours=clean_text(fields.get('opening_hours')),
+        star_1=stars.get(1),
+        star_2=stars.get(2),
+        star_3=stars.get(3),
+        star_4=stars.get(4),
+        star_5=stars.get(5),
+        search_keyword=task.keyword,
+        search_location=task.location
+    )
+
+
+def parse_star_rows(rows: List[str]) -> dict:
+    """Parse star distribution rows (5 stars first)"""
+    stars = {1: None, 2: None, 3: None, 4: None, 5: None}
+    
+    for idx, row in enumerate(rows[:5]):
+        match = re.search(r'(\d+)', row or '')
+        if match:
+            stars[5 - idx] = int(match.group(1))
+    
+    return stars
+
+
+def is_valid_place(place: Place) -> bool:
+    """Check if place is valid"""
+    return (
+        place.name is not None and 
+        place.google_maps_link is not None and
+        len(place.name) > 0
+    )
 
 
 class MapsSearchEngine:
     """Handles searching and extracting data from Google Maps"""
     
-    def __init__(self, driver_manager: DriverManager, config: ScraperConfig):
+    def __init__(self, driver_manager: DriverManager, config: ScraperConfig,
+                 detail_backend: Optional[DetailBackend] = None):
         self.driver_manager = driver_manager
         self.config = config
+        self.detail_backend = detail_backend  # None = extract in this engine's browser
+        self.rate_limiter = get_rate_limiter(config) if config.adaptive_rate_limit else None
+        self.block_detected = False  # Set when a place load lands on a block page
         self.driver = driver_manager.driver
         self.seen_links: Set[str] = set()
         self.seen_names: Set[str] = set()
+        self.wait_stats = driver_manager.wait_stats
+        self.wait_stats.reset()  # Pooled drivers carry stats from earlier tasks
+        self.waiter = driver_manager.waiter()
+        self.last_place_url: Optional[str] = None  # Place open in the panel before the next click
+        self.detail_stats = {'attempts': 0, 'succeeded': 0, 'seconds': 0.0}
+        self.feed_page_times: List[float] = []  # Seconds from scroll to next page of results
+        self.captured_records: Dict[str, dict] = {}  # place_id -> fields decoded from search XHRs
+        self.feed_size = 0  # Hrefs collected from the last results feed (saturated near ~120)
+        self.completed_hrefs: Set[str] = set()  # Hrefs a resumed run already processed
+        self.on_place: Optional[Callable[[str, Optional[Place]], None]] = None  # Called per processed href
+        self.search_stats = {'url_searches': 0, 'url_fallbacks': 0, 'payload_hits': 0, 'payload_fallbacks': 0,
+                             'out_of_area_skipped': 0, 'out_of_area_stops': 0}
+        self.area_filter = SearchAreaFilter(config, self.search_stats)  # Area results must fall in, set per search
     
     def search(self, task: SearchTask) -> List[Place]:
         """
@@ -48,28 +189,55 @@ class MapsSearchEngine:
         places = []
         query = task.get_query()
         
-        # Perform search with retry
-        if not self._perform_search(query):
-            print(f"Failed to perform search for: {query}")
+        page_state = self._open_search(task)
+        
+        # Handle pages that are not a results feed directly
+        if page_state == 'place':
+            print(f"  Search landed on a single place")
+            place = self._read_open_place(task, 0, 1, None)
+            if place and is_valid_place(place):
+                places.append(place)
+                print(f"  [1/1] ✓ {place.name}")
+                if self.on_place:
+                    self.on_place(place.google_maps_link, place)
             return places
         
-        # Wait for results to load
-        time.sleep(self.config.scroll_pause_time)
+        if page_state == 'blocked':
+            raise PageBlockedError(f"Blocked while searching: {query}")
+        
+        if not self._check_feed_state(page_state, query):
+            return places
         
         # Scroll to load more results
         place_hrefs = self._scroll_and_collect_elements(task.max_results)
+        self.feed_size = len(place_hrefs)
+        place_hrefs = self.area_filter.filter(place_hrefs)
         
         print(f"Found {len(place_hrefs)} unique place hrefs")
         
+        # Card-only mode: build places from the feed cards without opening them
+        if self.config.detail_level == 'cards':
+            places = self._places_from_cards(place_hrefs, task)
+            if self.on_place:
+                for place in places:
+                    self.on_place(place.google_maps_link, place)
+            print(f"Collected {len(places)} places from feed cards for: {task}")
+            self._print_task_stats()
+            return places
+        
         # Extract details from each place by finding fresh element for each href
         seen_urls_this_task = set()  # Track URLs for safety
         
         for idx, href in enumerate(place_hrefs):
+            if href in self.completed_hrefs:
+                print(f"  [{idx+1}/{len(place_hrefs)}] Already extracted in the resumed run")
+                continue
+            
             try:
                 # Find FRESH element by href each time
                 place = self._extract_place_details_by_href(href, task, idx, len(place_hrefs))
                 
-                if place and self._is_valid_place(place):
+                if place and is_valid_place(place):
                     # Double-check for duplicate URL (shouldn't happen but safety check)
                     if place.google_maps_link in seen_urls_this_task:
                         print(f"  [{idx+1}/{len(place_hrefs)}] ⚠️  DUPLICATE URL: {place.name}")
@@ -79,19 +247,302 @@ class MapsSearchEngine:
                     seen_urls_this_task.add(place.google_maps_link)
                     places.append(place)
                     print(f"  [{idx+1}/{len(place_hrefs)}] ✓ {place.name}")
+                else:
+                    place = None
                 
-                # Random delay
-                time.sleep(random.uniform(self.config.min_delay, self.config.max_delay))
+                if self.block_detected:
+                    raise PageBlockedError(f"Blocked after {idx+1}/{len(place_hrefs)} places: {query}")
                 
+                if self.on_place:
+                    self.on_place(href, place)
+                
+                self.pause_between_places()
+                
+            except PageBlockedError:
+                raise
             except Exception as e:
                 print(f"  [{idx+1}/{len(place_hrefs)}] Error: {e}")
                 continue
         
         print(f"Collected {len(places)} places for: {task}")
+        self._print_task_stats()
+        
         return places
     
-    def _perform_search(self, query: str, max_retries: int = 3) -> bool:
-        """Perform search with retry"""
+    def discover(self, task: SearchTask) -> List[str]:
+        """
+        Phase one of the two-phase pipeline: collect place hrefs without opening them
+        
+        Args:
+            task: SearchTask to execute
+            
+        Returns:
+            List of place URLs in feed order
+        """
+        print(f"Discovering: {task}")
+        query = task.get_query()
+        
+        page_state = self._open_search(task)
+        
+        if page_state == 'place':
+            # The search jumped straight to the only match
+            return [self.driver.current_url]
+        
+        if page_state == 'blocked':
+            raise PageBlockedError(f"Blocked while searching: {query}")
+        
+        if not self._check_feed_state(page_state, query):
+            return []
+        
+        place_hrefs = self._scroll_and_collect_elements(task.max_results)
+        self.feed_size = len(place_hrefs)
+        place_hrefs = self.area_filter.filter(place_hrefs)
+        print(f"Discovered {len(place_hrefs)} place hrefs for: {task}")
+        return place_hrefs
+    
+    def extract_place(self, href: str, task: SearchTask, idx: int = 0, total: int = 1) -> Optional[Place]:
+        """
+        Phase two of the two-phase pipeline: open one place URL and extract it
+        
+        Args:
+            href: Place URL collected during discovery
+            task: Task the place is attributed to
+            idx: Position in the detail queue (for logging)
+            total: Size of the detail queue (for logging)
+            
+        Returns:
+            Place object, or None if extraction failed
+        """
+        # There is no results feed to click in, so always navigate directly
+        place = self._extract_place_details_by_href(href, task, idx, total, mode='direct')
+        if self.block_detected:
+            raise PageBlockedError(f"Blocked while opening place {idx+1}/{total}")
+        if place and is_valid_place(place):
+            return place
+        return None
+    
+    def _capture_search_responses(self):
+        """Decode any search-results XHRs that arrived since the last scroll"""
+        if not self.config.capture_search_responses:
+            return
+        
+        for body in self.driver_manager.collect_search_responses():
+            for fields in parse_search_response(body):
+                if fields.get('feature_id'):
+                    self.captured_records[fields['feature_id'].lower()] = fields
+    
+    def _places_from_cards(self, place_hrefs: List[str], task: SearchTask) -> List[Place]:
+        """Build Place objects from the feed's result cards (no detail pages)"""
+        self._capture_search_responses()
+        places = []
+        
+        # Places whose pagination response was captured need no DOM reads
+        remaining = []
+        for href in place_hrefs:
+            fields = self.captured_records.get(canonical_place_id(href) or '')
+            if fields:
+                place = build_place_from_payload(fields, href, task)
+                if place.latitude is None:
+                    place.latitude, place.longitude = extract_coordinates_from_link(href)
+                place.missing_fields = ", ".join(
+                    name for name in PLACE_DATA_FIELDS if getattr(place, name) is None
+                )
+                if is_valid_place(place):
+                    places.append(place)
+            else:
+                remaining.append(href)
+        
+        if self.captured_records:
+            print(f"  {len(places)} places from captured responses, {len(remaining)} from cards")
+        if not remaining:
+            return places
+        
+        try:
+            cards = self.driver.execute_script(FEED_CARDS_SCRIPT) or []
+        except Exception as e:
+            print(f"  Card script failed: {e}")
+            return places
+        
+        cards_by_href = {card['href']: card for card in cards if card.get('href')}
+        
+        for href in remaining:
+            card = cards_by_href.get(href)
+            if not card or not card.get('name'):
+                continue
+            
+            place = self._build_place_from_card(card, task)
+            if is_valid_place(place):
+                places.append(place)
+        
+        return places
+    
+    def _build_place_from_card(self, card: dict, task: SearchTask) -> Place:
+        """Build a partial Place from one feed card"""
+        link = card['href']
+        latitude, longitude = extract_coordinates_from_link(link)
+        
+        # Category is the first "·"-separated part of the first info line
+        # that is not the rating line
+        category = None
+        for line in card.get('info_lines') or []:
+            first_part = line.split('·')[0].strip()
+            if first_part and not re.match(r'^[\d.,]+\s*\(', first_part):
+                category = first_part
+                break
+        
+        missing = list(CARD_MISSING_FIELDS)
+        if category is None:
+            missing.insert(0, 'category')
+        
+        return Place(
+            name=clean_text(card.get('name')),
+            category=clean_text(category),
+            latitude=latitude,
+            longitude=longitude,
+            rating=parse_rating(card.get('rating_text')),
+            reviews_count=parse_reviews_count(card.get('reviews_text')),
+            google_maps_link=link,
+            place_id=canonical_place_id(link),
+            search_keyword=task.keyword,
+            search_location=task.location,
+            missing_fields=", ".join(missing)
+        )
+    
+    def pause_between_places(self):
+        """Politeness delay between place page loads"""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        else:
+            time.sleep(random.uniform(self.config.min_delay, self.config.max_delay))
+    
+    def _signal(self, outcome: str):
+        """Report a response outcome ("ok", "timeout", "blocked") to the rate limiter"""
+        if not self.rate_limiter:
+            return
+        if outcome == 'ok':
+            self.rate_limiter.record_success()
+        else:
+            self.rate_limiter.record_failure(outcome)
+    
+    def _open_search(self, task: SearchTask) -> str:
+        """Run the search for a task and return the page state it landed on"""
+        query = task.get_query()
+        
+        # Start this task's network and wait stats from a clean slate
+        self.driver_manager.collect_network_stats()
+        self.wait_stats.reset()
+        
+        # Searches count against the shared request budget too
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        
+        # Perform search - straight from a URL, falling back to typing the query
+        if self.config.search_mode == 'url':
+            page_state = self._perform_url_search(task)
+            if page_state not in SETTLED_PAGE_STATES:
+                self.search_stats['url_fallbacks'] += 1
+                print(f"  URL search failed, falling back to typed search")
+                page_state = self._perform_search(query)
+        else:
+            page_state = self._perform_search(query)
+        
+        self.search_stats[f'landed_{page_state}'] = self.search_stats.get(f'landed_{page_state}', 0) + 1
+        self._set_search_area(task, page_state)
+        
+        if page_state == 'blocked':
+            self._signal('blocked')
+        elif page_state in SETTLED_PAGE_STATES:
+            self._signal('ok')
+        else:
+            self._signal('timeout')
+        return page_state
+    
+    def _check_feed_state(self, page_state: str, query: str) -> bool:
+        """Report non-feed page states and wait for the first cards of a feed"""
+        if page_state == 'no_results':
+            print(f"No results for: {query}")
+            return False
+        
+        if page_state == 'blocked':
+            print(f"Blocked by Google (unusual traffic page) for: {query}")
+            return False
+        
+        if page_state != 'feed':
+            print(f"Failed to perform search for: {query}")
+            return False
+        
+        # Wait for the first result cards to render
+        self.waiter.feed_grew(0, self.config.scroll_pause_time)
+        return True
+    
+    def _set_search_area(self, task: SearchTask, page_state: str):
+        """Pick the area results must fall in, waiting for the results viewport if it is used"""
+        viewport = self._results_viewport() if self.area_filter.needs_viewport(task, page_state) else None
+        self.area_filter.set_area(task, page_state, viewport)
+    
+    def _results_viewport(self) -> Optional[Tuple[float, float, float]]:
+        """Viewport of the results page, once the URL has moved off the home page's viewport"""
+        def _viewport(driver):
+            url = driver.current_url
+            return '/maps/search/' in url and viewport_from_url(url)
+        
+        return self.waiter.until('results_viewport', _viewport, self.config.element_wait_timeout)
+    
+    def _print_task_stats(self):
+        """Print network, feed, detail and wait stats for the current task"""
+        if self.config.block_resources:
+            net = self.driver_manager.collect_network_stats()
+            print(f"  Network: {net['requests']} requests, {net['blocked_requests']} blocked (size unknown), "
+                  f"{net['bytes_received'] / 1024:.0f} KB received")
+        
+        if self.feed_page_times:
+            print(f"  Feed pages: {len(self.feed_page_times)} loaded, "
+                  f"{sum(self.feed_page_times) / len(self.feed_page_times):.2f}s avg, "
+                  f"{max(self.feed_page_times):.2f}s max")
+        
+        attempts = self.detail_stats['attempts']
+        if attempts:
+            print(f"  Details ({self.config.detail_navigation}): "
+                  f"{self.detail_stats['succeeded']}/{attempts} extracted, "
+                  f"{self.detail_stats['seconds'] / attempts:.2f}s avg per place")
+        
+        print(f"  Waits: {self.wait_stats.total_seconds():.1f}s total")
+        for line in self.wait_stats.summary_lines():
+            print(f"    {line}")
+    
+    def _perform_url_search(self, task: SearchTask) -> str:
+        """Open the search results URL directly and classify where it landed"""
+        self.search_stats['url_searches'] += 1
+        try:
+            self.driver.get(build_search_url(task, self.config.language))
+        except Exception as e:
+            print(f"  URL search failed: {e}")
+            return 'error'
+        
+        page_state = self._wait_for_landing()
+        if page_state == 'consent' and self.driver_manager.accept_consent():
+            page_state = self._wait_for_landing()
+        return page_state
+    
+    def _classify_page(self) -> str:
+        """Classify the current page (feed, place, no_results, consent, blocked, loading)"""
+        try:
+            return self.driver.execute_script(CLASSIFY_PAGE_SCRIPT) or 'loading'
+        except Exception:
+            return 'loading'
+    
+    def _wait_for_landing(self) -> str:
+        """Wait until a search settles on a recognisable page and return its state"""
+        def _settled(driver):
+            state = self._classify_page()
+            return state if state != 'loading' else False
+        
+        page_state = self.waiter.until('search_landing', _settled, self.config.element_wait_timeout)
+        return page_state or 'loading'
+    
+    def _perform_search(self, query: str, max_retries: int = 3) -> str:
+        """Perform search with retry and return the page state it landed on"""
+        page_state = 'loading'
         for attempt in range(max_retries):
             try:
                 print(f"  Search attempt {attempt + 1}/{max_retries}")
@@ -107,67 +558,123 @@ class MapsSearchEngine:
                 )
                 
                 search_box.clear()
-                time.sleep(0.5)
                 search_box.send_keys(query)
-                time.sleep(1)
+                self.waiter.input_value_equals('search_query_typed', '#searchboxinput', query, 2)
                 search_box.send_keys(Keys.RETURN)
-                time.sleep(3)
                 
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'div[role="feed"]'))
-                    )
-                    return True
-                except TimeoutException:
-                    print(f"  Results timeout")
+                page_state = self._wait_for_landing()
+                if page_state == 'consent':
+                    # Accept and search again on the next attempt
+                    self.driver_manager.accept_consent()
+                    continue
+                if page_state in SETTLED_PAGE_STATES:
+                    return page_state
+                print(f"  Results timeout")
                     
             except Exception as e:
                 print(f"  Search failed: {e}")
                 time.sleep(2)
         
-        return False
+        return page_state
     
-    def _scroll_and_collect_elements(self, max_results: int) -> List:
-        """Scroll and collect unique place HREFS (not elements) by tracking unique hrefs"""
+    def _scroll_and_collect_elements(self, max_results: int) -> List[str]:
+        """Scroll the results feed and collect unique place HREFS in feed order"""
+        if self.config.use_feed_observer:
+            try:
+                if self.driver.execute_script(INSTALL_FEED_OBSERVER_SCRIPT):
+                    return self._collect_with_observer(max_results)
+            except Exception as e:
+                print(f"  Feed observer unavailable, polling instead: {e}")
         
+        return self._collect_by_polling(max_results)
+    
+    def _collect_with_observer(self, max_results: int) -> List[str]:
+        """Scroll as fast as the feed loads, reading hrefs from the injected observer"""
         try:
-            results_panel = None
-            for selector in ['div[role="feed"]', 'div.m6QErb']:
-                try:
-                    results_panel = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    print(f"  Found panel: {selector}")
+            scroll_attempts = 0
+            no_change_count = 0
+            seen_hrefs: Dict[str, None] = {}  # Ordered set - preserves feed order
+            recorded = 0  # Hrefs already read from the observer buffer
+            
+            while len(seen_hrefs) < max_results and scroll_attempts < self.config.max_scroll_attempts:
+                snapshot = self.driver.execute_script(DRAIN_FEED_OBSERVER_SCRIPT, recorded, True)
+                if snapshot is None:
+                    print(f"  Feed observer lost")
                     break
-                except:
-                    continue
+                
+                recorded = snapshot['total']
+                self.feed_page_times.extend(snapshot['page_times'])
+                self._capture_search_responses()
+                for href in snapshot['hrefs']:
+                    seen_hrefs.setdefault(href, None)
+                
+                if self.area_filter.drifted(snapshot['hrefs']):
+                    break
+                
+                if snapshot['end_of_list']:
+                    print(f"  Reached end of results list ({len(seen_hrefs)} hrefs)")
+                    break
+                
+                if len(seen_hrefs) >= max_results:
+                    break
+                
+                # Wait for the observer to record the next page
+                arrived = self.waiter.until(
+                    'feed_page_arrived',
+                    lambda d: (d.execute_script(FEED_OBSERVER_COUNT_SCRIPT) or 0) > recorded,
+                    self.config.feed_page_timeout
+                )
+                
+                if arrived:
+                    no_change_count = 0
+                else:
+                    no_change_count += 1
+                    if no_change_count >= 3:
+                        print(f"  No new unique results after {no_change_count} scrolls")
+                        break
+                
+                scroll_attempts += 1
+                print(f"  Scroll {scroll_attempts}: {recorded} unique hrefs")
             
-            if not results_panel:
-                return []
+            final_hrefs = list(seen_hrefs)[:max_results]
+            print(f"  Collected {len(final_hrefs)} unique hrefs")
+            return final_hrefs
             
+        except Exception as e:
+            print(f"Scroll error: {e}")
+            return []
+    
+    def _collect_by_polling(self, max_results: int) -> List[str]:
+        """Scroll the feed at a fixed cadence and poll it for hrefs"""
+        try:
             scroll_attempts = 0
             no_change_count = 0
-            seen_hrefs = []  # Use LIST to preserve order, not set
+            seen_hrefs: Dict[str, None] = {}  # Ordered set - preserves feed order
             
             while len(seen_hrefs) < max_results and scroll_attempts < self.config.max_scroll_attempts:
-                # Get current elements
-                current_elements = []
-                for selector in ['a.hfpxzc', 'div.Nv2PK']:
-                    try:
-                        current_elements = results_panel.find_elements(By.CSS_SELECTOR, selector)
-                        if len(current_elements) > 0:
-                            break
-                    except:
-                        continue
+                # Harvest every href, check the end marker and scroll - one round trip
+                snapshot = self.driver.execute_script(FEED_LINKS_SCRIPT, True)
+                if snapshot is None:
+                    print(f"  Results feed not found")
+                    break
                 
-                # Check each element for uniqueness
-                new_count = 0
-                for idx, elem in enumerate(current_elements):
-                    try:
-                        href = elem.get_attribute('href')
-                        if href and href not in seen_hrefs:
-                            seen_hrefs.append(href)  # Preserve order
-                            new_count += 1
-                    except:
-                        continue
+                self._capture_search_responses()
+                new_hrefs = []
+                for href in snapshot['hrefs']:
+                    if href not in seen_hrefs:
+                        seen_hrefs[href] = None
+                        new_hrefs.append(href)
+                new_count = len(new_hrefs)
+                
+                if self.area_filter.drifted(new_hrefs):
+                    break
+                
+                if snapshot['end_of_list']:
+                    print(f"  Reached end of results list ({len(seen_hrefs)} hrefs)")
+                    break
+                
+                if len(seen_hrefs) >= max_results:
+                    break
                 
                 # Check if we got new unique elements
                 if new_count == 0:
@@ -180,18 +687,13 @@ class MapsSearchEngine:
                     print(f"  No new unique results after {no_change_count} scrolls")
                     break
                 
-                # Scroll down
-                self.driver.execute_script(
-                    "arguments[0].scrollTop = arguments[0].scrollHeight",
-                    results_panel
-                )
-                
-                time.sleep(self.config.scroll_pause_time)
+                # Continue as soon as the feed appends cards (capped at scroll_pause_time)
+                self.waiter.feed_grew(snapshot['count'], self.config.scroll_pause_time)
                 scroll_attempts += 1
                 print(f"  Scroll {scroll_attempts}: {len(seen_hrefs)} unique hrefs")
             
             # Return list of hrefs (NOT elements!)
-            final_hrefs = seen_hrefs[:max_results]
+            final_hrefs = list(seen_hrefs)[:max_results]
             print(f"  Collected {len(final_hrefs)} unique hrefs")
             return final_hrefs
             
@@ -199,35 +701,35 @@ class MapsSearchEngine:
             print(f"Scroll error: {e}")
             return []
     
-    def _extract_place_details_by_href(self, href: str, task: SearchTask, idx: int, total: int) -> Optional[Place]:
-        """Extract place details by finding fresh element with this href and clicking it"""
+    def _extract_place_details_by_href(self, href: str, task: SearchTask, idx: int, total: int,
+                                       mode: Optional[str] = None) -> Optional[Place]:
+        """Extract place details using the given (or configured) navigation mode"""
+        start = time.time()
+        mode = mode or self.config.detail_navigation
+        
+        if self.detail_backend and not self.detail_backend.needs_browser:
+            mode = self.detail_backend.name
+            place = self.detail_backend.fetch_place(href, task, idx, total)
+        elif mode == 'direct':
+            place = self._extract_place_details_direct(href, task, idx, total)
+        elif mode == 'tab':
+            place = self._extract_place_details_in_tab(href, task, idx, total)
+        else:
+            place = self._extract_place_details_by_click(href, task, idx, total)
+        
+        self.detail_stats['attempts'] += 1
+        self.detail_stats['seconds'] += time.time() - start
+        if place:
+            self.detail_stats['succeeded'] += 1
+            self._signal('ok')
+        return place
+    
+    def _extract_place_details_by_click(self, href: str, task: SearchTask, idx: int, total: int) -> Optional[Place]:
+        """Extract place details by finding the feed card with this href and clicking it"""
         try:
-            # Find results panel
-            results_panel = None
-            for selector in ['div[role="feed"]', 'div.m6QErb']:
-                try:
-                    results_panel = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    break
-                except:
-                    continue
-            
-            if not results_panel:
-                print(f"  [{idx+1}/{total}] ❌ Can't find results panel")
-                return None
-            
-            # Find FRESH element with this href
-            element = None
+            # Find FRESH element with this href in a single lookup
             try:
-                # Try to find by exact href
-                elements = results_panel.find_elements(By.CSS_SELECTOR, 'a.hfpxzc')
-                for elem in elements:
-                    try:
-                        elem_href = elem.get_attribute('href')
-                        if elem_href == href:
-                            element = elem
-                            break
-                    except:
-                        continue
+                element = self.driver.execute_script(FIND_PLACE_LINK_SCRIPT, href)
             except Exception as e:
                 print(f"  [{idx+1}/{total}] ❌ Error finding element: {e}")
                 return None
@@ -236,207 +738,119 @@ class MapsSearchEngine:
                 print(f"  [{idx+1}/{total}] ❌ Element not found for href")
                 return None
             
-            # Scroll into view
+            # Scroll into view and click
             try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                time.sleep(0.5)
-            except:
-                pass
-            
-            # Click
-            try:
-                self.driver.execute_script("arguments[0].click();", element)
+                self.driver.execute_script(
+                    "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();",
+                    element
+                )
             except Exception as e:
                 print(f"  [{idx+1}/{total}] ❌ Click failed: {e}")
                 return None
             
-            # Wait for details panel
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, 'div.m6QErb[aria-label]'))
-                )
-            except TimeoutException:
-                pass
-            
-            # Wait for content to render
-            time.sleep(4)
-            
-            # Extract name first to see what we actually got
-            name = self._extract_text('h1.DUwDvf, h1.fontHeadlineLarge, h1')
-            
-            if not name or name in ['Hasil', 'Results', '']:
-                print(f"  [{idx+1}/{total}] ❌ Could not extract name")
-                return None
-            
-            # Extract category
-            category = self._extract_text('button.DkEaL, div.LBgpqf button, button[jsaction*="category"]')
-            
-            # Extract address
-            address = self._extract_text('button[data-item-id="address"], div.rogA2c, button[aria-label*="Address"]')
-            
-            # Try aria-label if address not found
-            if not address:
-                try:
-                    addr_elems = self.driver.find_elements(By.CSS_SELECTOR, 'button[data-item-id*="address"]')
-                    for elem in addr_elems:
-                        aria = elem.get_attribute('aria-label')
-                        if aria and ':' in aria:
-                            address = aria.split(':', 1)[1].strip()
-                            break
-                except:
-                    pass
-            
-            subdistrict, district, city, province, zip_code = parse_address(address) if address else (None, None, None, None, None)
-            
-            # Get coordinates and link from current URL (where we actually are)
-            link = self.driver.current_url
-            latitude, longitude = extract_coordinates_from_link(link)
-            
-            # Extract rating - try multiple methods
-            rating = None
-            rating_text = None
-            
-            # Method 1: Get from parent container (gets full "4.5" text)
-            try:
-                rating_container = self.driver.find_element(By.CSS_SELECTOR, 'div.F7nice')
-                full_text = rating_container.text
-                # Extract rating from text like "4.5" or "4.5 (123 reviews)"
-                match = re.search(r'(\d+[.,]\d+)', full_text)
-                if match:
-                    rating_text = match.group(1).replace(',', '.')
-            except:
-                pass
-            
-            # Method 2: Standard selectors (fallback)
-            if not rating_text:
-                rating_text = self._extract_text('div.F7nice span[aria-hidden="true"], span.ceNzKf[aria-hidden="true"]')
-            
-            rating = parse_rating(rating_text)
-            
-            # Extract reviews count
-            reviews_count = None
-            reviews_text = None
-            
-            try:
-                rating_section = self.driver.find_element(By.CSS_SELECTOR, 'div.F7nice')
-                full_text = rating_section.text
-                match = re.search(r'\(([0-9.,\s]+)\)', full_text)
-                if match:
-                    reviews_text = match.group(1)
-            except:
-                pass
-            
-            reviews_count = parse_reviews_count(reviews_text)
-            
-            # Extract phone
-            phone = self._extract_text('button[data-item-id*="phone"]')
-            if not phone:
-                try:
-                    phone_elem = self.driver.find_element(By.CSS_SELECTOR, 'button[data-item-id*="phone"]')
-                    aria = phone_elem.get_attribute('aria-label')
-                    if aria and ':' in aria:
-                        phone = aria.split(':', 1)[1].strip()
-                except:
-                    pass
-            
-            # Extract website
-            website = self._extract_attribute('a[data-item-id="authority"]', 'href')
-            
-            # Extract opening hours
-            opening_hours = self._extract_opening_hours()
-            
-            # Extract stars
-            stars = self._extract_star_distribution()
-            
-            # Create Place
-            place = Place(
-                name=clean_text(name),
-                category=clean_text(category),
-                address=clean_text(address),
-                subdistrict=clean_text(subdistrict),
-                district=clean_text(district),
-                city=clean_text(city),
-                province=clean_text(province),
-                zip_code=clean_text(zip_code),
-                latitude=latitude,
-                longitude=longitude,
-                rating=rating,
-                reviews_count=reviews_count,
-                phone=clean_text(phone),
-                website=clean_text(website),
-                google_maps_link=link,
-                opening_hours=clean_text(opening_hours),
-                star_1=stars.get(1),
-                star_2=stars.get(2),
-                star_3=stars.get(3),
-                star_4=stars.get(4),
-                star_5=stars.get(5),
-                search_keyword=task.keyword,
-                search_location=task.location
-            )
-            
-            return place
+            return self._read_open_place(task, idx, total, self.last_place_url)
             
         except Exception as e:
             print(f"  [{idx+1}/{total}] ❌ Extract error: {e}")
             return None
     
-    def _extract_text(self, selector: str) -> Optional[str]:
-        """Extract text trying multiple selectors"""
-        selectors = [s.strip() for s in selector.split(',')]
-        
-        for sel in selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, sel)
-                text = element.text
-                if text and text.strip():
-                    return text.strip()
-            except:
-                continue
-        
-        return None
-    
-    def _extract_attribute(self, selector: str, attribute: str) -> Optional[str]:
-        """Extract attribute from element"""
+    def _extract_place_details_direct(self, href: str, task: SearchTask, idx: int, total: int) -> Optional[Place]:
+        """Extract place details by navigating straight to the place URL"""
         try:
-            element = self.driver.find_element(By.CSS_SELECTOR, selector)
-            return element.get_attribute(attribute)
-        except:
+            self.driver.get(href)
+            # Fresh page load - no previous name to compare against
+            return self._read_open_place(task, idx, total, None)
+        except Exception as e:
+            print(f"  [{idx+1}/{total}] ❌ Extract error: {e}")
             return None
     
-    def _extract_opening_hours(self) -> Optional[str]:
-        """Extract opening hours"""
+    def _extract_place_details_in_tab(self, href: str, task: SearchTask, idx: int, total: int) -> Optional[Place]:
+        """Extract place details in a new tab, leaving the results feed untouched"""
+        results_window = self.driver.current_window_handle
         try:
-            hours = self.driver.find_element(By.CSS_SELECTOR, 'button[data-item-id*="oh"]')
-            return hours.text
-        except:
+            self.driver.switch_to.new_window('tab')
+            self.driver.get(href)
+            return self._read_open_place(task, idx, total, None)
+        except Exception as e:
+            print(f"  [{idx+1}/{total}] ❌ Extract error: {e}")
             return None
+        finally:
+            try:
+                if self.driver.current_window_handle != results_window:
+                    self.driver.close()
+                self.driver.switch_to.window(results_window)
+            except Exception:
+                pass
     
-    def _extract_star_distribution(self) -> dict:
-        """Extract star distribution"""
-        stars = {1: None, 2: None, 3: None, 4: None, 5: None}
+    def _read_open_place(self, task: SearchTask, idx: int, total: int, previous_url: Optional[str]) -> Optional[Place]:
+        """Wait for the open place panel to be ready and extract it"""
+        # Embedded payload only describes the place on a fresh page load
+        if self.config.extraction_backend == 'payload' and previous_url is None:
+            place = self._extract_from_payload(task)
+            if place:
+                self.search_stats['payload_hits'] += 1
+                self.last_place_url = place.google_maps_link
+                return place
+            self.search_stats['payload_fallbacks'] += 1
+        
+        # Wait for the panel to switch to this place, then for its details
+        name = self.waiter.place_opened(previous_url, self.config.element_wait_timeout)
+        if name:
+            self.waiter.address_rendered(self.config.detail_settle_timeout)
+        elif self._classify_page() == 'blocked':
+            self.block_detected = True
+            self._signal('blocked')
+            print(f"  [{idx+1}/{total}] ⛔ Block page detected")
+            return None
+        else:
+            self._signal('timeout')
         
+        # Collect every field in one script call
+        fields = self._collect_place_fields()
+        if not fields:
+            print(f"  [{idx+1}/{total}] ❌ Could not read place panel")
+            return None
+        
+        name = fields.get('name')
+        link = fields.get('url') or self.driver.current_url
+        self.last_place_url = link
+        
+        if not name or name in PLACEHOLDER_TITLES:
+            print(f"  [{idx+1}/{total}] ❌ Could not extract name")
+            return None
+        
+        return build_place_from_details(fields, link, task)
+    
+    def _extract_from_payload(self, task: SearchTask) -> Optional[Place]:
+        """Build a Place from the page's embedded JSON payload instead of the DOM"""
         try:
-            bars = self.driver.find_elements(By.CSS_SELECTOR, 'tr.BHOKXe')
-            
-            for idx, bar in enumerate(bars[:5]):
-                try:
-                    import re
-                    match = re.search(r'(\d+)', bar.text)
-                    if match:
-                        stars[5 - idx] = int(match.group(1))
-                except:
-                    continue
-                    
-        except:
-            pass
-        
-        return stars
-    
-    def _is_valid_place(self, place: Place) -> bool:
-        """Check if place is valid"""
-        return (
-            place.name is not None and 
-            place.google_maps_link is not None and
-            len(place.name) > 0
-        )
\ No newline at end of file
+            blobs = self.driver.execute_script(APP_STATE_BLOBS_SCRIPT) or []
+            link = self.driver.current_url
+        except Exception as e:
+            print(f"  Payload script failed: {e}")
+            return None
+        
+        darray = find_place_darray(blobs)
+        if darray is None:
+            return None
+        
+        fields = place_fields_from_darray(darray)
+        
+        # Make sure the payload is for the place in the URL, not a stale one
+        url_id = canonical_place_id(link)
+        if fields.get('feature_id') and url_id and url_id.startswith('0x'):
+            if fields['feature_id'].lower() != url_id:
+                return None
+        
+        place = build_place_from_payload(fields, link, task)
+        if place.latitude is None:
+            place.latitude, place.longitude = extract_coordinates_from_link(link)
+        return place if is_valid_place(place) else None
+    
+    def _collect_place_fields(self) -> Optional[dict]:
+        """Read all place panel fields with a single injected script"""
+        try:
+            return self.driver.execute_script(PLACE_DETAILS_SCRIPT)
+        except Exception as e:
+            print(f"  Details script failed: {e}")
+            return None
@@ -0,0 +1,184 @@
+"""
+Event-driven readiness waits with per-wait-point timing stats
+"""
+import time
+import threading
+from typing import Callable, Dict, List, Optional
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from utils.extractors import canonical_place_id
+
+# Titles Maps shows in the h1 while the results list (not a place) is open
+PLACEHOLDER_TITLES = ['Hasil', 'Results', '']
+
+
+class WaitStats:
+    """Thread-safe wall-time accounting for named wait points"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._points: Dict[str, Dict[str, float]] = {}
+    
+    def record(self, point: str, elapsed: float, timed_out: bool):
+        """Record one wait at the given wait point"""
+        with self._lock:
+            stats = self._points.setdefault(point, {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+            stats['count'] += 1
+            stats['total'] += elapsed
+            stats['max'] = max(stats['max'], elapsed)
+            if timed_out:
+                stats['timeouts'] += 1
+    
+    def merge(self, other: 'WaitStats'):
+        """Add another WaitStats into this one"""
+        self.merge_snapshot(other.snapshot())
+    
+    def merge_snapshot(self, snapshot: Dict[str, Dict[str, float]]):
+        """Add a snapshot (e.g. sent back by a worker process) into this one"""
+        for point, stats in snapshot.items():
+            with self._lock:
+                mine = self._points.setdefault(point, {'count': 0, 'total': 0.0, 'max': 0.0, 'timeouts': 0})
+                mine['count'] += stats['count']
+                mine['total'] += stats['total']
+                mine['max'] = max(mine['max'], stats['max'])
+                mine['timeouts'] += stats['timeouts']
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Copy of the current stats"""
+        with self._lock:
+            return {point: dict(stats) for point, stats in self._points.items()}
+    
+    def reset(self):
+        """Clear all recorded waits"""
+        with self._lock:
+            self._points.clear()
+    
+    def total_seconds(self) -> float:
+        """Total wall time spent waiting across all points"""
+        with self._lock:
+            return sum(stats['total'] for stats in self._points.values())
+    
+    def summary_lines(self) -> List[str]:
+        """Human readable summary, most expensive wait point first"""
+        lines = []
+        snapshot = self.snapshot()
+        for point, stats in sorted(snapshot.items(), key=lambda item: -item[1]['total']):
+            avg = stats['total'] / stats['count'] if stats['count'] else 0.0
+            lines.append(
+                f"{point}: {stats['count']}x, {stats['total']:.1f}s total, "
+                f"{avg:.2f}s avg, {stats['max']:.2f}s max, {stats['timeouts']} timeouts"
+            )
+        return lines
+
+
+class PageWaiter:
+    """Waits on concrete DOM conditions instead of fixed sleeps"""
+    
+    def __init__(self, driver, stats: WaitStats, poll_frequency: float = 0.1):
+        self.driver = driver
+        self.stats = stats
+        self.poll_frequency = poll_frequency
+    
+    def until(self, point: str, condition: Callable, timeout: float):
+        """
+        Wait until condition(driver) returns a truthy value
+        
+        Args:
+            point: Name of the wait point (used for stats)
+            condition: Callable taking the driver
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            The condition's value, or None on timeout
+        """
+        start = time.time()
+        try:
+            result = WebDriverWait(
+                self.driver,
+                timeout,
+                poll_frequency=self.poll_frequency,
+                ignored_exceptions=(WebDriverException,)
+            ).until(condition)
+            self.stats.record(point, time.time() - start, timed_out=False)
+            return result
+        except TimeoutException:
+            self.stats.record(point, time.time() - start, timed_out=True)
+            return None
+    
+    def element_present(self, point: str, selector: str, timeout: float) -> bool:
+        """Wait for an element matching a CSS selector"""
+        return bool(self.until(
+            point,
+            lambda d: d.execute_script("return !!document.querySelector(arguments[0]);", selector),
+            timeout
+        ))
+    
+    def input_value_equals(self, point: str, selector: str, value: str, timeout: float) -> bool:
+        """Wait until an input holds the given value"""
+        return bool(self.until(
+            point,
+            lambda d: d.execute_script(
+                "var el = document.querySelector(arguments[0]); return !!el && el.value === arguments[1];",
+                selector, value
+            ),
+            timeout
+        ))
+    
+    def place_opened(self, previous_url: Optional[str], timeout: float) -> Optional[str]:
+        """
+        Wait until the panel shows a place other than the one at previous_url
+        
+        The URL has to move to a different place ID and the h1 has to show a
+        real name. Names are not compared: neighbouring results often share
+        one (two "Indomaret" cards in a row).
+        
+        Args:
+            previous_url: URL of the place open before (None on a fresh page load)
+            timeout: Maximum seconds to wait
+        
+        Returns:
+            The place name, or None on timeout
+        """
+        previous_id = canonical_place_id(previous_url)
+        
+        def _condition(driver):
+            url = driver.current_url
+            if '/maps/place/' not in url or (previous_id and canonical_place_id(url) == previous_id):
+                return False
+            name = driver.execute_script(
+                "var h = document.querySelector('h1.DUwDvf, h1.fontHeadlineLarge, h1');"
+                "return h ? h.innerText.trim() : '';"
+            )
+            if name and name not in PLACEHOLDER_TITLES:
+                return name
+            return False
+        
+        return self.until('place_opened', _condition, timeout)
+    
+    def address_rendered(self, timeout: float) -> bool:
+        """Wait until the address row of the place panel is rendered"""
+        return self.element_present(
+            'place_address_rendered',
+            'button[data-item-id="address"], div.rogA2c',
+            timeout
+        )
+    
+    def feed_count(self) -> int:
+        """Number of place links currently in the results feed"""
+        try:
+            return int(self.driver.execute_script(
+                "var f = document.querySelector('div[role=\"feed\"]');"
+                "return f ? f.querySelectorAll('a.hfpxzc').length : 0;"
+            ) or 0)
+        except WebDriverException:
+            return 0
+    
+    def feed_grew(self, previous_count: int, timeout: float) -> bool:
+        """Wait until the results feed holds more place links than before"""
+        return bool(self.until(
+            'feed_grew',
+            lambda d: self.feed_count() > previous_count,
+            timeout
+        ))
@@ -0,0 +1,304 @@
+"""
+SQLite-backed work queue so independent processes can share one task list
+"""
+import json
+import os
+import socket
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from threading import Event, Thread
+from typing import Dict, List, Optional, Tuple
+
+from config.settings import ScraperConfig
+from models.place import SearchTask, Place
+from core.circuit_breaker import CircuitBreaker
+from core.detail_backends import HttpDetailBackend
+from core.driver_pool import DriverPool
+from core.http_fetcher import HttpPlaceFetcher
+from core.run_journal import task_from_dict
+from core.search_engine import MapsSearchEngine, PageBlockedError
+
+
+# Task states
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_key TEXT NOT NULL UNIQUE,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, lease_expires);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER NOT NULL REFERENCES tasks (id),
+    place TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_task ON results (task_id);
+"""
+
+
+class SqliteWorkQueue:
+    """
+    Task queue in a SQLite database in WAL mode
+    
+    Workers claim a task under a lease, extend it with heartbeats while they
+    work and write the places back when done. A task whose lease expires (its
+    worker crashed or hung) becomes claimable again; a task that fails
+    max_attempts times is marked failed.
+    
+    Every process and thread opens its own connection. SQLite's WAL mode
+    only works for processes on one host, so all workers must run on the
+    machine that holds the database file.
+    """
+    
+    def __init__(self, path: str, lease_seconds: float = 300.0, max_attempts: int = 3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+    
+    @contextmanager
+    def _connect(self):
+        """Open an autocommit connection for one operation"""
+        conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+        try:
+            conn.execute("PRAGMA busy_timeout = 30000")
+            yield conn
+        finally:
+            conn.close()
+    
+    def enqueue(self, tasks: List[SearchTask]) -> int:
+        """
+        Add tasks to the queue (tasks already queued are ignored)
+        
+        Args:
+            tasks: SearchTask objects to add
+        
+        Returns:
+            Number of tasks added
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (task_key, payload, updated_at) VALUES (?, ?, ?)",
+                [(task.key(), json.dumps(asdict(task)), now) for task in tasks]
+            )
+            added = conn.total_changes - before
+            conn.execute("COMMIT")
+        return added
+    
+    def claim(self, worker_id: str) -> Optional[Tuple[int, SearchTask]]:
+        """
+        Lease the next pending (or expired) task
+        
+        Args:
+            worker_id: Identifier of the claiming worker
+        
+        Returns:
+            (task_id, SearchTask), or None if nothing is claimable
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            # Expired leases with no attempts left will never be claimed again
+            conn.execute(
+                "UPDATE tasks SET status = ?, error = 'lease expired', updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, now, LEASED, now, self.max_attempts)
+            )
+            row = conn.execute(
+                "SELECT id, payload FROM tasks "
+                "WHERE (status = ? OR (status = ? AND lease_expires < ?)) AND attempts < ? "
+                "ORDER BY id LIMIT 1",
+                (PENDING, LEASED, now, self.max_attempts)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            
+            task_id, payload = row
+            conn.execute(
+                "UPDATE tasks SET status = ?, worker = ?, attempts = attempts + 1, "
+                "lease_expires = ?, updated_at = ? WHERE id = ?",
+                (LEASED, worker_id, now + self.lease_seconds, now, task_id)
+            )
+            conn.execute("COMMIT")
+        return task_id, task_from_dict(json.loads(payload))
+    
+    def heartbeat(self, task_id: int, worker_id: str) -> bool:
+        """
+        Extend a lease the worker still holds
+        
+        Returns:
+            False if the lease was lost (expired and claimed by another worker)
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE id = ? AND worker = ? AND status = ?",
+                (now + self.lease_seconds, now, task_id, worker_id, LEASED)
+            )
+            return cursor.rowcount == 1
+    
+    def complete(self, task_id: int, worker_id: str, places: List[Place]) -> bool:
+        """
+        Store a task's places and mark it done
+        
+        Returns:
+            False if the lease was lost, in which case nothing is stored
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.execute(
+                "UPDATE tasks SET status = ?, lease_expires = NULL, error = NULL, updated_at = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (DONE, now, task_id, worker_id, LEASED)
+            )
+            if cursor.rowcount != 1:
+                conn.execute("ROLLBACK")
+                return False
+            
+            conn.executemany(
+                "INSERT INTO results (task_id, place) VALUES (?, ?)",
+                [(task_id, json.dumps(place.to_dict(), ensure_ascii=False)) for place in places]
+            )
+            conn.execute("COMMIT")
+        return True
+    
+    def fail(self, task_id: int, worker_id: str, error: str):
+        """Give a task back for retry, or mark it failed once attempts run out"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts < ? THEN ? ELSE ? END, "
+                "lease_expires = NULL, error = ?, updated_at = ? "
+                "WHERE id = ? AND worker = ? AND status = ?",
+                (self.max_attempts, PENDING, FAILED, error[:500], now, task_id, worker_id, LEASED)
+            )
+    
+    def counts(self) -> Dict[str, int]:
+        """Number of tasks in each state"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update(dict(rows))
+        return counts
+    
+    def places(self) -> List[Place]:
+        """Every place written back by workers"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT place FROM results ORDER BY id").fetchall()
+        return [Place(**json.loads(row[0])) for row in rows]
+
+
+class QueueWorker:
+    """
+    Claim tasks from a SqliteWorkQueue and run them with one browser
+    
+    Runs the same MapsSearchEngine.search() as the orchestrator, with the
+    HTTP detail backend when detail_backend == "http". Blocked tasks go back
+    to the queue and pause the worker behind its circuit breaker. The rate
+    limiter is per process, so give each worker its share of the budget
+    (see split_rate_budget).
+    """
+    
+    def __init__(self, config: ScraperConfig, queue: SqliteWorkQueue, worker_id: Optional[str] = None):
+        self.config = config
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.breaker = CircuitBreaker(config.block_breaker_threshold, config.block_breaker_cooldown)
+        self.tasks_done = 0
+        self.tasks_failed = 0
+        self.http_backend: Optional[HttpDetailBackend] = None  # Set while run() is active
+    
+    def run(self, exit_when_idle: bool = True, poll_interval: float = 5.0):
+        """
+        Process tasks until the queue is empty (or forever)
+        
+        Args:
+            exit_when_idle: Stop once no task is claimable
+            poll_interval: Seconds between claims while the queue is idle
+        """
+        pool = DriverPool(self.config, size=1)
+        self.http_backend = (
+            HttpDetailBackend(HttpPlaceFetcher(self.config)) if self.config.detail_backend == 'http' else None
+        )
+        print(f"Worker {self.worker_id} started on {self.queue.path}")
+        
+        try:
+            while True:
+                self.breaker.wait_until_closed()
+                claimed = self.queue.claim(self.worker_id)
+                if claimed is None:
+                    if exit_when_idle:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+                
+                task_id, task = claimed
+                self._run_task(pool, task_id, task)
+        finally:
+            pool.close()
+            if self.http_backend:
+                self.http_backend.close()
+                self.http_backend = None
+        
+        print(f"Worker {self.worker_id} finished: {self.tasks_done} done, {self.tasks_failed} failed")
+    
+    def _run_task(self, pool: DriverPool, task_id: int, task: SearchTask):
+        """Run one claimed task while a heartbeat thread keeps its lease alive"""
+        stop = Event()
+        heartbeat = Thread(target=self._heartbeat, args=(task_id, stop), daemon=True)
+        heartbeat.start()
+        
+        try:
+            with pool.lease() as driver_manager:
+                search_engine = MapsSearchEngine(driver_manager, self.config, detail_backend=self.http_backend)
+                places = search_engine.search(task)
+            
+            if self.queue.complete(task_id, self.worker_id, places):
+                self.tasks_done += 1
+                self.breaker.record_success()
+                print(f"✓ {task}: {len(places)} places")
+            else:
+                print(f"⚠️  Lease lost on {task} - results discarded")
+        
+        except PageBlockedError as e:
+            self.tasks_failed += 1
+            self.breaker.record_block()
+            self.queue.fail(task_id, self.worker_id, f"blocked: {e}")
+            print(f"⛔ Blocked on {task} - returned to queue")
+        
+        except Exception as e:
+            self.tasks_failed += 1
+            self.queue.fail(task_id, self.worker_id, str(e))
+            print(f"✗ {task}: {e}")
+        
+        finally:
+            stop.set()
+            heartbeat.join()
+    
+    def _heartbeat(self, task_id: int, stop: Event):
+        """Extend the task's lease every queue_heartbeat_interval seconds"""
+        while not stop.wait(self.config.queue_heartbeat_interval):
+            if not self.queue.heartbeat(task_id, self.worker_id):
+                print(f"  ⚠️  Lease on task {task_id} was lost")
+                return
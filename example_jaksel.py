@@ -32,8 +32,8 @@ def main():
         scroll_pause_time=2.0,   
         max_scroll_attempts=10,  
         max_retries=3,           
-        min_delay=1.0,           
-        max_delay=2.5,           
+        rate_limit_initial=2.0,  # Page loads per second across all 4 workers
+        rate_limit_max=4.0,      
         csv_delimiter="|"        
     )
     
@@ -2,10 +2,35 @@
 Data models for Google Maps places
 """
 from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from datetime import datetime
 
 
+# Column order for CSV/Excel output
+PLACE_COLUMNS = [
+    'name', 'category', 'address', 'subdistrict', 'district', 'city', 'province', 'zip_code',
+    'latitude', 'longitude', 'rating', 'reviews_count',
+    'phone', 'website', 'google_maps_link', 'place_id', 'opening_hours',
+    'star_1', 'star_2', 'star_3', 'star_4', 'star_5',
+    'search_keyword', 'search_location', 'sources', 'missing_fields', 'scraped_at'
+]
+
+# Place fields that carry scraped data (as opposed to provenance/metadata)
+PLACE_DATA_FIELDS = [
+    'category', 'address', 'subdistrict', 'district', 'city', 'province', 'zip_code',
+    'latitude', 'longitude', 'rating', 'reviews_count',
+    'phone', 'website', 'opening_hours',
+    'star_1', 'star_2', 'star_3', 'star_4', 'star_5'
+]
+
+# Fields a feed card does not show - left empty in card-only mode
+CARD_MISSING_FIELDS = [
+    'address', 'subdistrict', 'district', 'city', 'province', 'zip_code',
+    'phone', 'website', 'opening_hours',
+    'star_1', 'star_2', 'star_3', 'star_4', 'star_5'
+]
+
+
 @dataclass
 class Place:
     """Represents a place/merchant from Google Maps"""
@@ -24,6 +49,7 @@ class Place:
     phone: Optional[str] = None
     website: Optional[str] = None
     google_maps_link: Optional[str] = None
+    place_id: Optional[str] = None  # Canonical ID (see canonical_place_id)
     opening_hours: Optional[str] = None
     star_1: Optional[int] = None
     star_2: Optional[int] = None
@@ -32,6 +58,8 @@ class Place:
     star_5: Optional[int] = None
     search_keyword: Optional[str] = None
     search_location: Optional[str] = None
+    sources: Optional[str] = None  # Every "keyword @ location" that surfaced this place
+    missing_fields: Optional[str] = None  # Comma-separated fields that were not captured
     scraped_at: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> Dict:
@@ -53,10 +81,32 @@ class SearchTask:
     subdistrict: str = ""  # Optional subdistrict/kelurahan
     district: str = ""     # Optional district/kecamatan  
     city: str = ""         # Optional city
+    center_lat: Optional[float] = None  # Optional viewport centre for URL searches
+    center_lng: Optional[float] = None
+    zoom: Optional[float] = None        # Optional viewport zoom level
+    bounds: Optional[Tuple[float, float, float, float]] = None  # Optional (south, west, north, east) area
+    tile_id: str = ""      # Set for geographic tiles, e.g. "2-3" or "2-3.1" once split
     
     def __str__(self):
         return f"{self.keyword} in {self.location}"
     
+    @property
+    def is_tile(self) -> bool:
+        """Whether this task searches a viewport tile rather than a named location"""
+        return bool(self.tile_id)
+    
+    @property
+    def tile_depth(self) -> int:
+        """How many times this tile has been split from its grid cell"""
+        return self.tile_id.count('.')
+    
+    def key(self) -> str:
+        """Stable identifier for this task across runs (used by the run journal)"""
+        return f"{self.keyword}|{self.location}"
+    
     def get_query(self) -> str:
         """Get the search query string"""
+        if self.is_tile:
+            # A place name in the query would override the tile's viewport
+            return self.keyword
         return f"{self.keyword} {self.location}"
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Scrape from a shared SQLite work queue with independent worker processes
+
+Fill the queue once, then start as many workers as the machine can take -
+each is a separate process with its own browser, so they scale past one
+process's GIL. The queue works on one host only: every worker must run on
+the machine whose local disk holds the database file.
+
+Usage:
+    python queue_worker.py enqueue queue.db keywords.csv locations.csv
+    python queue_worker.py work queue.db --workers 4   # in each of 4 terminals
+    python queue_worker.py status queue.db
+    python queue_worker.py export queue.db results/queue_results.csv
+"""
+import argparse
+
+import pandas as pd
+
+from config.settings import ScraperConfig
+from core.rate_limiter import split_rate_budget
+from core.work_queue import SqliteWorkQueue, QueueWorker
+from models.place import PLACE_COLUMNS
+from utils.task_generator import TaskGenerator
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="SQLite work queue for the Google Maps scraper")
+    sub = parser.add_subparsers(dest="command", required=True)
+    
+    enqueue = sub.add_parser("enqueue", help="Add keyword x location tasks to the queue")
+    enqueue.add_argument("db")
+    enqueue.add_argument("keywords_csv", help="CSV with a 'keyword' column")
+    enqueue.add_argument("locations_csv", help="CSV with location columns (see TaskGenerator)")
+    enqueue.add_argument("--max-results", type=int, default=1000)
+    
+    work = sub.add_parser("work", help="Claim and run tasks until the queue is empty")
+    work.add_argument("db")
+    work.add_argument("--worker-id", default=None)
+    work.add_argument("--wait", action="store_true", help="Keep polling when the queue is empty")
+    work.add_argument("--workers", type=int, default=1,
+                      help="Number of workers running on this queue; each gets this share of the rate limit")
+    
+    status = sub.add_parser("status", help="Show task counts by state")
+    status.add_argument("db")
+    
+    export = sub.add_parser("export", help="Write every result to a CSV")
+    export.add_argument("db")
+    export.add_argument("output_csv")
+    
+    args = parser.parse_args()
+    config = ScraperConfig()
+    queue = SqliteWorkQueue(args.db, config.queue_lease_seconds, config.queue_max_attempts)
+    
+    if args.command == "enqueue":
+        tasks = TaskGenerator.generate_from_dataframe(
+            pd.read_csv(args.keywords_csv), pd.read_csv(args.locations_csv), args.max_results
+        )
+        added = queue.enqueue(tasks)
+        print(f"Queued {added} new tasks ({len(tasks) - added} already queued)")
+    
+    elif args.command == "work":
+        config = split_rate_budget(config, args.workers)
+        QueueWorker(config, queue, args.worker_id).run(exit_when_idle=not args.wait)
+    
+    elif args.command == "status":
+        for state, count in queue.counts().items():
+            print(f"{state:>8}: {count}")
+    
+    elif args.command == "export":
+        df = pd.DataFrame([place.to_dict() for place in queue.places()], columns=PLACE_COLUMNS)
+        df.to_csv(args.output_csv, index=False, sep='|')
+        print(f"Exported {len(df)} places to {args.output_csv}")
+
+
+if __name__ == "__main__":
+    main()
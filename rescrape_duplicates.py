@@ -125,8 +125,8 @@ def rescrape_from_csv(csv_files: list, max_results_per_task: int = 50):
         max_workers=1,
         scroll_pause_time=2.0,
         max_scroll_attempts=20,
-        min_delay=1.0,
-        max_delay=3.0,
+        rate_limit_initial=0.5,  # One page load every ~2s, like the old 1-3s delay
+        rate_limit_max=1.0,
     )
     
     print(f"\n🚀 Starting re-scraper...")
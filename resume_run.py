@@ -0,0 +1,53 @@
+"""
+Resume a crashed or interrupted scraping run from its journal
+
+Completed tasks are skipped and their places restored from the journal.
+Tasks that were in flight are run again, skipping places already extracted.
+The run's pipeline, detail level, backends and search settings are read
+from the journal, so the resume finishes the run the way it was started.
+
+Usage:
+    python resume_run.py                                  # latest journal in checkpoints/
+    python resume_run.py checkpoints/run_20250101_120000.jsonl
+"""
+import sys
+
+from config.settings import ScraperConfig
+from core.orchestrator import ScraperOrchestrator
+from core.run_journal import RunJournal, load_journal
+
+
+def main():
+    """Main execution function"""
+    print("=" * 70)
+    print("RESUME SCRAPING RUN")
+    print("=" * 70)
+    
+    base_config = ScraperConfig()
+    journal_path = sys.argv[1] if len(sys.argv) > 1 else RunJournal.latest(base_config.checkpoint_dir)
+    if not journal_path:
+        print(f"❌ No run journal found in {base_config.checkpoint_dir}")
+        sys.exit(1)
+    
+    try:
+        # Finish the run with the settings it was started with
+        state = load_journal(journal_path)
+        config = state.config_for_resume(base_config)
+        for name, value in sorted(state.settings.items()):
+            print(f"  {name}: {value}")
+        
+        orchestrator = ScraperOrchestrator(config)
+        df = orchestrator.resume(journal_path)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    if not df.empty:
+        print(f"\n✅ Collected {len(df)} places (restored + new)")
+        orchestrator.save_results(df, prefix="resumed")
+    else:
+        print("\n⚠️  No results collected")
+
+
+if __name__ == "__main__":
+    main()
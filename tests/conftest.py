@@ -0,0 +1,32 @@
+"""
+Shared pytest setup for the scraper's test suite
+"""
+import os
+import sys
+
+import pytest
+
+from maps_stand_in import MapsStandIn
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT, 'tests', 'fixtures')
+
+# The scraper runs from the repo root, not as an installed package
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def read_fixture():
+    """Return a function that reads a file under tests/fixtures"""
+    def read(*parts: str) -> str:
+        with open(os.path.join(FIXTURES_DIR, *parts), encoding='utf-8') as f:
+            return f.read()
+    return read
+
+
+@pytest.fixture
+def maps_stand_in():
+    """Local HTTP stand-in for Maps, see tests/maps_stand_in.py"""
+    with MapsStandIn() as server:
+        yield server
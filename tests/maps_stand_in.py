@@ -0,0 +1,86 @@
+"""
+Local HTTP stand-in for Google Maps that serves saved pages and block responses
+
+Routes:
+    /maps/place/<name>     tests/fixtures/payloads/<name>.html
+    /status/<code>         Empty response with that status (403, 429, 500, ...)
+    /captcha               302 redirect to /sorry/index, like Google's block page
+    /sorry/index           The "unusual traffic" page
+"""
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+PAYLOADS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'payloads')
+
+SORRY_PAGE = (
+    b"<html><head><title>https://www.google.com/maps</title></head><body>"
+    b"<div>Our systems have detected unusual traffic from your computer network.</div>"
+    b"<form action=\"index\" method=\"post\"><div class=\"g-recaptcha\"></div></form></body></html>"
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serve one stand-in route"""
+    
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        path = urlparse(self.path).path
+        
+        if path.startswith('/maps/place/'):
+            name = path[len('/maps/place/'):].split('/')[0]
+            page = os.path.join(PAYLOADS_DIR, f"{name}.html")
+            if os.path.isfile(page):
+                with open(page, 'rb') as f:
+                    self._send(200, f.read())
+            else:
+                self._send(404, b"Not Found")
+        elif path.startswith('/status/'):
+            self._send(int(path.rsplit('/', 1)[1]), b"")
+        elif path == '/captcha':
+            self.send_response(302)
+            self.send_header('Location', f"/sorry/index?continue={self.path}")
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        elif path == '/sorry/index':
+            self._send(200, SORRY_PAGE)
+        else:
+            self._send(404, b"Not Found")
+    
+    def _send(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class MapsStandIn:
+    """Runs the stand-in server on a free local port in a background thread"""
+    
+    def __init__(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        self.server.requests = []
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True)
+    
+    @property
+    def requests(self):
+        """Paths requested so far"""
+        return self.server.requests
+    
+    def url(self, path: str) -> str:
+        """Absolute URL of a stand-in path"""
+        return f"{self.base_url}{path}"
+    
+    def __enter__(self):
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,189 @@
+"""
+Tests for the CDP engine's config checks, search flow and block rotation
+"""
+import asyncio
+import re
+import threading
+import time
+
+import pytest
+
+from config.settings import ScraperConfig
+from core import cdp_engine
+from core.cdp_engine import AsyncMapsSearchEngine, CdpExecutor
+from core.circuit_breaker import PageBlockedError, WorkerBreakers
+from core.page_scripts import CLASSIFY_PAGE_SCRIPT, FEED_LINKS_SCRIPT, PLACE_DETAILS_SCRIPT
+from core.rate_limiter import AdaptiveRateLimiter
+from core.search_engine import MapsSearchEngine
+from models.place import SearchTask
+
+TASK = SearchTask(keyword="kopi", location="Kemang")
+HREFS = [
+    f"https://www.google.com/maps/place/Kopi+{n}/data=!4m2!3m1!1s0x2e69f1e6a4c8a8f{n}:0x7b3c2d1e0f9a8b7{n}"
+    for n in range(3)
+]
+
+
+def cdp_config(**overrides):
+    settings = dict(
+        engine='cdp',
+        adaptive_rate_limit=False,
+        min_delay=0.0,
+        max_delay=0.0,
+        element_wait_timeout=0.2,
+        detail_settle_timeout=0.0
+    )
+    settings.update(overrides)
+    return ScraperConfig(**settings)
+
+
+class FakeTab:
+    """Answers the page_scripts like a three-result feed, serving block pages after blocked_after place loads"""
+    
+    def __init__(self, landing='feed', blocked_after=None):
+        self.landing = landing
+        self.blocked_after = blocked_after
+        self.url = "about:blank"
+        self.places_loaded = 0
+    
+    @property
+    def blocked(self):
+        return self.blocked_after is not None and self.places_loaded > self.blocked_after
+    
+    async def navigate(self, url):
+        self.url = url
+        if '/maps/place/' in url:
+            self.places_loaded += 1
+    
+    async def current_url(self):
+        return self.url
+    
+    async def run_script(self, script, *args):
+        if script == CLASSIFY_PAGE_SCRIPT:
+            if self.blocked:
+                return 'blocked'
+            return self.landing if '/maps/search/' in self.url else 'place'
+        if script == FEED_LINKS_SCRIPT:
+            return {'hrefs': HREFS, 'end_of_list': True, 'count': len(HREFS)}
+        if script == PLACE_DETAILS_SCRIPT and not self.blocked:
+            return {'name': self.url.split('/')[5].replace('+', ' '), 'url': self.url, 'address': "Jl. Kemang Raya No.8"}
+        return None
+
+
+def run_search(tab, **config_overrides):
+    engine = AsyncMapsSearchEngine(tab, cdp_config(**config_overrides))
+    return engine, asyncio.run(engine.search(TASK))
+
+
+def test_cdp_engine_works_with_default_options():
+    assert ScraperConfig(engine='cdp').engine == 'cdp'
+
+
+@pytest.mark.parametrize('overrides, conflict', [
+    ({'detail_level': 'cards'}, "detail_level='cards'"),
+    ({'extraction_backend': 'payload'}, "extraction_backend='payload'"),
+    ({'search_mode': 'typed'}, "search_mode='typed'"),
+    ({'detail_backend': 'http'}, "detail_backend='http'"),
+    ({'proxies': ["http://10.0.0.1:8080"]}, "proxies=['http://10.0.0.1:8080']"),
+    ({'pipeline': 'two_phase'}, "pipeline='two_phase'"),
+    ({'execution_mode': 'process'}, "execution_mode='process'"),
+])
+def test_cdp_config_rejects_unsupported_options(overrides, conflict):
+    with pytest.raises(ValueError, match=re.escape(conflict)):
+        cdp_config(**overrides)
+
+
+def test_selenium_config_is_not_restricted():
+    assert ScraperConfig(detail_level='cards', proxies=["http://10.0.0.1:8080"]).engine == 'selenium'
+
+
+def test_async_engine_is_standalone():
+    assert not issubclass(AsyncMapsSearchEngine, MapsSearchEngine)
+
+
+def test_async_search_reads_every_place():
+    engine, places = run_search(FakeTab())
+    
+    assert [place.name for place in places] == ["Kopi 0", "Kopi 1", "Kopi 2"]
+    assert places[0].place_id == "0x2e69f1e6a4c8a8f0:0x7b3c2d1e0f9a8b70"
+    assert engine.feed_size == 3
+    assert engine.detail_stats['succeeded'] == 3
+
+
+def test_async_search_raises_on_block_page():
+    tab = FakeTab(blocked_after=1)
+    with pytest.raises(PageBlockedError):
+        run_search(tab)
+    assert tab.places_loaded == 2
+
+
+def test_async_search_raises_when_search_lands_on_block_page():
+    with pytest.raises(PageBlockedError):
+        run_search(FakeTab(landing='blocked'))
+
+
+def test_rate_limited_tabs_wait_on_the_loop():
+    limiter = AdaptiveRateLimiter(initial_rate=50.0, min_rate=1.0, max_rate=50.0, increase=0.0,
+                                  backoff=0.5, block_cooldown=1.0)
+    threads_before = threading.active_count()
+    
+    async def ten_tabs():
+        waits = asyncio.gather(*(limiter.acquire_async() for _ in range(10)))
+        await asyncio.sleep(0.05)
+        threads_waiting = threading.active_count()
+        await waits
+        return threads_waiting
+    
+    start = time.monotonic()
+    assert asyncio.run(ten_tabs()) == threads_before
+    assert time.monotonic() - start >= 9 / 50.0 - 0.02
+
+
+def test_block_retires_browser_and_opens_breaker(monkeypatch):
+    browsers = []
+    
+    class FakeBrowser:
+        """The first browser launched serves block pages; its replacements do not"""
+        
+        def __init__(self, config):
+            self.blocks = not browsers
+            self.open_tabs = 0
+            self.replacement = None
+            self.closed = False
+            browsers.append(self)
+        
+        async def start(self):
+            pass
+        
+        async def new_tab(self):
+            self.open_tabs += 1
+            return FakeTab(blocked_after=0 if self.blocks else None)
+        
+        async def close_tab(self, tab):
+            self.open_tabs -= 1
+        
+        async def close(self):
+            self.closed = True
+    
+    monkeypatch.setattr(cdp_engine, 'CdpBrowser', FakeBrowser)
+    breakers = WorkerBreakers(threshold=1, cooldown=0.05)
+    
+    with CdpExecutor(cdp_config(max_workers=2, cdp_tabs_per_browser=2), breakers) as executor:
+        with pytest.raises(PageBlockedError):
+            executor.submit(executor.run_task, TASK).result()
+        
+        # The blocked tab moved to a fresh browser; the other tab still holds the old one open
+        assert len(browsers) == 2
+        assert (browsers[0].replacement, browsers[0].open_tabs, browsers[0].closed) == (browsers[1], 1, False)
+        assert executor.blocked_attempts == 1
+        assert breakers.times_opened() == 1
+        
+        # The other tab moves over before its next task, closing the retired browser
+        batch = executor.submit(executor.run_task, TASK).result()
+        assert len(batch['rows']) == 3
+        assert browsers[0].closed and browsers[1].open_tabs == 2
+        
+        # The blocked tab runs again once its breaker's pause is over
+        assert len(executor.submit(executor.run_task, TASK).result()['rows']) == 3
+    
+    assert len(browsers) == 2 and all(browser.closed for browser in browsers)
@@ -0,0 +1,77 @@
+"""
+Tests that HTTP-backend blocks reach the re-queue and circuit-breaker logic
+"""
+from queue import Queue
+
+import pytest
+
+from config.settings import ScraperConfig
+from core.circuit_breaker import PageBlockedError
+from core.detail_backends import HttpDetailBackend
+from core.driver_manager import DriverManager
+from core.http_fetcher import HttpPlaceFetcher
+from core.orchestrator import ScraperOrchestrator
+from core.result_writer import IncrementalCsvWriter
+from core.run_journal import RunJournal
+from core.search_engine import MapsSearchEngine
+from models.place import SearchTask
+
+TASK = SearchTask(keyword="kopi", location="Jakarta Selatan")
+
+
+@pytest.fixture
+def config(tmp_path):
+    return ScraperConfig(
+        detail_backend='http',
+        adaptive_rate_limit=False,
+        min_delay=0.0,
+        max_delay=0.0,
+        block_breaker_threshold=1,
+        block_breaker_cooldown=0.05,
+        max_block_requeues=2,
+        output_dir=str(tmp_path / "output"),
+        checkpoint_dir=str(tmp_path / "checkpoints")
+    )
+
+
+@pytest.fixture
+def http_backend(config):
+    backend = HttpDetailBackend(HttpPlaceFetcher(config, pool_size=2))
+    yield backend
+    backend.close()
+
+
+def test_per_task_extraction_raises_on_http_block(config, http_backend, maps_stand_in):
+    engine = MapsSearchEngine(DriverManager(config), config, detail_backend=http_backend)
+    
+    with pytest.raises(PageBlockedError):
+        engine._extract_place_details_by_href(maps_stand_in.url("/status/403"), TASK, 0, 1)
+    
+    place = engine._extract_place_details_by_href(maps_stand_in.url("/maps/place/kopi_kemang"), TASK, 0, 1)
+    assert place.name == "Kopi Kemang"
+
+
+def test_two_phase_http_worker_requeues_blocked_places(config, http_backend, maps_stand_in, tmp_path):
+    orchestrator = ScraperOrchestrator(config)
+    orchestrator.http_backend = http_backend
+    orchestrator.incremental_writer = IncrementalCsvWriter(str(tmp_path / "incremental.csv"), background=False)
+    orchestrator.journal = RunJournal(str(tmp_path / "run.jsonl"))
+    
+    detail_queue = Queue()
+    for place_id, path in [("blocked", "/status/429"), ("0x2e69f1e6a4c8a8f1:0x7b3c2d1e0f9a8b7c", "/maps/place/kopi_kemang")]:
+        detail_queue.put((place_id, {'href': maps_stand_in.url(path), 'task': TASK, 'sources': ["kopi @ Jakarta Selatan"]}))
+    progress = {'done': 0, 'total': 2}
+    
+    try:
+        orchestrator._http_detail_worker(detail_queue, progress)
+    finally:
+        orchestrator.incremental_writer.close()
+        orchestrator.journal.close()
+    
+    # The blocked place is tried once and re-queued twice, then dropped
+    assert [path.split('?')[0] for path in maps_stand_in.requests].count("/status/429") == 3
+    assert orchestrator.search_stats['blocked_attempts'] == 3
+    assert orchestrator.search_stats['blocked_requeues'] == 2
+    assert orchestrator.breakers.times_opened() == 3
+    assert [place.name for place in orchestrator.results] == ["Kopi Kemang"]
+    assert progress['done'] == 2
@@ -0,0 +1,92 @@
+"""
+Tests for HttpPlaceFetcher against the local Maps stand-in
+"""
+import pytest
+
+from config.settings import ScraperConfig
+from core.circuit_breaker import PageBlockedError
+from core.detail_backends import HttpDetailBackend
+from core.http_fetcher import HttpPlaceFetcher
+from models.place import SearchTask
+
+TASK = SearchTask(keyword="kopi", location="Jakarta Selatan")
+
+
+class RecordingLimiter:
+    """Records the outcomes the fetcher reports to the rate limiter"""
+    
+    def __init__(self):
+        self.outcomes = []
+    
+    def record_success(self):
+        self.outcomes.append('ok')
+    
+    def record_failure(self, outcome):
+        self.outcomes.append(outcome)
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = HttpPlaceFetcher(ScraperConfig(http_timeout=5.0), pool_size=2)
+    fetcher.rate_limiter = RecordingLimiter()
+    yield fetcher
+    fetcher.close()
+
+
+def test_fetch_place_parses_saved_page(fetcher, maps_stand_in):
+    url = maps_stand_in.url("/maps/place/monumen_nasional")
+    place = fetcher.fetch_place(url, TASK)
+    
+    assert place.name == "Monumen Nasional"
+    assert place.place_id == "0x2e69f5d2e764b12d:0x3d2ad6e1e0e9bcc8"
+    assert (place.latitude, place.longitude) == (-6.1753924, 106.8271528)
+    assert (place.rating, place.reviews_count) == (4.7, 152340)
+    assert place.phone == "(021) 3822255"
+    assert place.zip_code == "10110"
+    assert place.google_maps_link == url
+    assert fetcher.rate_limiter.outcomes == ['ok']
+    # The language parameter is added to every request
+    assert maps_stand_in.requests == ["/maps/place/monumen_nasional?hl=id"]
+
+
+def test_fetch_place_reuses_connections(fetcher, maps_stand_in):
+    for name in ("monumen_nasional", "kopi_kemang", "warung_bu_sri"):
+        assert fetcher.fetch_place(maps_stand_in.url(f"/maps/place/{name}"), TASK).name
+    
+    pool = fetcher.http.connection_from_url(maps_stand_in.base_url)
+    assert pool.num_connections == 1
+
+
+def test_page_without_place_payload(fetcher, maps_stand_in):
+    assert fetcher.fetch_place(maps_stand_in.url("/maps/place/no_place"), TASK) is None
+    assert fetcher.rate_limiter.outcomes == ['ok']
+
+
+def test_not_found_is_not_a_block(fetcher, maps_stand_in):
+    assert fetcher.fetch_place(maps_stand_in.url("/maps/place/missing"), TASK) is None
+    assert fetcher.rate_limiter.outcomes == []
+
+
+@pytest.mark.parametrize('path', ["/status/403", "/status/429", "/captcha"])
+def test_block_responses_raise(fetcher, maps_stand_in, path):
+    with pytest.raises(PageBlockedError):
+        fetcher.fetch_place(maps_stand_in.url(path), TASK)
+    assert fetcher.rate_limiter.outcomes == ['blocked']
+
+
+def test_sorry_redirect_is_followed(fetcher, maps_stand_in):
+    with pytest.raises(PageBlockedError):
+        fetcher.fetch_html(maps_stand_in.url("/captcha"))
+    assert [path.split('?')[0] for path in maps_stand_in.requests] == ["/captcha", "/sorry/index"]
+
+
+def test_http_backend_returns_place(fetcher, maps_stand_in):
+    backend = HttpDetailBackend(fetcher)
+    place = backend.fetch_place(maps_stand_in.url("/maps/place/kopi_kemang"), TASK)
+    assert place.name == "Kopi Kemang"
+
+
+def test_http_backend_propagates_blocks(fetcher, maps_stand_in):
+    backend = HttpDetailBackend(fetcher)
+    with pytest.raises(PageBlockedError):
+        backend.fetch_place(maps_stand_in.url("/status/429"), TASK)
@@ -0,0 +1,110 @@
+"""
+Tests for utils.payload_parser against saved APP_INITIALIZATION_STATE pages
+"""
+import pytest
+
+from models.place import SearchTask
+from utils.payload_parser import (
+    extract_app_state_blobs,
+    find_place_darray,
+    place_fields_from_darray,
+    build_place_from_payload
+)
+
+EXPECTED_FIELDS = {
+    'monumen_nasional.html': {
+        'name': "Monumen Nasional",
+        'category': "Monumen",
+        'address': "Gambir, Kecamatan Gambir, Kota Jakarta Pusat, Daerah Khusus Ibukota Jakarta 10110",
+        'latitude': -6.1753924,
+        'longitude': 106.8271528,
+        'rating': 4.7,
+        'reviews_count': 152340,
+        'website': "http://monas.jakarta.go.id/",
+        'phone': "(021) 3822255",
+        'feature_id': "0x2e69f5d2e764b12d:0x3d2ad6e1e0e9bcc8",
+        'opening_hours': (
+            "Senin: Tutup; Selasa: 08.00–22.00; Rabu: 08.00–22.00; Kamis: 08.00–22.00; "
+            "Jumat: 08.00–22.00; Sabtu: 08.00–22.00; Minggu: 08.00–22.00"
+        ),
+        'stars': {1: 1200, 2: 800, 3: 3100, 4: 15240, 5: 132000},
+    },
+    'kopi_kemang.html': {
+        'name': "Kopi Kemang",
+        'category': "Kedai Kopi",
+        'address': (
+            "Jl. Kemang Raya No.8, RT.8/RW.2, Bangka, Kec. Mampang Prpt., "
+            "Kota Jakarta Selatan, Daerah Khusus Ibukota Jakarta 12730"
+        ),
+        'latitude': -6.2605713,
+        'longitude': 106.8150421,
+        'rating': 4.0,
+        'reviews_count': 2318,
+        'website': "https://www.instagram.com/kopikemang/",
+        'phone': None,
+        'feature_id': "0x2E69F1E6A4C8A8F1:0x7B3C2D1E0F9A8B7C",
+        # Ranges in [label, [[open], [close]]] form, a split day and a day with no ranges
+        'opening_hours': "Senin: 07.00–12.00, 13.00–22.00; Selasa: 07.00–22.00; Rabu: Buka 24 jam",
+        'stars': {1: 31, 2: 12, 3: 60, 4: 415, 5: 1800},
+    },
+    'warung_bu_sri.html': {
+        'name': "Warung Makan Bu Sri",
+        'category': None,
+        # No full address string: joined from the address lines
+        'address': (
+            "Jl. Tebet Barat Dalam Raya No.5, Tebet Bar., Kec. Tebet, "
+            "Kota Jakarta Selatan, Daerah Khusus Ibukota Jakarta 12810"
+        ),
+        'latitude': -6.2349,
+        'longitude': 106.8522,
+        'rating': None,
+        'reviews_count': None,
+        'website': None,
+        'phone': None,
+        'feature_id': "0x2e69f3a1b2c3d4e5:0x1122334455667788",
+        'opening_hours': None,
+        'stars': {},
+    },
+}
+
+
+def parse_fixture(read_fixture, name):
+    """Run a saved place page through the parser"""
+    darray = find_place_darray(extract_app_state_blobs(read_fixture('payloads', name)))
+    assert darray is not None
+    return place_fields_from_darray(darray)
+
+
+@pytest.mark.parametrize('name', sorted(EXPECTED_FIELDS))
+def test_place_fields_from_page(read_fixture, name):
+    assert parse_fixture(read_fixture, name) == EXPECTED_FIELDS[name]
+
+
+def test_opening_hours_contain_no_list_reprs(read_fixture):
+    for name in EXPECTED_FIELDS:
+        hours = parse_fixture(read_fixture, name)['opening_hours'] or ""
+        assert '[' not in hours and ']' not in hours
+
+
+def test_page_without_place_payload(read_fixture):
+    blobs = extract_app_state_blobs(read_fixture('payloads', 'no_place.html'))
+    assert blobs
+    assert find_place_darray(blobs) is None
+
+
+def test_page_without_app_state():
+    assert extract_app_state_blobs("<html><body>Our systems have detected unusual traffic</body></html>") == []
+
+
+def test_build_place_from_payload(read_fixture):
+    fields = parse_fixture(read_fixture, 'kopi_kemang.html')
+    link = "https://www.google.com/maps/place/Kopi+Kemang/data=!4m2!3m1!1s0x2e69f1e6a4c8a8f1:0x7b3c2d1e0f9a8b7c"
+    place = build_place_from_payload(fields, link, SearchTask(keyword="kopi", location="Kemang"))
+    
+    assert place.name == "Kopi Kemang"
+    assert place.place_id == "0x2e69f1e6a4c8a8f1:0x7b3c2d1e0f9a8b7c"
+    assert place.google_maps_link == link
+    assert place.city == "Jakarta Selatan"
+    assert place.zip_code == "12730"
+    assert (place.star_1, place.star_5) == (31, 1800)
+    assert (place.search_keyword, place.search_location) == ("kopi", "Kemang")
@@ -0,0 +1,132 @@
+"""
+Crash-and-resume tests for the run journal
+"""
+from contextlib import contextmanager
+
+import pytest
+
+from config.settings import ScraperConfig
+from core.driver_manager import DriverManager
+from core.http_fetcher import HttpPlaceFetcher
+from core.orchestrator import ScraperOrchestrator
+from core.run_journal import RunJournal, load_journal
+from core.search_engine import MapsSearchEngine
+from models.place import Place, SearchTask
+from utils.extractors import canonical_place_id
+
+TASKS = [SearchTask(keyword="kopi", location="Kemang"), SearchTask(keyword="kopi", location="Tebet")]
+
+# Four places per task, eight unique places in total
+HREFS = {
+    task.location: [
+        f"https://www.google.com/maps/place/{task.location}+{n}/data=!4m2!3m1!1s0x2e69f{i}{n:02d}:0x{i}{n:04d}"
+        for n in range(4)
+    ]
+    for i, task in enumerate(TASKS, start=1)
+}
+
+
+class Crash(BaseException):
+    """Kills the run the way a crash would: nothing in the scraper catches it"""
+
+
+class FakeMaps:
+    """Stands in for Chrome discovery and HTTP place pages, crashing after crash_after fetches"""
+    
+    def __init__(self, crash_after=None):
+        self.crash_after = crash_after
+        self.discovered = []
+        self.fetched = []
+    
+    def discover(self, engine, task):
+        self.discovered.append(task.location)
+        return list(HREFS[task.location])
+    
+    def fetch_place(self, fetcher, href, task):
+        if self.crash_after is not None and len(self.fetched) >= self.crash_after:
+            raise Crash()
+        self.fetched.append(href)
+        return Place(name=f"Place {href.split('/')[5]}", google_maps_link=href,
+                     place_id=canonical_place_id(href), search_keyword=task.keyword,
+                     search_location=task.location)
+
+
+@pytest.fixture
+def fake_maps(monkeypatch):
+    maps = FakeMaps()
+    
+    @contextmanager
+    def driver_session(orchestrator):
+        yield DriverManager(orchestrator.config)
+    
+    monkeypatch.setattr(ScraperOrchestrator, '_driver_session', driver_session)
+    monkeypatch.setattr(MapsSearchEngine, 'discover', lambda engine, task: maps.discover(engine, task))
+    monkeypatch.setattr(HttpPlaceFetcher, 'fetch_place', lambda fetcher, href, task: maps.fetch_place(fetcher, href, task))
+    return maps
+
+
+def make_config(tmp_path, **overrides):
+    settings = dict(
+        reuse_drivers=False,
+        use_profile_template=False,
+        adaptive_rate_limit=False,
+        min_delay=0.0,
+        max_delay=0.0,
+        max_workers=1,
+        http_workers=1,
+        output_dir=str(tmp_path / "results"),
+        checkpoint_dir=str(tmp_path / "checkpoints")
+    )
+    settings.update(overrides)
+    return ScraperConfig(**settings)
+
+
+def crash_two_phase_run(tmp_path, fake_maps):
+    """Run a two-phase scrape that crashes after three places and return its journal state"""
+    fake_maps.crash_after = 3
+    orchestrator = ScraperOrchestrator(make_config(tmp_path, pipeline='two_phase', detail_backend='http'))
+    with pytest.raises(Crash):
+        orchestrator.scrape_tasks(list(TASKS))
+    
+    fake_maps.crash_after = None
+    fake_maps.discovered.clear()
+    fake_maps.fetched.clear()
+    return load_journal(RunJournal.latest(orchestrator.config.checkpoint_dir))
+
+
+def test_two_phase_crash_and_resume(tmp_path, fake_maps):
+    state = crash_two_phase_run(tmp_path, fake_maps)
+    assert len(state.completed) == 2
+    assert len(state.places) == 3
+    assert state.settings['pipeline'] == 'two_phase'
+    assert state.settings['detail_backend'] == 'http'
+    
+    # Resume the way resume_run.py does: default config plus the journaled settings
+    config = state.config_for_resume(make_config(tmp_path))
+    assert (config.pipeline, config.detail_backend) == ('two_phase', 'http')
+    df = ScraperOrchestrator(config).resume(state.path)
+    
+    all_hrefs = HREFS["Kemang"] + HREFS["Tebet"]
+    assert fake_maps.discovered == []
+    assert len(fake_maps.fetched) == 5
+    assert sorted(df['google_maps_link']) == sorted(all_hrefs)
+
+
+def test_resume_refuses_different_settings(tmp_path, fake_maps):
+    state = crash_two_phase_run(tmp_path, fake_maps)
+    
+    with pytest.raises(ValueError, match="pipeline: 'two_phase' -> 'per_task'"):
+        ScraperOrchestrator(make_config(tmp_path)).resume(state.path)
+    
+    assert fake_maps.discovered == [] and fake_maps.fetched == []
+    assert len(load_journal(state.path).places) == 3
+
+
+def test_resume_refuses_journal_without_settings(tmp_path):
+    checkpoint_dir = tmp_path / "checkpoints"
+    checkpoint_dir.mkdir()
+    journal = checkpoint_dir / "run_20260101_000000.jsonl"
+    journal.write_text('{"event": "run_started", "at": "2026-01-01T00:00:00", "tasks": []}\n')
+    
+    with pytest.raises(ValueError, match="does not record its run settings"):
+        ScraperOrchestrator(make_config(tmp_path)).resume(str(journal))
@@ -0,0 +1,64 @@
+"""
+Tests for the out-of-area filter's choice of search area
+"""
+from config.settings import ScraperConfig
+from core.driver_manager import DriverManager
+from core.search_engine import MapsSearchEngine
+from models.place import SearchTask
+from utils.geo import bounds_from_viewport, expand_bounds
+
+HOME_URL = "https://www.google.com/maps/@-6.2087634,106.845599,12z?hl=id"
+RESULTS_URL = "https://www.google.com/maps/search/kopi+Kemang/@-6.2605713,106.8150421,15z/data=!3m1!4b1?hl=id"
+TILE_BOUNDS = (-6.27, 106.80, -6.25, 106.82)
+
+
+class NavigatingDriver:
+    """Reports the home page URL for a few reads before the results URL, like a typed search"""
+    
+    def __init__(self, urls):
+        self.urls = list(urls)
+    
+    @property
+    def current_url(self):
+        return self.urls.pop(0) if len(self.urls) > 1 else self.urls[0]
+
+
+def engine_for(urls, **config_overrides):
+    config_overrides.setdefault('element_wait_timeout', 2)
+    config = ScraperConfig(adaptive_rate_limit=False, **config_overrides)
+    manager = DriverManager(config)
+    manager.driver = NavigatingDriver(urls)
+    return MapsSearchEngine(manager, config)
+
+
+def test_no_filter_by_default_without_bounds():
+    engine = engine_for([RESULTS_URL])
+    engine._set_search_area(SearchTask(keyword="kopi", location="Kemang"), 'feed')
+    assert engine.area_filter.area is None
+    assert engine.area_filter.filter(["https://www.google.com/maps/place/x/data=!3d-7.0!4d110.0"]) != []
+
+
+def test_task_bounds_always_apply():
+    engine = engine_for([RESULTS_URL])
+    engine._set_search_area(SearchTask(keyword="kopi", location="Kemang", bounds=TILE_BOUNDS), 'feed')
+    assert engine.area_filter.area == expand_bounds(TILE_BOUNDS, engine.config.out_of_area_margin)
+
+
+def test_typed_search_waits_for_results_viewport():
+    engine = engine_for([HOME_URL, HOME_URL, HOME_URL, RESULTS_URL], skip_out_of_area=True)
+    engine._set_search_area(SearchTask(keyword="kopi", location="Kemang"), 'feed')
+    
+    expected = bounds_from_viewport(-6.2605713, 106.8150421, 15.0)
+    assert engine.area_filter.area == expand_bounds(expected, engine.config.out_of_area_margin)
+
+
+def test_no_area_when_results_viewport_never_appears():
+    engine = engine_for([HOME_URL], skip_out_of_area=True, element_wait_timeout=0.3)
+    engine._set_search_area(SearchTask(keyword="kopi", location="Kemang"), 'feed')
+    assert engine.area_filter.area is None
+
+
+def test_no_area_off_the_feed():
+    engine = engine_for([RESULTS_URL], skip_out_of_area=True)
+    engine._set_search_area(SearchTask(keyword="kopi", location="Kemang", bounds=TILE_BOUNDS), 'place')
+    assert engine.area_filter.area is None
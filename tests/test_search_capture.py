@@ -0,0 +1,119 @@
+"""
+Tests for search-response capture from the DevTools performance log
+"""
+import json
+
+from config.settings import ScraperConfig
+from core.driver_manager import DriverManager
+from core.search_engine import MapsSearchEngine
+from models.place import SearchTask
+from utils.payload_parser import parse_search_response
+
+MONAS_ID = "0x2e69f5d2e764b12d:0x3d2ad6e1e0e9bcc8"
+CAFE_ID = "0x2e69f1e6a4c8a8f1:0x7b3c2d1e0f9a8b7c"
+
+
+class RecordedDriver:
+    """Stands in for Chrome: replays a saved performance log and response bodies"""
+    
+    def __init__(self, log_entries, bodies):
+        self.log_entries = list(log_entries)
+        self.bodies = bodies
+        self.body_requests = []
+    
+    def get_log(self, log_type):
+        assert log_type == 'performance'
+        entries, self.log_entries = self.log_entries, []
+        return entries
+    
+    def execute_cdp_cmd(self, command, params):
+        assert command == 'Network.getResponseBody'
+        self.body_requests.append(params['requestId'])
+        if params['requestId'] not in self.bodies:
+            raise Exception("No resource with given identifier found")
+        return self.bodies[params['requestId']]
+
+
+def recorded_manager(read_fixture, **config_overrides):
+    """DriverManager wired to the saved capture fixtures"""
+    config = ScraperConfig(capture_search_responses=True, adaptive_rate_limit=False, **config_overrides)
+    manager = DriverManager(config)
+    manager.driver = RecordedDriver(
+        json.loads(read_fixture('capture', 'performance_log.json')),
+        json.loads(read_fixture('capture', 'response_bodies.json'))
+    )
+    return manager
+
+
+def test_collects_only_finished_search_responses(read_fixture):
+    manager = recorded_manager(read_fixture)
+    bodies = manager.collect_search_responses()
+    
+    # Failed, still-streaming and non-search requests are never read; the
+    # evicted body is skipped
+    assert manager.driver.body_requests == ["4102.17", "4102.25", "4102.33"]
+    assert len(bodies) == 2
+    assert bodies[0].endswith('/*""*/')
+    assert bodies[1].startswith(")]}'")
+    assert manager.collect_search_responses() == []
+
+
+def test_unfinished_search_response_is_read_once_it_finishes(read_fixture):
+    manager = recorded_manager(read_fixture)
+    manager.collect_search_responses()
+    manager.driver.log_entries = [{'message': json.dumps({'message': {
+        'method': 'Network.loadingFinished', 'params': {'requestId': "4102.37", 'encodedDataLength': 100}
+    }})}]
+    
+    manager.collect_search_responses()
+    assert manager.driver.body_requests[-1] == "4102.37"
+
+
+def test_network_stats_from_log(read_fixture):
+    manager = recorded_manager(read_fixture)
+    assert manager.collect_network_stats() == {
+        'requests': 7,
+        'blocked_requests': 1,
+        'bytes_received': 18544 + 312 + 17210 + 9120
+    }
+
+
+def test_parse_wrapped_search_response(read_fixture):
+    body = json.loads(read_fixture('capture', 'response_bodies.json'))["4102.17"]['body']
+    records = parse_search_response(body)
+    
+    # The result without a place array is dropped
+    assert [record['name'] for record in records] == ["Monumen Nasional", "Kopi Kemang"]
+    monas = records[0]
+    assert monas['feature_id'] == MONAS_ID
+    assert (monas['latitude'], monas['longitude']) == (-6.1753924, 106.8271528)
+    assert (monas['rating'], monas['reviews_count']) == (4.7, 152340)
+    assert monas['phone'] == "(021) 3822255"
+    assert monas['stars'][5] == 132000
+
+
+def test_parse_bare_search_response(read_fixture):
+    body = json.loads(read_fixture('capture', 'response_bodies.json'))["4102.33"]['body']
+    assert [record['name'] for record in parse_search_response(body)] == ["Kopi Kemang"]
+
+
+def test_parse_unusable_search_responses():
+    assert parse_search_response("") == []
+    assert parse_search_response(")]}'\n<html>") == []
+    assert parse_search_response('{"c":0,"d":")]}\'\\n[]"}/*""*/') == []
+
+
+def test_captured_records_replace_card_reads(read_fixture):
+    manager = recorded_manager(read_fixture, detail_level='cards')
+    engine = MapsSearchEngine(manager, manager.config)
+    hrefs = [
+        f"https://www.google.com/maps/place/Monumen+Nasional/data=!4m7!3m6!1s{MONAS_ID}!8m2!3d-6.17!4d106.82",
+        f"https://www.google.com/maps/place/Kopi+Kemang/data=!4m7!3m6!1s{CAFE_ID}!8m2!3d-6.26!4d106.81",
+    ]
+    
+    places = engine._places_from_cards(hrefs, SearchTask(keyword="kopi", location="Jakarta"))
+    
+    assert set(engine.captured_records) == {MONAS_ID, CAFE_ID}
+    assert [place.name for place in places] == ["Monumen Nasional", "Kopi Kemang"]
+    assert places[1].place_id == CAFE_ID
+    assert places[1].missing_fields == "phone"
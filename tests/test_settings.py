@@ -0,0 +1,15 @@
+"""
+Tests for ScraperConfig option validation
+"""
+import pytest
+
+from config.settings import ScraperConfig
+
+
+def test_process_mode_runs_per_task_pipeline():
+    assert ScraperConfig(execution_mode='process').pipeline == 'per_task'
+
+
+def test_process_mode_rejects_two_phase_pipeline():
+    with pytest.raises(ValueError, match="execution_mode='process' supports only pipeline='per_task'"):
+        ScraperConfig(execution_mode='process', pipeline='two_phase')
@@ -0,0 +1,47 @@
+"""
+Tests for the place-panel readiness wait
+"""
+import time
+
+from core.waits import PageWaiter, WaitStats
+
+FIRST = "https://www.google.com/maps/place/Indomaret/data=!4m2!3m1!1s0x2e69f1e6a4c8a8f1:0x7b3c2d1e0f9a8b71"
+SECOND = "https://www.google.com/maps/place/Indomaret/data=!4m2!3m1!1s0x2e69f1e6a4c8a8f2:0x7b3c2d1e0f9a8b72"
+
+
+class PanelDriver:
+    """Shows one place panel and moves to the next after a few URL reads, like a clicked card"""
+    
+    def __init__(self, urls, name):
+        self.urls = list(urls)
+        self.name = name
+    
+    @property
+    def current_url(self):
+        return self.urls.pop(0) if len(self.urls) > 1 else self.urls[0]
+    
+    def execute_script(self, script, *args):
+        return self.name
+
+
+def test_same_name_neighbour_opens_without_timeout():
+    stats = WaitStats()
+    waiter = PageWaiter(PanelDriver([FIRST, FIRST, SECOND], "Indomaret"), stats, poll_frequency=0.01)
+    
+    start = time.time()
+    assert waiter.place_opened(FIRST, timeout=2) == "Indomaret"
+    assert time.time() - start < 1
+    assert stats.snapshot()['place_opened']['timeouts'] == 0
+
+
+def test_panel_still_on_previous_place_times_out():
+    stats = WaitStats()
+    waiter = PageWaiter(PanelDriver([FIRST], "Indomaret"), stats, poll_frequency=0.01)
+    
+    assert waiter.place_opened(FIRST, timeout=0.2) is None
+    assert stats.snapshot()['place_opened']['timeouts'] == 1
+
+
+def test_fresh_load_waits_for_a_real_name():
+    waiter = PageWaiter(PanelDriver([SECOND], "Results"), WaitStats(), poll_frequency=0.01)
+    assert waiter.place_opened(None, timeout=0.2) is None
@@ -0,0 +1,87 @@
+"""
+Tests for the SQLite work queue's leases, retries and failed state
+"""
+import time
+
+from core.work_queue import SqliteWorkQueue, DONE, FAILED, LEASED, PENDING
+from models.place import Place, SearchTask
+
+TASK = SearchTask(keyword="kopi", location="Kemang")
+OTHER = SearchTask(keyword="kopi", location="Cipete")
+PLACE = Place(name="Kopi Kenangan", google_maps_link="https://www.google.com/maps/place/Kopi+Kenangan")
+
+
+def make_queue(tmp_path, **settings):
+    return SqliteWorkQueue(str(tmp_path / "queue.db"), **settings)
+
+
+def test_reenqueue_is_ignored(tmp_path):
+    queue = make_queue(tmp_path)
+    
+    assert queue.enqueue([TASK, OTHER]) == 2
+    assert queue.enqueue([TASK, OTHER]) == 0
+    assert queue.counts()[PENDING] == 2
+
+
+def test_expired_lease_is_claimed_again(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.05)
+    queue.enqueue([TASK])
+    
+    task_id, task = queue.claim("w1")
+    assert task == TASK
+    assert queue.claim("w2") is None
+    
+    time.sleep(0.1)
+    assert queue.claim("w2") == (task_id, TASK)
+    assert queue.counts()[LEASED] == 1
+
+
+def test_heartbeat_keeps_the_lease(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.2)
+    queue.enqueue([TASK])
+    task_id, _ = queue.claim("w1")
+    
+    time.sleep(0.12)
+    assert queue.heartbeat(task_id, "w1")
+    time.sleep(0.12)
+    assert queue.claim("w2") is None
+
+
+def test_complete_is_refused_once_the_lease_is_lost(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.05)
+    queue.enqueue([TASK])
+    task_id, _ = queue.claim("w1")
+    time.sleep(0.1)
+    queue.claim("w2")
+    
+    assert not queue.heartbeat(task_id, "w1")
+    assert not queue.complete(task_id, "w1", [PLACE])
+    assert queue.places() == []
+    
+    assert queue.complete(task_id, "w2", [PLACE])
+    assert queue.counts()[DONE] == 1
+    assert [place.name for place in queue.places()] == ["Kopi Kenangan"]
+
+
+def test_fail_retries_until_max_attempts(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2)
+    queue.enqueue([TASK])
+    
+    task_id, _ = queue.claim("w1")
+    queue.fail(task_id, "w1", "timeout")
+    assert queue.counts()[PENDING] == 1
+    
+    task_id, _ = queue.claim("w1")
+    queue.fail(task_id, "w1", "timeout")
+    assert queue.counts()[FAILED] == 1
+    assert queue.claim("w1") is None
+
+
+def test_expired_lease_on_last_attempt_is_failed(tmp_path):
+    queue = make_queue(tmp_path, lease_seconds=0.05, max_attempts=1)
+    queue.enqueue([TASK])
+    queue.claim("w1")
+    time.sleep(0.1)
+    
+    assert queue.claim("w2") is None
+    assert queue.counts()[FAILED] == 1
@@ -4,10 +4,12 @@ Utility modules for Google Maps Scraper
 This module contains helper functions:
 - extractors: Data extraction and parsing utilities
 - task_generator: Search task creation utilities
+- geo: Viewport and bounding-box helpers
 """
 
 from .extractors import (
     extract_coordinates_from_link,
+    canonical_place_id,
     parse_address,
     clean_text,
     parse_rating,
@@ -16,6 +18,8 @@ from .extractors import (
 
 from utils.task_generator import (
     TaskGenerator,
+    AREA_BOUNDS,
+    SUBDISTRICTS_BY_DISTRICT,
     JAKARTA_SELATAN_DISTRICTS,
     JAKARTA_PUSAT_DISTRICTS,
     JAKARTA_UTARA_DISTRICTS,
@@ -26,12 +30,15 @@ from utils.task_generator import (
 __all__ = [
     # Extractors
     'extract_coordinates_from_link',
+    'canonical_place_id',
     'parse_address',
     'clean_text',
     'parse_rating',
     'parse_reviews_count',
     # Task Generator
     'TaskGenerator',
+    'AREA_BOUNDS',
+    'SUBDISTRICTS_BY_DISTRICT',
     'JAKARTA_SELATAN_DISTRICTS',
     'JAKARTA_PUSAT_DISTRICTS',
     'JAKARTA_UTARA_DISTRICTS',
@@ -3,6 +3,7 @@ Utility functions for extracting data from Google Maps
 """
 import re
 from typing import Optional, Tuple
+from urllib.parse import unquote
 
 
 def extract_coordinates_from_link(link: str) -> Tuple[Optional[float], Optional[float]]:
@@ -41,6 +42,40 @@ def extract_coordinates_from_link(link: str) -> Tuple[Optional[float], Optional[
         return None, None
 
 
+def canonical_place_id(link: Optional[str]) -> Optional[str]:
+    """
+    Get a stable identifier for a place from any of its Google Maps links
+    
+    Card links and place page URLs differ in their viewport and tracking
+    parts, but both carry the place's feature ID (!1s0x...:0x...).
+    
+    Args:
+        link: Google Maps URL
+        
+    Returns:
+        Feature ID, Knowledge Graph ID, or the normalised place path
+    """
+    if not link:
+        return None
+    
+    # Feature ID: !1s0x2e69f3...:0x5b1c...
+    match = re.search(r'!1s(0x[0-9a-fA-F]+:0x[0-9a-fA-F]+)', link)
+    if match:
+        return match.group(1).lower()
+    
+    # Knowledge Graph ID: !16s%2Fg%2F11abc...
+    match = re.search(r'!16s(%2F[^!?&]+)', link)
+    if match:
+        return unquote(match.group(1))
+    
+    # Fall back to the place path without viewport or query string
+    match = re.search(r'/maps/place/([^/?@]+)', link)
+    if match:
+        return unquote(match.group(1)).replace('+', ' ').lower()
+    
+    return link.split('?')[0]
+
+
 def parse_address(address: str) -> Tuple[Optional[str], Optional[str], Optional[str], Optional[str], Optional[str]]:
     """
     Parse Indonesian address into components
@@ -0,0 +1,83 @@
+"""
+Geometry helpers for viewport-based searches and area checks
+"""
+import re
+import math
+from typing import Optional, Tuple
+
+
+# (south, west, north, east) bounding box in degrees
+Bounds = Tuple[float, float, float, float]
+
+METERS_PER_DEGREE = 111_320  # Metres per degree of latitude (and of longitude at the equator)
+VIEWPORT_PX = 1280           # Browser window width used by DriverManager
+
+
+def zoom_for_span(span_m: float, latitude: float, viewport_px: int = VIEWPORT_PX) -> float:
+    """
+    Maps zoom level at which a viewport shows roughly span_m metres across
+    
+    Args:
+        span_m: Width of the area to show in metres
+        latitude: Latitude of the viewport centre
+        viewport_px: Viewport width in pixels
+    
+    Returns:
+        Zoom level rounded to one decimal, clamped to 3-21
+    """
+    meters_per_px_z0 = 156543.03 * math.cos(math.radians(latitude))
+    zoom = math.log2(meters_per_px_z0 * viewport_px / max(span_m, 1.0))
+    return round(min(max(zoom, 3.0), 21.0), 1)
+
+
+def bounds_from_viewport(latitude: float, longitude: float, zoom: float,
+                         viewport_px: int = VIEWPORT_PX) -> Bounds:
+    """
+    Approximate square area shown by a viewport (inverse of zoom_for_span)
+    
+    Args:
+        latitude: Viewport centre latitude
+        longitude: Viewport centre longitude
+        zoom: Maps zoom level
+        viewport_px: Viewport width in pixels
+    
+    Returns:
+        (south, west, north, east) bounds
+    """
+    cos_lat = math.cos(math.radians(latitude))
+    span_m = 156543.03 * cos_lat * viewport_px / (2 ** zoom)
+    half_lat = span_m / 2 / METERS_PER_DEGREE
+    half_lng = half_lat / max(cos_lat, 0.01)
+    return (latitude - half_lat, longitude - half_lng, latitude + half_lat, longitude + half_lng)
+
+
+def viewport_from_url(url: str) -> Optional[Tuple[float, float, float]]:
+    """
+    Read the @lat,lng,zoomz viewport from a Maps URL
+    
+    Args:
+        url: Google Maps URL
+    
+    Returns:
+        (latitude, longitude, zoom) or None if the URL has no viewport
+    """
+    match = re.search(r'@(-?\d+\.\d+),(-?\d+\.\d+),(\d+(?:\.\d+)?)z', url or '')
+    if not match:
+        return None
+    return float(match.group(1)), float(match.group(2)), float(match.group(3))
+
+
+def expand_bounds(bounds: Bounds, margin: float) -> Bounds:
+    """Grow bounds on every side by margin times their height and width"""
+    south, west, north, east = bounds
+    pad_lat = (north - south) * margin
+    pad_lng = (east - west) * margin
+    return (south - pad_lat, west - pad_lng, north + pad_lat, east + pad_lng)
+
+
+def in_bounds(latitude: Optional[float], longitude: Optional[float], bounds: Bounds) -> bool:
+    """Whether a point lies inside bounds - unknown coordinates count as inside"""
+    if latitude is None or longitude is None:
+        return True
+    south, west, north, east = bounds
+    return south <= latitude <= north and west <= longitude <= east
@@ -0,0 +1,242 @@
+"""
+Parse the structured data Google Maps embeds in its pages
+
+Maps ships place data as nested JSON arrays rather than HTML: the place
+page's ``window.APP_INITIALIZATION_STATE`` and the ``/maps/preview/place``
+and ``/search?tbm=map`` XHR responses. All of them are JSON prefixed with
+the anti-XSSI guard ``)]}'``. Field positions inside the place array
+("darray") are undocumented but have been stable for years.
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from models.place import Place, SearchTask
+from utils.extractors import (
+    canonical_place_id,
+    parse_address,
+    clean_text
+)
+
+XSSI_PREFIX = ")]}'"
+
+# Positions of Place fields inside the place darray
+NAME = (11,)
+CATEGORIES = (13,)
+ADDRESS = (39,)
+ADDRESS_PARTS = (2,)
+LATITUDE = (9, 2)
+LONGITUDE = (9, 3)
+RATING = (4, 7)
+REVIEWS_COUNT = (4, 8)
+WEBSITE = (7, 0)
+PHONE = (178, 0, 0)
+FEATURE_ID = (10,)
+OPENING_HOURS = (34, 1)
+STAR_COUNTS = (175, 3)
+
+
+def dig(data: Any, *path: int) -> Any:
+    """Follow a path of list indexes, returning None if any step is missing"""
+    for index in path:
+        if not isinstance(data, list) or index >= len(data) or index < -len(data):
+            return None
+        data = data[index]
+    return data
+
+
+def loads_guarded(text: str) -> Any:
+    """json.loads that strips the )]}' anti-XSSI prefix first"""
+    text = text.lstrip()
+    if text.startswith(XSSI_PREFIX):
+        text = text[len(XSSI_PREFIX):]
+    return json.loads(text)
+
+
+def extract_app_state_blobs(html: str) -> List[str]:
+    """
+    Pull the guarded JSON blobs out of a raw Maps HTML page
+    
+    Args:
+        html: Page HTML as served (no JavaScript executed)
+        
+    Returns:
+        JSON strings from APP_INITIALIZATION_STATE[3]
+    """
+    match = re.search(r'window\.APP_INITIALIZATION_STATE=(.*?);window\.APP_FLAGS', html, re.DOTALL)
+    if not match:
+        return []
+    
+    try:
+        state = json.loads(match.group(1))
+    except ValueError:
+        return []
+    
+    section = dig(state, 3)
+    if not isinstance(section, list):
+        return []
+    return [value for value in section if isinstance(value, str) and value.startswith(XSSI_PREFIX)]
+
+
+def find_place_darray(blobs: List[str]) -> Optional[list]:
+    """
+    Find the place darray among guarded JSON blobs
+    
+    Args:
+        blobs: JSON strings from APP_INITIALIZATION_STATE[3] or XHR bodies
+        
+    Returns:
+        The place array, or None if none of the blobs describe a place
+    """
+    for blob in blobs:
+        try:
+            payload = loads_guarded(blob)
+        except (ValueError, TypeError):
+            continue
+        
+        darray = dig(payload, 6)
+        if isinstance(dig(darray, *NAME), str):
+            return darray
+    
+    return None
+
+
+def parse_search_response(body: str) -> List[Dict[str, Any]]:
+    """
+    Decode a /search?tbm=map response into partial place records
+    
+    The body is either guarded JSON directly or a JSON object whose "d"
+    member holds the guarded JSON, optionally followed by a /*""*/ marker.
+    
+    Args:
+        body: Raw response body
+        
+    Returns:
+        List of field dicts (see place_fields_from_darray), one per result
+    """
+    if not body:
+        return []
+    
+    text = body.strip()
+    if text.endswith('/*""*/'):
+        text = text[:-len('/*""*/')]
+    
+    try:
+        payload = loads_guarded(text)
+        if isinstance(payload, dict) and isinstance(payload.get('d'), str):
+            payload = loads_guarded(payload['d'])
+    except (ValueError, TypeError):
+        return []
+    
+    records = []
+    for result in dig(payload, 0, 1) or []:
+        darray = dig(result, 14)
+        if isinstance(dig(darray, *NAME), str):
+            records.append(place_fields_from_darray(darray))
+    
+    return records
+
+
+def _format_hours_range(hours_range: Any) -> Optional[str]:
+    """Text of one opening-hours range: "08.00–21.00" or ["08.00–21.00", [[8], [21]]]"""
+    if isinstance(hours_range, str):
+        return hours_range
+    label = dig(hours_range, 0)
+    return label if isinstance(label, str) else None
+
+
+def _format_opening_hours(hours: Any) -> Optional[str]:
+    """Format [[day, [ranges]], ...] as "Senin: 08.00–21.00; ..." """
+    if not isinstance(hours, list):
+        return None
+    
+    days = []
+    for day in hours:
+        name = dig(day, 0)
+        ranges = dig(day, 1)
+        if not isinstance(name, str) or not isinstance(ranges, list):
+            continue
+        labels = [label for label in map(_format_hours_range, ranges) if label]
+        if labels:
+            days.append(f"{name}: {', '.join(labels)}")
+    
+    return "; ".join(days) or None
+
+
+def place_fields_from_darray(darray: list) -> Dict[str, Any]:
+    """
+    Pull raw Place fields out of a place darray
+    
+    Returns:
+        Dict of field name -> value (None when the payload lacks it)
+    """
+    categories = dig(darray, *CATEGORIES)
+    address = dig(darray, *ADDRESS)
+    if not isinstance(address, str):
+        parts = dig(darray, *ADDRESS_PARTS)
+        address = ", ".join(p for p in parts if isinstance(p, str)) if isinstance(parts, list) else None
+    
+    stars = dig(darray, *STAR_COUNTS)
+    star_counts = {}
+    if isinstance(stars, list) and len(stars) >= 5:
+        for n in range(5):
+            if isinstance(stars[n], int):
+                star_counts[n + 1] = stars[n]
+    
+    def number(path, kind):
+        value = dig(darray, *path)
+        return kind(value) if isinstance(value, (int, float)) else None
+    
+    def text(path):
+        value = dig(darray, *path)
+        return value if isinstance(value, str) else None
+    
+    return {
+        'name': text(NAME),
+        'category': categories[0] if isinstance(categories, list) and categories else None,
+        'address': address,
+        'latitude': number(LATITUDE, float),
+        'longitude': number(LONGITUDE, float),
+        'rating': number(RATING, float),
+        'reviews_count': number(REVIEWS_COUNT, int),
+        'website': text(WEBSITE),
+        'phone': text(PHONE),
+        'feature_id': text(FEATURE_ID),
+        'opening_hours': _format_opening_hours(dig(darray, *OPENING_HOURS)),
+        'stars': star_counts,
+    }
+
+
+def build_place_from_payload(fields: Dict[str, Any], link: str, task: SearchTask) -> Place:
+    """Build a Place from fields returned by place_fields_from_darray"""
+    address = fields.get('address')
+    subdistrict, district, city, province, zip_code = parse_address(address) if address else (None, None, None, None, None)
+    stars = fields.get('stars') or {}
+    feature_id = fields.get('feature_id')
+    
+    return Place(
+        name=clean_text(fields.get('name')),
+        category=clean_text(fields.get('category')),
+        address=clean_text(address),
+        subdistrict=clean_text(subdistrict),
+        district=clean_text(district),
+        city=clean_text(city),
+        province=clean_text(province),
+        zip_code=clean_text(zip_code),
+        latitude=fields.get('latitude'),
+        longitude=fields.get('longitude'),
+        rating=fields.get('rating'),
+        reviews_count=fields.get('reviews_count'),
+        phone=clean_text(fields.get('phone')),
+        website=clean_text(fields.get('website')),
+        google_maps_link=link,
+        place_id=feature_id.lower() if feature_id else canonical_place_id(link),
+        opening_hours=clean_text(fields.get('opening_hours')),
+        star_1=stars.get(1),
+        star_2=stars.get(2),
+        star_3=stars.get(3),
+        star_4=stars.get(4),
+        star_5=stars.get(5),
+        search_keyword=task.keyword,
+        search_location=task.location
+    )
@@ -1,9 +1,35 @@
 """
 Utility for generating search tasks from keywords and locations
 """
+import math
 import pandas as pd
-from typing import List
+from typing import List, Optional
 from models.place import SearchTask
+from utils.geo import Bounds, METERS_PER_DEGREE, zoom_for_span
+
+
+def _tile_task(keyword: str, area: str, bounds: Bounds, tile_id: str,
+               max_results: int, template: Optional[SearchTask] = None) -> SearchTask:
+    """Build a viewport-centred task covering the given bounds"""
+    south, west, north, east = bounds
+    center_lat = (south + north) / 2
+    center_lng = (west + east) / 2
+    width_m = (east - west) * METERS_PER_DEGREE * math.cos(math.radians(center_lat))
+    height_m = (north - south) * METERS_PER_DEGREE
+    
+    return SearchTask(
+        keyword=keyword,
+        location=f"{area} tile {tile_id}",
+        max_results=max_results,
+        subdistrict=template.subdistrict if template else "",
+        district=template.district if template else "",
+        city=template.city if template else area,
+        center_lat=round(center_lat, 6),
+        center_lng=round(center_lng, 6),
+        zoom=zoom_for_span(max(width_m, height_m), center_lat),
+        bounds=bounds,
+        tile_id=tile_id
+    )
 
 
 class TaskGenerator:
@@ -171,7 +197,118 @@ class TaskGenerator:
                 tasks.append(task)
         
         return tasks
+    
+    @staticmethod
+    def generate_tile_tasks(
+        keywords: List[str],
+        area: str,
+        bounds: Optional[Bounds] = None,
+        tile_size_km: float = 2.0,
+        max_results_per_task: int = 1000
+    ) -> List[SearchTask]:
+        """
+        Generate viewport-centred tasks covering an area with a grid of tiles
+        
+        Each tile searches only the keyword, centred and zoomed on its own box,
+        so together the tiles get past the ~120 result cap of a single feed.
+        Tiles whose feed still saturates are split further with split_tile.
+        
+        Args:
+            keywords: List of keywords to search
+            area: Area name (e.g., "Jakarta Timur"), looked up in AREA_BOUNDS
+                if bounds is not given
+            bounds: Optional (south, west, north, east) box in degrees
+            tile_size_km: Target width and height of each tile in km
+            max_results_per_task: Maximum results per task
+            
+        Returns:
+            List of SearchTask objects
+        """
+        if bounds is None:
+            if area not in AREA_BOUNDS:
+                raise ValueError(f"No bounds known for '{area}' - pass bounds explicitly")
+            bounds = AREA_BOUNDS[area]
+        
+        south, west, north, east = bounds
+        center_lat = (south + north) / 2
+        tile_lat = tile_size_km * 1000 / METERS_PER_DEGREE
+        tile_lng = tile_lat / math.cos(math.radians(center_lat))
+        rows = max(1, math.ceil((north - south) / tile_lat))
+        cols = max(1, math.ceil((east - west) / tile_lng))
+        row_step = (north - south) / rows
+        col_step = (east - west) / cols
+        
+        tasks = []
+        
+        for keyword in keywords:
+            for row in range(rows):
+                for col in range(cols):
+                    tile_bounds = (
+                        south + row * row_step,
+                        west + col * col_step,
+                        south + (row + 1) * row_step,
+                        west + (col + 1) * col_step
+                    )
+                    tasks.append(_tile_task(keyword, area, tile_bounds, f"{row}-{col}", max_results_per_task))
+        
+        return tasks
+    
+    @staticmethod
+    def split_tile(task: SearchTask) -> List[SearchTask]:
+        """
+        Split a saturated tile task into its four quadrants
+        
+        Args:
+            task: Tile task whose feed hit the result cap
+            
+        Returns:
+            Four child tasks, one zoom level closer
+        """
+        south, west, north, east = task.bounds
+        mid_lat = (south + north) / 2
+        mid_lng = (west + east) / 2
+        area = task.location.rsplit(" tile ", 1)[0]
+        quadrants = [
+            (south, west, mid_lat, mid_lng),
+            (south, mid_lng, mid_lat, east),
+            (mid_lat, west, north, mid_lng),
+            (mid_lat, mid_lng, north, east),
+        ]
+        
+        return [
+            _tile_task(task.keyword, area, quadrant, f"{task.tile_id}.{idx}", task.max_results, template=task)
+            for idx, quadrant in enumerate(quadrants)
+        ]
+    
+    @staticmethod
+    def split_district(task: SearchTask) -> List[SearchTask]:
+        """
+        Expand a saturated district task into its subdistrict (kelurahan) tasks
+        
+        Args:
+            task: District-level task whose feed hit the result cap
+            
+        Returns:
+            Subdistrict tasks from SUBDISTRICTS_BY_DISTRICT, or an empty list
+            if the district has no known subdistricts
+        """
+        subdistricts = SUBDISTRICTS_BY_DISTRICT.get(task.district, [])
+        if not subdistricts:
+            return []
+        
+        return TaskGenerator.generate_subdistrict_tasks(
+            [task.keyword], task.city, task.district, subdistricts, task.max_results
+        )
+
 
+# Approximate bounding boxes (south, west, north, east) for tiling
+AREA_BOUNDS = {
+    "Jakarta Pusat": (-6.215, 106.790, -6.140, 106.880),
+    "Jakarta Utara": (-6.170, 106.680, -6.080, 106.980),
+    "Jakarta Barat": (-6.225, 106.680, -6.090, 106.820),
+    "Jakarta Selatan": (-6.370, 106.750, -6.200, 106.880),
+    "Jakarta Timur": (-6.370, 106.840, -6.160, 106.980),
+}
 
 # Predefined district lists
 JAKARTA_SELATAN_DISTRICTS = [
@@ -225,4 +362,25 @@ PANCORAN_SUBDISTRICTS = [
 TEBET_SUBDISTRICTS = [
     "Tebet Timur", "Tebet Barat", "Menteng Dalam",
     "Kebon Baru", "Bukit Duri", "Manggarai", "Manggarai Selatan"
-]
\ No newline at end of file
+]
+
+SETIABUDI_SUBDISTRICTS = [
+    "Setia Budi", "Karet", "Karet Semanggi", "Karet Kuningan",
+    "Kuningan Timur", "Menteng Atas", "Pasar Manggis", "Guntur"
+]
+
+MAMPANG_PRAPATAN_SUBDISTRICTS = [
+    "Kuningan Barat", "Pela Mampang", "Bangka",
+    "Tegal Parang", "Mampang Prapatan"
+]
+
+# District -> subdistricts, used to expand saturated district tasks at runtime
+SUBDISTRICTS_BY_DISTRICT = {
+    "Kebayoran Baru": KEBAYORAN_BARU_SUBDISTRICTS,
+    "Kebayoran Lama": KEBAYORAN_LAMA_SUBDISTRICTS,
+    "Cilandak": CILANDAK_SUBDISTRICTS,
+    "Pancoran": PANCORAN_SUBDISTRICTS,
+    "Tebet": TEBET_SUBDISTRICTS,
+    "Setiabudi": SETIABUDI_SUBDISTRICTS,
+    "Mampang Prapatan": MAMPANG_PRAPATAN_SUBDISTRICTS,
+}